@@ -0,0 +1,40 @@
+__all__ = ("main",)
+
+import typing as t
+
+from py_bootstrap.base.operations import (
+    BaseOperationsRunner,
+    BaseRecursiveOperationsContainer,
+)
+
+from .files_processors import FilesProcessorsBenchmarkOperation
+from .startup import StartupBenchmarkOperation
+
+if t.TYPE_CHECKING:
+    from py_bootstrap.base.operations import BaseCliOperation
+
+
+class BenchmarksContainer(BaseRecursiveOperationsContainer):
+    cli_description = "Runs py-bootstrap benchmarks."
+    operations_classes_map: t.ClassVar[dict[str, type["BaseCliOperation"]]] = {
+        "files-processors": FilesProcessorsBenchmarkOperation,
+        "startup": StartupBenchmarkOperation,
+    }
+
+
+class BenchmarksRunner(BaseOperationsRunner):
+    cli_prog = "python -m benchmarks"
+    operation_cls: t.ClassVar[type["BaseCliOperation"]] = BenchmarksContainer
+
+
+def main(cli_args: t.Optional[list[str]] = None):
+    entrypoint = BenchmarksRunner()
+
+    if cli_args is not None:
+        entrypoint.set_cli_args(cli_args)
+
+    entrypoint.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+__all__ = ("BaseBenchmarkOperation",)
+
+import json
+import logging
+import typing as t
+from argparse import ArgumentTypeError
+
+from py_bootstrap.base.operations import BaseCliOperation
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+class BaseBenchmarkOperation(BaseCliOperation):
+    @classmethod
+    def validate_cli_argument_positive_int(cls, value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            number = 0
+
+        if number < 1:
+            raise ArgumentTypeError("The value should be a positive integer.")
+        return number
+
+    def dump_json(self, data: dict[str, t.Any], path: "Path"):
+        path.write_text(json.dumps(data, indent=2) + "\n")
+        logger.info("%r. results are saved into %r.", self, path)
+
+    def load_json(self, path: "Path") -> dict[str, t.Any]:
+        return json.loads(path.read_text())
@@ -0,0 +1,371 @@
+__all__ = ("FilesProcessorsBenchmarkOperation",)
+
+import logging
+import os
+import platform
+import shutil
+import typing as t
+from argparse import Namespace
+from contextlib import contextmanager
+from dataclasses import asdict
+from functools import cached_property
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from py_bootstrap import VERSION
+from py_bootstrap.base.cache import CACHE_DIR_ENV_NAME
+from py_bootstrap.files_processors import (
+    CopyFilesProcessor,
+    GenerateFilesProcessor,
+)
+from py_bootstrap.operations import (
+    BaseBuildBootstrapOperation,
+    BaseExportBootstrapOperation,
+)
+from py_bootstrap.operations.register_bootstrap import (
+    RegisterBootstrapOperation,
+)
+
+from .base import BaseBenchmarkOperation
+from .measurements import BenchmarkMeasurer, BenchmarkResult
+from .synthetic import SyntheticBootstrapGenerator, SyntheticBootstrapSpec
+
+if t.TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+logger = logging.getLogger(__name__)
+
+
+class FilesProcessorsBenchmarkOperation(BaseBenchmarkOperation):
+    cli_description = (
+        "Measures files processors, export and register on a synthetic"
+        " bootstrap."
+    )
+    format_version: t.ClassVar[int] = 1
+    cases: t.ClassVar[tuple[str, ...]] = (
+        "copy",
+        "generate",
+        "export",
+        "register",
+    )
+
+    _source_path: "Path"
+    _runs_path: "Path"
+    _runs_count: int = 0
+
+    @classmethod
+    def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""):
+        defaults = SyntheticBootstrapSpec()
+        parser.add_argument(
+            "--files-count",
+            dest="files_count",
+            type=cls.validate_cli_argument_positive_int,
+            default=defaults.files_count,
+            help="Specifies a number of files in a synthetic bootstrap.",
+        )
+        parser.add_argument(
+            "--depth",
+            dest="depth",
+            type=int,
+            default=defaults.depth,
+            help="Specifies a number of nested directories levels.",
+        )
+        parser.add_argument(
+            "--fan-out",
+            dest="fan_out",
+            type=cls.validate_cli_argument_positive_int,
+            default=defaults.fan_out,
+            help="Specifies a number of directories on every level.",
+        )
+        parser.add_argument(
+            "--size-distribution",
+            dest="size_distribution",
+            choices=SyntheticBootstrapGenerator.size_distributions,
+            default=defaults.size_distribution,
+            help="Specifies a distribution of files sizes.",
+        )
+        parser.add_argument(
+            "--file-size",
+            dest="file_size",
+            type=cls.validate_cli_argument_positive_int,
+            default=defaults.file_size,
+            help=(
+                "Specifies a size of files in bytes. It's a median size for"
+                " lognormal distribution and a maximal one for uniform."
+            ),
+        )
+        parser.add_argument(
+            "--template-ratio",
+            dest="template_ratio",
+            type=float,
+            default=defaults.template_ratio,
+            help="Specifies a ratio of templates among files.",
+        )
+        parser.add_argument(
+            "--placeholder-density",
+            dest="placeholder_density",
+            type=float,
+            default=defaults.placeholder_density,
+            help="Specifies a number of placeholders per KiB of templates.",
+        )
+        parser.add_argument(
+            "--seed",
+            dest="seed",
+            type=int,
+            default=defaults.seed,
+            help="Specifies a seed of a synthetic bootstrap generating.",
+        )
+        parser.add_argument(
+            "--iterations",
+            dest="iterations",
+            type=cls.validate_cli_argument_positive_int,
+            default=5,
+            help="Specifies a number of measured runs of every case.",
+        )
+        parser.add_argument(
+            "--jobs",
+            dest="jobs",
+            type=cls.validate_cli_argument_positive_int,
+            default=1,
+            help="Specifies a number of threads for processing files.",
+        )
+        parser.add_argument(
+            "--case",
+            dest="cases",
+            action="append",
+            choices=cls.cases,
+            help="Specifies a measured case. All cases by default.",
+        )
+        parser.add_argument(
+            "--output",
+            dest="output_path",
+            type=Path,
+            default=None,
+            help="Specifies a JSON file for saving results.",
+        )
+        parser.add_argument(
+            "--compare",
+            dest="compare_path",
+            type=Path,
+            default=None,
+            help="Specifies a JSON file with previous results for comparing.",
+        )
+        parser.add_argument(
+            "--threshold",
+            dest="threshold",
+            type=float,
+            default=0.1,
+            help=(
+                "Specifies an allowed relative slowdown and memory growth"
+                " against previous results. 0.1 by default."
+            ),
+        )
+
+    @cached_property
+    def spec(self) -> SyntheticBootstrapSpec:
+        return SyntheticBootstrapSpec(
+            files_count=self.cli_namespace.files_count,
+            depth=self.cli_namespace.depth,
+            fan_out=self.cli_namespace.fan_out,
+            size_distribution=self.cli_namespace.size_distribution,
+            file_size=self.cli_namespace.file_size,
+            template_ratio=self.cli_namespace.template_ratio,
+            placeholder_density=self.cli_namespace.placeholder_density,
+            seed=self.cli_namespace.seed,
+        )
+
+    @cached_property
+    def jobs(self) -> int:
+        return getattr(self.cli_namespace, "jobs", 1)
+
+    @cached_property
+    def selected_cases(self) -> list[str]:
+        return getattr(self.cli_namespace, "cases", None) or list(self.cases)
+
+    @cached_property
+    def context(self) -> dict[str, str]:
+        operation = BaseBuildBootstrapOperation()
+        operation.set_cli_namespace(
+            namespace=Namespace(
+                name="synthetic-project", description="Synthetic project"
+            )
+        )
+        return operation.build_context()
+
+    def run(self):
+        with (
+            TemporaryDirectory() as tmp_dir,
+            self.isolate_cache(path=Path(tmp_dir, "cache")),
+        ):
+            self._source_path = Path(tmp_dir, "synthetic")
+            self._runs_path = Path(tmp_dir, "runs")
+            generator = SyntheticBootstrapGenerator()
+            generator.set_spec(value=self.spec)
+            bytes_count = generator.generate(path=self._source_path)
+
+            measurer = BenchmarkMeasurer()
+            measurer.set_iterations(value=self.cli_namespace.iterations)
+            results = [
+                measurer.measure(
+                    name=case,
+                    func=getattr(self, f"run_{case}"),
+                    prepare=self.prepare_destination_dir,
+                    bytes_count=bytes_count,
+                )
+                for case in self.selected_cases
+            ]
+
+        self.print_results(results=results)
+        data = self.dump_results(results=results)
+        output_path: t.Optional["Path"] = self.cli_namespace.output_path
+        if output_path is not None:
+            self.dump_json(data=data, path=output_path)
+
+        compare_path: t.Optional["Path"] = self.cli_namespace.compare_path
+        if compare_path is not None:
+            self.compare_results(
+                data=data, previous_data=self.load_json(path=compare_path)
+            )
+
+    @contextmanager
+    def isolate_cache(self, path: "Path") -> t.Iterator[None]:
+        # compiled templates of a user cache don't affect measurements
+        previous_value = os.environ.get(CACHE_DIR_ENV_NAME)
+        os.environ[CACHE_DIR_ENV_NAME] = str(path)
+        try:
+            yield
+        finally:
+            if previous_value is None:
+                os.environ.pop(CACHE_DIR_ENV_NAME, None)
+            else:
+                os.environ[CACHE_DIR_ENV_NAME] = previous_value
+
+    def prepare_destination_dir(self) -> "Path":
+        # only the last destination is kept for bounding disk usage
+        shutil.rmtree(self._runs_path, ignore_errors=True)
+        self._runs_count += 1
+        path = self._runs_path / str(self._runs_count)
+        path.mkdir(parents=True)
+        return path
+
+    def run_copy(self, destination_path: "Path"):
+        processor = CopyFilesProcessor()
+        processor.set_source_path(source_path=self._source_path)
+        processor.set_destination_path(destination_path=destination_path)
+        processor.set_jobs(value=self.jobs)
+        processor.run()
+
+    def run_generate(self, destination_path: "Path"):
+        processor = GenerateFilesProcessor()
+        processor.set_source_path(source_path=self._source_path)
+        processor.set_destination_path(destination_path=destination_path)
+        processor.set_jobs(value=self.jobs)
+        processor.set_context(value=self.context)
+        processor.set_entry_point_file_name(
+            value=SyntheticBootstrapGenerator.entry_point_file_name
+        )
+        processor.run()
+
+    def run_export(self, destination_path: "Path"):
+        operation = BaseExportBootstrapOperation()
+        operation.set_cli_namespace(
+            namespace=Namespace(
+                destination_dir=str(destination_path),
+                link_mode="copy",
+                jobs=self.jobs,
+            )
+        )
+        operation.set_bootstrap_path(path=self._source_path)
+        operation.run()
+
+    def run_register(self, destination_path: "Path"):
+        operation = RegisterBootstrapOperation()
+        # bootstraps are registered next to others, a temporary directory
+        # is used instead
+        operation.templates_path = destination_path
+        operation.set_cli_namespace(
+            namespace=Namespace(
+                bootstrap_name="synthetic",
+                source_path=self._source_path,
+                upload_confirmation=True,
+                jobs=self.jobs,
+            )
+        )
+        operation.run()
+
+    def dump_results(self, results: list[BenchmarkResult]) -> dict[str, t.Any]:
+        return {
+            "format_version": self.format_version,
+            "version": ".".join(str(part) for part in VERSION),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "jobs": self.jobs,
+            "spec": asdict(self.spec),
+            "results": [asdict(result) for result in results],
+        }
+
+    def print_results(self, results: list[BenchmarkResult]):
+        print(
+            f"{'case':<10} {'files/s':>10} {'MB/s':>8} {'p50 ms':>8}"
+            f" {'p90 ms':>8} {'p99 ms':>8} {'peak MiB':>9}"
+        )
+        for result in results:
+            print(
+                f"{result.name:<10} {result.files_per_second:>10.1f}"
+                f" {result.mb_per_second:>8.2f} {result.latency_p50:>8.3f}"
+                f" {result.latency_p90:>8.3f} {result.latency_p99:>8.3f}"
+                f" {result.peak_memory / 1024 / 1024:>9.2f}"
+            )
+
+    def compare_results(
+        self, data: dict[str, t.Any], previous_data: dict[str, t.Any]
+    ):
+        if previous_data.get("spec") != data["spec"]:
+            logger.warning(
+                "%r. previous results are measured on another synthetic"
+                " bootstrap.",
+                self,
+            )
+
+        threshold: float = self.cli_namespace.threshold
+        previous_results = {
+            item["name"]: BenchmarkResult(**item)
+            for item in previous_data["results"]
+        }
+        regressions = []
+        for item in data["results"]:
+            result = BenchmarkResult(**item)
+            previous_result = previous_results.get(result.name)
+            if previous_result is None:
+                continue
+
+            for metric, value, previous_value in (
+                (
+                    "median duration",
+                    result.median_duration,
+                    previous_result.median_duration,
+                ),
+                (
+                    "peak memory",
+                    result.peak_memory,
+                    previous_result.peak_memory,
+                ),
+            ):
+                change = value / previous_value - 1 if previous_value else 0.0
+                is_regression = change > threshold
+                print(
+                    f"{result.name}: {metric} {previous_value:.6g} ->"
+                    f" {value:.6g} ({change:+.1%})"
+                    f"{' REGRESSION' if is_regression else ''}"
+                )
+                if is_regression:
+                    regressions.append(f"{result.name} {metric}")
+
+        if regressions:
+            logger.error(
+                "Benchmarks regressions against %s: %s.",
+                previous_data.get("version"),
+                ", ".join(regressions),
+            )
+            raise Exception("Benchmarks regressions")
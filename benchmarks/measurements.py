@@ -0,0 +1,115 @@
+__all__ = (
+    "BenchmarkMeasurer",
+    "BenchmarkResult",
+)
+
+import logging
+import statistics
+import time
+import tracemalloc
+import typing as t
+from dataclasses import dataclass, field
+from unittest.mock import patch
+
+from py_bootstrap.files_processors import BaseFilesProcessor
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    iterations: int
+    # per iteration
+    files_count: int
+    bytes_count: int
+    durations: list[float] = field(default_factory=list)
+    files_per_second: float = 0.0
+    mb_per_second: float = 0.0
+    # per file, in milliseconds
+    latency_p50: float = 0.0
+    latency_p90: float = 0.0
+    latency_p99: float = 0.0
+    peak_memory: int = 0
+
+    @property
+    def median_duration(self) -> float:
+        return statistics.median(self.durations)
+
+
+class BenchmarkMeasurer:
+    _iterations: int = 5
+
+    def set_iterations(self, value: int):
+        self._iterations = value
+
+    def measure(
+        self,
+        name: str,
+        func: t.Callable[["Path"], t.Any],
+        prepare: t.Callable[[], "Path"],
+        bytes_count: int,
+    ) -> BenchmarkResult:
+        # every call gets a new destination made by prepare
+        latencies: list[float] = []
+        durations: list[float] = []
+        with patch.object(
+            BaseFilesProcessor,
+            "handle_file",
+            self.build_timed_handle_file(latencies=latencies),
+        ):
+            for _ in range(self._iterations):
+                destination_path = prepare()
+                started_at = time.perf_counter()
+                func(destination_path)
+                durations.append(time.perf_counter() - started_at)
+
+        # tracing slows down running, memory is measured by a separate call
+        destination_path = prepare()
+        tracemalloc.start()
+        try:
+            func(destination_path)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        files_count = len(latencies) // self._iterations
+        median_duration = statistics.median(durations)
+        quantiles = statistics.quantiles(
+            [latency * 1000 for latency in latencies] or [0.0, 0.0], n=100
+        )
+        result = BenchmarkResult(
+            name=name,
+            iterations=self._iterations,
+            files_count=files_count,
+            bytes_count=bytes_count,
+            durations=durations,
+            files_per_second=files_count / median_duration,
+            mb_per_second=bytes_count / median_duration / 1024 / 1024,
+            latency_p50=quantiles[49],
+            latency_p90=quantiles[89],
+            latency_p99=quantiles[98],
+            peak_memory=peak_memory,
+        )
+        logger.info("%r. %s is measured: %r.", self, name, result)
+        return result
+
+    @staticmethod
+    def build_timed_handle_file(
+        latencies: list[float],
+    ) -> t.Callable[..., None]:
+        handle_file = BaseFilesProcessor.handle_file
+
+        def timed_handle_file(
+            processor: "BaseFilesProcessor", rel_path: "Path", file_name: str
+        ):
+            started_at = time.perf_counter()
+            handle_file(processor, rel_path=rel_path, file_name=file_name)
+            # appending is atomic, files can be handled by many threads
+            latencies.append(time.perf_counter() - started_at)
+
+        return timed_handle_file
@@ -0,0 +1,514 @@
+__all__ = (
+    "BudgetViolation",
+    "ImportTimeRecord",
+    "StartupBenchmarkOperation",
+    "StartupMeasurement",
+)
+
+import logging
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+import typing as t
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from py_bootstrap.base.cache import CACHE_DIR_ENV_NAME
+
+from .base import BaseBenchmarkOperation
+
+if t.TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+logger = logging.getLogger(__name__)
+
+IMPORT_TIME_PATTERN = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|"
+    r"(?P<indent>\s*)(?P<name>\S+)\s*$"
+)
+# a wall time of a whole command is budgeted next to modules
+DURATION_NAME = "<duration>"
+# a wall time of a command above a bare interpreter
+OVERHEAD_NAME = "<overhead>"
+
+
+@dataclass(frozen=True)
+class ImportTimeRecord:
+    name: str
+    # microseconds
+    self_time: int
+    cumulative_time: int
+    level: int
+
+
+@dataclass
+class StartupMeasurement:
+    command: str
+    cli_args: list[str]
+    # minimums of runs, microseconds
+    duration: float = 0.0
+    imports_duration: float = 0.0
+    modules: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BudgetViolation:
+    command: str
+    name: str
+    # microseconds, a module is new when it has no budget
+    value: float
+    budget: t.Optional[float] = None
+
+    @property
+    def delta(self) -> float:
+        return self.value - (self.budget or 0.0)
+
+
+class StartupBenchmarkOperation(BaseBenchmarkOperation):
+    cli_description = (
+        "Measures startup and imports of bootstrap commands in fresh"
+        " interpreters."
+    )
+    format_version: t.ClassVar[int] = 1
+    default_budgets_path: t.ClassVar["Path"] = (
+        Path(__file__).parent / "startup_budgets.json"
+    )
+    # the same as bootstrap console script does
+    script: t.ClassVar[str] = (
+        "from py_bootstrap.scripts.bootstrap import main; main()"
+    )
+    # finders of editable installations depend on a package version
+    ignored_modules_prefixes: t.ClassVar[tuple[str, ...]] = ("__editable__",)
+    # wall times of commands above a bare interpreter, microseconds. they
+    # are set for a machine starting a bare interpreter in target_baseline
+    # and are scaled like budgets
+    overhead_targets: t.ClassVar[dict[str, int]] = {
+        "help": 50_000,
+        "list": 75_000,
+    }
+    target_baseline: t.ClassVar[int] = 20_000
+    # modules are imported by commands which use them only
+    deferred_modules: t.ClassVar[dict[str, tuple[str, ...]]] = {
+        "help": (
+            "asyncio",
+            "dataclasses",
+            "datetime",
+            "importlib.abc",
+            "importlib.metadata",
+            "multiprocessing",
+            "py_bootstrap.files_processors.base",
+            "py_bootstrap.operations.bootstraps_index",
+            "shutil",
+            "socketserver",
+        ),
+        "list": (
+            "asyncio",
+            "dataclasses",
+            "datetime",
+            "importlib.abc",
+            "importlib.metadata",
+            "multiprocessing",
+            "py_bootstrap.files_processors.generate",
+            "shutil",
+            "socketserver",
+        ),
+        "build-help": (
+            "asyncio",
+            "importlib.abc",
+            "importlib.metadata",
+            "multiprocessing",
+            "socketserver",
+        ),
+    }
+
+    @classmethod
+    def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""):
+        parser.add_argument(
+            "--bootstrap",
+            dest="bootstrap",
+            default="application",
+            help=(
+                "Specifies a bootstrap for `build <bootstrap> --help` command."
+                " application by default."
+            ),
+        )
+        parser.add_argument(
+            "--iterations",
+            dest="iterations",
+            type=cls.validate_cli_argument_positive_int,
+            default=5,
+            help="Specifies a number of measured runs of every command.",
+        )
+        parser.add_argument(
+            "--budgets",
+            dest="budgets_path",
+            type=Path,
+            default=cls.default_budgets_path,
+            help="Specifies a JSON file with budgets of commands and modules.",
+        )
+        parser.add_argument(
+            "--update-budgets",
+            dest="update_budgets",
+            action="store_true",
+            help="Saves measured costs as new budgets instead of checking.",
+        )
+        parser.add_argument(
+            "--threshold",
+            dest="threshold",
+            type=float,
+            default=0.25,
+            help=(
+                "Specifies an allowed relative growth of costs against"
+                " budgets. 0.25 by default."
+            ),
+        )
+        parser.add_argument(
+            "--min-cost",
+            dest="min_cost",
+            type=cls.validate_cli_argument_positive_int,
+            default=2000,
+            help=(
+                "Specifies a minimal growth in microseconds of reported"
+                " modules and commands costs. Smaller changes are noise."
+                " 2000 by default."
+            ),
+        )
+        parser.add_argument(
+            "--output",
+            dest="output_path",
+            type=Path,
+            default=None,
+            help="Specifies a JSON file for saving measurements.",
+        )
+
+    @cached_property
+    def commands(self) -> dict[str, list[str]]:
+        return {
+            "help": ["--help"],
+            "list": ["list"],
+            "build-help": ["build", self.cli_namespace.bootstrap, "--help"],
+        }
+
+    @cached_property
+    def threshold(self) -> float:
+        return getattr(self.cli_namespace, "threshold", 0.25)
+
+    @cached_property
+    def min_cost(self) -> int:
+        return getattr(self.cli_namespace, "min_cost", 2000)
+
+    def run(self):
+        # a fresh cache is warmed up by the first run of every command,
+        # measured runs use the bootstraps index like users do
+        with TemporaryDirectory() as tmp_dir:
+            env = {**os.environ, CACHE_DIR_ENV_NAME: tmp_dir}
+            for cli_args in self.commands.values():
+                self.run_command(cli_args=cli_args, env=env)
+
+            # runs of commands are interleaved, a drifting load of a machine
+            # affects all of them equally
+            baseline_durations = []
+            runs: dict[str, list[tuple[float, str]]] = {
+                command: [] for command in self.commands
+            }
+            for _ in range(self.cli_namespace.iterations):
+                duration, _ = self.time_command(
+                    cli_args=[], env=env, script="pass"
+                )
+                baseline_durations.append(duration)
+                for command, cli_args in self.commands.items():
+                    runs[command].append(
+                        self.time_command(cli_args=cli_args, env=env)
+                    )
+
+        # startup of a bare interpreter scales budgets measured on
+        # another machine
+        baseline = min(baseline_durations)
+        measurements = [
+            self.build_measurement(
+                command=command, cli_args=cli_args, runs=runs[command]
+            )
+            for command, cli_args in self.commands.items()
+        ]
+
+        self.print_measurements(measurements=measurements)
+        data = self.dump_measurements(
+            baseline=baseline, measurements=measurements
+        )
+        output_path: t.Optional["Path"] = self.cli_namespace.output_path
+        if output_path is not None:
+            self.dump_json(data=data, path=output_path)
+
+        violations = self.check_targets(data=data)
+        budgets_path: "Path" = self.cli_namespace.budgets_path
+        if self.cli_namespace.update_budgets:
+            self.dump_json(
+                data=self.build_budgets(data=data), path=budgets_path
+            )
+        elif budgets_path.exists():
+            violations.extend(
+                self.check_budgets(
+                    data=data, budgets=self.load_json(path=budgets_path)
+                )
+            )
+        else:
+            logger.warning("%r. budgets are missed: %r.", self, budgets_path)
+
+        self.print_violations(violations=violations)
+        if violations:
+            logger.error(
+                "Startup targets and budgets are exceeded by %d modules or"
+                " commands.",
+                len(violations),
+            )
+            raise Exception("Startup budgets are exceeded")
+
+    def time_command(
+        self,
+        cli_args: list[str],
+        env: dict[str, str],
+        script: t.Optional[str] = None,
+    ) -> tuple[float, str]:
+        started_at = time.perf_counter()
+        output = self.run_command(cli_args=cli_args, env=env, script=script)
+        return (time.perf_counter() - started_at) * 1_000_000, output
+
+    def build_measurement(
+        self, command: str, cli_args: list[str], runs: list[tuple[float, str]]
+    ) -> StartupMeasurement:
+        # minimums are the least affected by noise of a machine
+        imports_durations = []
+        modules_times: dict[str, list[int]] = {}
+        for _, output in runs:
+            records = self.parse_import_times(output=output)
+            # cumulative times of top-level imports cover all imports
+            imports_durations.append(
+                sum(
+                    record.cumulative_time
+                    for record in records
+                    if not record.level
+                )
+            )
+            for record in records:
+                if record.name.startswith(self.ignored_modules_prefixes):
+                    continue
+                modules_times.setdefault(record.name, []).append(
+                    record.cumulative_time
+                )
+
+        measurement = StartupMeasurement(
+            command=command,
+            cli_args=cli_args,
+            duration=min(duration for duration, _ in runs),
+            imports_duration=min(imports_durations),
+            modules={name: min(times) for name, times in modules_times.items()},
+        )
+        logger.info(
+            "%r. %s is measured: %d modules.",
+            self,
+            command,
+            len(measurement.modules),
+        )
+        return measurement
+
+    def run_command(
+        self,
+        cli_args: list[str],
+        env: dict[str, str],
+        script: t.Optional[str] = None,
+    ) -> str:
+        script = self.script if script is None else script
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script, *cli_args],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if process.returncode:
+            logger.error(
+                "%r. %r command failed: %s",
+                self,
+                cli_args,
+                process.stderr[-2000:],
+            )
+            raise Exception("Running command")
+        return process.stderr
+
+    @staticmethod
+    def parse_import_times(output: str) -> list[ImportTimeRecord]:
+        records = []
+        for line in output.splitlines():
+            match = IMPORT_TIME_PATTERN.match(line)
+            if match is None:
+                # the header and own output of a command
+                continue
+
+            records.append(
+                ImportTimeRecord(
+                    name=match["name"],
+                    self_time=int(match["self"]),
+                    cumulative_time=int(match["cumulative"]),
+                    level=(len(match["indent"]) - 1) // 2,
+                )
+            )
+        return records
+
+    def dump_measurements(
+        self, baseline: float, measurements: list[StartupMeasurement]
+    ) -> dict[str, t.Any]:
+        return {
+            "format_version": self.format_version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "baseline": baseline,
+            "commands": {
+                measurement.command: asdict(measurement)
+                for measurement in measurements
+            },
+        }
+
+    def build_budgets(self, data: dict[str, t.Any]) -> dict[str, t.Any]:
+        # all imported modules are budgeted for detecting new imports
+        commands = {
+            command: {
+                "cli_args": measurement["cli_args"],
+                DURATION_NAME: round(measurement["duration"]),
+                "modules": {
+                    name: round(value)
+                    for name, value in sorted(measurement["modules"].items())
+                },
+            }
+            for command, measurement in data["commands"].items()
+        }
+        return {
+            "format_version": self.format_version,
+            "python": data["python"],
+            "baseline": round(data["baseline"]),
+            "commands": commands,
+        }
+
+    def check_budgets(
+        self, data: dict[str, t.Any], budgets: dict[str, t.Any]
+    ) -> list[BudgetViolation]:
+        # imports costs differ between Python versions, even patch ones,
+        # budgets of another version are refreshed instead of enforced
+        if budgets.get("python") != data["python"]:
+            logger.warning(
+                "%r. budgets are measured by Python %s, the current one is %s."
+                " budgets are skipped, refresh them by --update-budgets.",
+                self,
+                budgets.get("python"),
+                data["python"],
+            )
+            return []
+
+        scale = data["baseline"] / budgets["baseline"]
+        logger.info("%r. budgets are scaled by %.2f.", self, scale)
+
+        violations = []
+        for command, measurement in data["commands"].items():
+            command_budgets = budgets["commands"].get(command)
+            if command_budgets is None:
+                logger.warning("%r. %s command has no budgets.", self, command)
+                continue
+
+            costs = {
+                DURATION_NAME: measurement["duration"],
+                **measurement["modules"],
+            }
+            modules_budgets = {
+                DURATION_NAME: command_budgets[DURATION_NAME],
+                **command_budgets["modules"],
+            }
+            for name, value in costs.items():
+                budget = modules_budgets.get(name)
+                if budget is not None:
+                    budget *= scale
+
+                if budget is None:
+                    is_violation = value >= self.min_cost
+                else:
+                    is_violation = (
+                        value > budget * (1 + self.threshold)
+                        and value - budget >= self.min_cost
+                    )
+                if is_violation:
+                    violations.append(
+                        BudgetViolation(
+                            command=command,
+                            name=name,
+                            value=value,
+                            budget=budget,
+                        )
+                    )
+
+        violations.sort(key=lambda violation: violation.delta, reverse=True)
+        return violations
+
+    def check_targets(self, data: dict[str, t.Any]) -> list[BudgetViolation]:
+        scale = data["baseline"] / self.target_baseline
+        violations = []
+        for command, measurement in data["commands"].items():
+            target = self.overhead_targets.get(command)
+            overhead = measurement["duration"] - data["baseline"]
+            if target is not None and overhead > target * scale:
+                violations.append(
+                    BudgetViolation(
+                        command=command,
+                        name=OVERHEAD_NAME,
+                        value=overhead,
+                        budget=target * scale,
+                    )
+                )
+
+            for name in self.deferred_modules.get(command, ()):
+                value = measurement["modules"].get(name)
+                if value is not None:
+                    violations.append(
+                        BudgetViolation(
+                            command=command, name=name, value=value, budget=0.0
+                        )
+                    )
+
+        violations.sort(key=lambda violation: violation.delta, reverse=True)
+        return violations
+
+    def print_measurements(self, measurements: list[StartupMeasurement]):
+        print(
+            f"{'command':<12} {'wall ms':>9} {'imports ms':>11} {'modules':>8}"
+        )
+        for measurement in measurements:
+            print(
+                f"{measurement.command:<12} {measurement.duration / 1000:>9.1f}"
+                f" {measurement.imports_duration / 1000:>11.1f}"
+                f" {len(measurement.modules):>8}"
+            )
+
+    def print_violations(self, violations: list[BudgetViolation]):
+        if not violations:
+            print("All commands and modules are within budgets.")
+            return
+
+        print(
+            f"{'command':<12} {'module':<48} {'budget ms':>10}"
+            f" {'actual ms':>10} {'change':>8}"
+        )
+        for violation in violations:
+            if violation.budget is None:
+                budget, change = "new", ""
+            elif not violation.budget:
+                budget, change = "deferred", ""
+            else:
+                budget = f"{violation.budget / 1000:.1f}"
+                change = f"{violation.value / violation.budget - 1:+.0%}"
+            print(
+                f"{violation.command:<12} {violation.name:<48} {budget:>10}"
+                f" {violation.value / 1000:>10.1f} {change:>8}"
+            )
@@ -0,0 +1,185 @@
+__all__ = (
+    "SyntheticBootstrapGenerator",
+    "SyntheticBootstrapSpec",
+)
+
+import logging
+import random
+import typing as t
+from dataclasses import dataclass
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_CONTENT = """__all__ = (
+    "BuildOperation",
+    "ExportOperation",
+)
+
+from py_bootstrap.operations import (
+    BaseBuildBootstrapOperation,
+    BaseExportBootstrapOperation,
+)
+
+DESCRIPTION = "Synthetic bootstrap for benchmarks"
+
+
+class BuildOperation(BaseBuildBootstrapOperation):
+    cli_description = "Generates a synthetic project"
+    cli_argument_name_help = "Specifies name of the project"
+    cli_argument_description_help = "Specifies description of the project"
+
+
+class ExportOperation(BaseExportBootstrapOperation):
+    cli_description = "Exports synthetic bootstrap files"
+"""
+
+WORDS = (
+    "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu nu"
+    " xi omicron pi rho sigma tau upsilon phi chi psi omega"
+).split()
+
+PLACEHOLDERS = (
+    "name",
+    "python_name",
+    "upper_name",
+    "class_name",
+    "title",
+    "description",
+    "date_year",
+)
+
+
+@dataclass(frozen=True)
+class SyntheticBootstrapSpec:
+    files_count: int = 500
+    # nesting levels of directories and directories on every level
+    depth: int = 3
+    fan_out: int = 3
+    # fixed, uniform or lognormal
+    size_distribution: str = "lognormal"
+    # a median size for lognormal, a maximal one for uniform
+    file_size: int = 4096
+    template_ratio: float = 0.3
+    # placeholders per KiB of templates content
+    placeholder_density: float = 4.0
+    seed: int = 0
+
+
+class SyntheticBootstrapGenerator:
+    size_distributions: t.ClassVar[tuple[str, ...]] = (
+        "fixed",
+        "uniform",
+        "lognormal",
+    )
+    entry_point_file_name: t.ClassVar[str] = "__entry_point__.py"
+
+    _spec: SyntheticBootstrapSpec
+    _random: random.Random
+
+    def set_spec(self, value: SyntheticBootstrapSpec):
+        self._spec = value
+
+    def generate(self, path: "Path") -> int:
+        self._random = random.Random(self._spec.seed)
+        directories = self.generate_directories(path=path)
+        # names of plain files are not rendered, they can't be placed into
+        # templated directories
+        plain_directories = [
+            directory
+            for directory in directories
+            if "{" not in directory.relative_to(path).as_posix()
+        ]
+        (path / self.entry_point_file_name).write_text(ENTRY_POINT_CONTENT)
+
+        total_size = 0
+        for index in range(self._spec.files_count):
+            is_template = self._random.random() < self._spec.template_ratio
+            directory = self._random.choice(
+                directories if is_template else plain_directories
+            )
+            size = self.choose_file_size()
+            if is_template:
+                file_path = directory / f"file_{index}.txt.tmpl"
+                content = self.generate_template_content(size=size)
+            else:
+                file_path = directory / f"file_{index}.txt"
+                content = self.generate_content(size=size)
+            file_path.write_text(content)
+            total_size += len(content)
+
+        logger.info(
+            "%r. %d files (%d bytes) are generated in %r.",
+            self,
+            self._spec.files_count,
+            total_size,
+            path,
+        )
+        return total_size
+
+    def generate_directories(self, path: "Path") -> list["Path"]:
+        path.mkdir(parents=True, exist_ok=True)
+        directories = [path]
+        level = [path]
+        for depth in range(self._spec.depth):
+            next_level = []
+            for parent_path in level:
+                for index in range(self._spec.fan_out):
+                    # directories names are templates too
+                    name = (
+                        "{python_name}"
+                        if depth == 0 and index == 0
+                        else f"dir_{depth}_{index}"
+                    )
+                    directory = parent_path / name
+                    directory.mkdir(exist_ok=True)
+                    next_level.append(directory)
+            directories.extend(next_level)
+            level = next_level
+        return directories
+
+    def choose_file_size(self) -> int:
+        match self._spec.size_distribution:
+            case "fixed":
+                return self._spec.file_size
+            case "uniform":
+                return self._random.randint(1, self._spec.file_size)
+            case "lognormal":
+                size = self._random.lognormvariate(0, 1) * self._spec.file_size
+                return max(1, int(size))
+            case _:
+                raise ValueError(
+                    f"Unknown size distribution {self._spec.size_distribution}"
+                )
+
+    def generate_content(self, size: int) -> str:
+        words: list[str] = []
+        length = 0
+        while length < size:
+            word = self._random.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+        return " ".join(words)[:size]
+
+    def generate_template_content(self, size: int) -> str:
+        content = self.generate_content(size=size)
+        count = int(size / 1024 * self._spec.placeholder_density)
+        if not count:
+            return content
+
+        positions = sorted(
+            self._random.sample(range(len(content) + 1), k=count)
+            if count <= len(content)
+            else range(len(content) + 1)
+        )
+        parts = []
+        previous = 0
+        for position in positions:
+            parts.append(content[previous:position])
+            parts.append(f" {{{self._random.choice(PLACEHOLDERS)}}} ")
+            previous = position
+        parts.append(content[previous:])
+        return "".join(parts)
@@ -0,0 +1,21 @@
+__all__ = (
+    "CACHE_DIR_ENV_NAME",
+    "get_cache_dir",
+)
+
+import os
+import typing as t
+from pathlib import Path
+
+if t.TYPE_CHECKING:
+    ...
+
+CACHE_DIR_ENV_NAME = "PY_BOOTSTRAP_CACHE_DIR"
+
+
+def get_cache_dir() -> "Path":
+    if value := os.environ.get(CACHE_DIR_ENV_NAME):
+        return Path(value)
+    if value := os.environ.get("XDG_CACHE_HOME"):
+        return Path(value, "py-bootstrap")
+    return Path.home() / ".cache" / "py-bootstrap"
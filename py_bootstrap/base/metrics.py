@@ -0,0 +1,140 @@
+__all__ = (
+    "OperationMetrics",
+    "PhaseMetrics",
+)
+
+import logging
+import os
+import time
+import typing as t
+from collections import Counter
+from contextlib import contextmanager
+from threading import Lock
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+class PhaseMetrics:
+    # every command measures its phases, a plain class doesn't import
+    # dataclasses and inspect on a startup
+    __slots__ = ("calls", "wall_time", "cpu_time")
+
+    calls: int
+    # seconds, summed over all calls in all threads
+    wall_time: float
+    cpu_time: float
+
+    def __init__(
+        self, calls: int = 0, wall_time: float = 0.0, cpu_time: float = 0.0
+    ):
+        self.calls = calls
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+
+    def as_dict(self) -> dict[str, t.Any]:
+        return {
+            "calls": self.calls,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+        }
+
+
+class OperationMetrics:
+    format_version: t.ClassVar[int] = 1
+
+    _lock: Lock
+    _labels: dict[str, str]
+    _phases: dict[str, PhaseMetrics]
+    _counters: Counter[str]
+
+    def __init__(self):
+        self._lock = Lock()
+        self._labels = {}
+        self._phases = {}
+        self._counters = Counter()
+
+    @property
+    def labels(self) -> dict[str, str]:
+        with self._lock:
+            return dict(self._labels)
+
+    @property
+    def phases(self) -> dict[str, PhaseMetrics]:
+        with self._lock:
+            return {
+                name: PhaseMetrics(**phase.as_dict())
+                for name, phase in self._phases.items()
+            }
+
+    @property
+    def counters(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def set_label(self, name: str, value: str):
+        with self._lock:
+            self._labels[name] = value
+
+    @contextmanager
+    def measure(self, phase: str) -> t.Iterator[None]:
+        # files are processed by many threads, CPU time of the current
+        # thread only belongs to the phase
+        started_at = time.perf_counter()
+        cpu_started_at = time.thread_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - started_at
+            cpu_time = time.thread_time() - cpu_started_at
+            with self._lock:
+                metrics = self._phases.setdefault(phase, PhaseMetrics())
+                metrics.calls += 1
+                metrics.wall_time += wall_time
+                metrics.cpu_time += cpu_time
+
+    def increment(self, counter: str, value: int = 1):
+        with self._lock:
+            self._counters[counter] += value
+
+    def reset(self):
+        # labels describe an operation, they're kept
+        with self._lock:
+            self._phases.clear()
+            self._counters.clear()
+
+    def merge(self, data: dict[str, t.Any]):
+        # e.g. metrics of forked workers, the data is got by as_dict
+        with self._lock:
+            for name, phase_data in data["phases"].items():
+                metrics = self._phases.setdefault(name, PhaseMetrics())
+                metrics.calls += phase_data["calls"]
+                metrics.wall_time += phase_data["wall_time"]
+                metrics.cpu_time += phase_data["cpu_time"]
+            self._counters.update(data["counters"])
+
+    def as_dict(self) -> dict[str, t.Any]:
+        return {
+            "format_version": self.format_version,
+            "labels": self.labels,
+            "phases": {
+                name: phase.as_dict() for name, phase in self.phases.items()
+            },
+            "counters": self.counters,
+        }
+
+    def dump(self, path: "Path"):
+        # metrics are saved on demand only
+        import json
+
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}")
+        try:
+            tmp_path.write_text(json.dumps(self.as_dict(), indent=2) + "\n")
+            os.replace(tmp_path, path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        logger.debug("%r. metrics are saved into %r.", self, path)
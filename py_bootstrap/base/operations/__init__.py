@@ -3,8 +3,12 @@ __all__ = (
     "BaseCliOperation",
     "BaseOperationsRunner",
     "BaseRecursiveOperationsContainer",
+    "CliHelpFormatter",
+    "LazySubParsersAction",
 )
 
 from .base import BaseCliOperation, BaseOperation
+from .help_formatter import CliHelpFormatter
+from .lazy_subparsers import LazySubParsersAction
 from .recursive_container import BaseRecursiveOperationsContainer
 from .runner import BaseOperationsRunner
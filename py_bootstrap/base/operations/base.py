@@ -7,6 +7,8 @@ import logging
 import typing as t
 from argparse import ArgumentParser
 
+from py_bootstrap.base.metrics import OperationMetrics
+
 if t.TYPE_CHECKING:
     from argparse import Namespace
 
@@ -14,6 +16,17 @@ logger = logging.getLogger(__name__)
 
 
 class BaseOperation:
+    _metrics: t.Optional["OperationMetrics"] = None
+
+    @property
+    def metrics(self) -> "OperationMetrics":
+        if self._metrics is None:
+            self._metrics = OperationMetrics()
+        return self._metrics
+
+    def set_metrics(self, value: "OperationMetrics"):
+        self._metrics = value
+
     def run(self):
         raise NotImplementedError(f"{self.__class__}.run")
 
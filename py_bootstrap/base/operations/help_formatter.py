@@ -0,0 +1,48 @@
+__all__ = ("CliHelpFormatter",)
+
+import os
+import sys
+import typing as t
+from argparse import HelpFormatter
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class CliHelpFormatter(HelpFormatter):
+    # argparse creates formatters for every added argument and imports
+    # shutil for a terminal width, the width is taken the same way by os
+    fallback_width: t.ClassVar[int] = 80
+
+    def __init__(
+        self,
+        prog: str,
+        indent_increment: int = 2,
+        max_help_position: int = 24,
+        width: t.Optional[int] = None,
+    ):
+        if width is None:
+            width = self.get_terminal_width() - 2
+        super().__init__(
+            prog,
+            indent_increment=indent_increment,
+            max_help_position=max_help_position,
+            width=width,
+        )
+
+    @classmethod
+    def get_terminal_width(cls) -> int:
+        try:
+            width = int(os.environ["COLUMNS"])
+        except (KeyError, ValueError):
+            width = 0
+        if width > 0:
+            return width
+
+        try:
+            # stdout is None, closed, detached or not a terminal
+            stdout = t.cast("t.TextIO", sys.__stdout__)
+            width = os.get_terminal_size(stdout.fileno()).columns
+        except (AttributeError, ValueError, OSError):
+            width = 0
+        return width or cls.fallback_width
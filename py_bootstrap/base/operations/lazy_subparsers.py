@@ -0,0 +1,69 @@
+__all__ = ("LazySubParsersAction",)
+
+import logging
+import typing as t
+from argparse import ArgumentParser, _SubParsersAction
+
+from .help_formatter import CliHelpFormatter
+
+if t.TYPE_CHECKING:
+    from argparse import Namespace
+
+logger = logging.getLogger(__name__)
+
+CliParserPreparer = t.Callable[["ArgumentParser"], None]
+
+
+class LazySubParsersAction(_SubParsersAction):
+    _lazy_preparers: dict[str, CliParserPreparer]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_preparers = {}
+
+    @classmethod
+    def add_to_parser(
+        cls, parser: "ArgumentParser", **kwargs
+    ) -> "LazySubParsersAction":
+        return t.cast(
+            LazySubParsersAction, parser.add_subparsers(action=cls, **kwargs)
+        )
+
+    def add_lazy_parser(
+        self, name: str, preparer: CliParserPreparer, **kwargs
+    ) -> "ArgumentParser":
+        # an empty parser is enough for choices and help listings,
+        # its arguments are prepared only when the parser is selected
+        kwargs.setdefault("formatter_class", CliHelpFormatter)
+        parser = self.add_parser(name, **kwargs)
+        self._lazy_preparers[name] = preparer
+        return parser
+
+    def prepare_lazy_parser(self, name: str):
+        preparer = self._lazy_preparers.pop(name, None)
+        if preparer is None:
+            return
+
+        logger.debug("%r. prepare lazy CLI parser: %r.", self, name)
+        preparer(self._name_parser_map[name])
+
+    def prepare_lazy_parsers(self):
+        # e.g. long-running processes prepare all parsers once instead of
+        # on every parsing
+        for name in list(self._lazy_preparers):
+            self.prepare_lazy_parser(name=name)
+
+        for parser in self._name_parser_map.values():
+            for action in parser._actions:
+                if isinstance(action, LazySubParsersAction):
+                    action.prepare_lazy_parsers()
+
+    def __call__(
+        self,
+        parser: "ArgumentParser",
+        namespace: "Namespace",
+        values: t.Any,
+        option_string: t.Optional[str] = None,
+    ):
+        self.prepare_lazy_parser(name=values[0])
+        super().__call__(parser, namespace, values, option_string)
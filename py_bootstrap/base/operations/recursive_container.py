@@ -3,8 +3,10 @@ __all__ = ("BaseRecursiveOperationsContainer",)
 import logging
 import typing as t
 from argparse import ArgumentParser
+from functools import partial
 
 from .base import BaseCliOperation
+from .lazy_subparsers import LazySubParsersAction
 
 if t.TYPE_CHECKING:
     ...
@@ -21,21 +23,21 @@ class BaseRecursiveOperationsContainer(BaseCliOperation):
     @classmethod
     def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""):
         dest = f"__operation__{prefix}" if prefix else "__operation"
-        subparsers = parser.add_subparsers(
-            title="Registered operations", dest=dest, required=True
+        subparsers = LazySubParsersAction.add_to_parser(
+            parser, title="Registered operations", dest=dest, required=True
         )
         for (
             cli_name,
             operation_cls,
         ) in cls.operations_classes_map.items():
-            subparser = subparsers.add_parser(
-                cli_name, help=operation_cls.cli_description
-            )
             dest_name = cli_name.replace("-", "_")
             operation_prefix = f"{prefix}__{dest_name}" if prefix else dest_name
-            logger.debug("%r. prepare CLI parser from: %r.", cls, operation_cls)
-            operation_cls.prepare_cli_parser(
-                parser=subparser, prefix=operation_prefix
+            subparsers.add_lazy_parser(
+                cli_name,
+                preparer=partial(
+                    operation_cls.prepare_cli_parser, prefix=operation_prefix
+                ),
+                help=operation_cls.cli_description,
             )
 
     def run(self):
@@ -53,6 +55,7 @@ class BaseRecursiveOperationsContainer(BaseCliOperation):
         self._operation = operation
 
         operation.set_cli_namespace(namespace=self.cli_namespace)
+        operation.set_metrics(value=self.metrics)
 
         if isinstance(operation, BaseRecursiveOperationsContainer):
             dest_name = cli_name.replace("-", "_")
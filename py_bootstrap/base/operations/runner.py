@@ -1,12 +1,18 @@
 __all__ = ("BaseOperationsRunner",)
 
 import logging
+import sys
 import typing as t
 from argparse import ArgumentParser
+from pathlib import Path
+
+from py_bootstrap.base.metrics import OperationMetrics
 
 if t.TYPE_CHECKING:
     from argparse import Namespace
+    from cProfile import Profile
 from .base import BaseCliOperation
+from .help_formatter import CliHelpFormatter
 
 logger = logging.getLogger(__name__)
 
@@ -15,33 +21,166 @@ class BaseOperationsRunner:
     cli_prog: t.ClassVar[str]
     operation_cls: t.ClassVar[type["BaseCliOperation"]]
 
+    # values of pstats.SortKey, profiling modules are imported on demand
+    # for keeping a startup fast
+    cli_profile_sort_choices: t.ClassVar[tuple[str, ...]] = (
+        "calls",
+        "cumulative",
+        "filename",
+        "line",
+        "name",
+        "nfl",
+        "pcalls",
+        "stdname",
+        "time",
+    )
+    cli_profile_limit: t.ClassVar[int] = 30
+
     _cli_args: t.Optional[list[str]] = None
     _operation: "BaseCliOperation"
+    _metrics: t.Optional["OperationMetrics"] = None
+
+    @property
+    def metrics(self) -> "OperationMetrics":
+        if self._metrics is None:
+            self._metrics = OperationMetrics()
+            self._metrics.set_label(name="prog", value=self.cli_prog)
+        return self._metrics
+
+    def set_metrics(self, value: "OperationMetrics"):
+        self._metrics = value
 
     def set_cli_args(self, cli_args: list[str]):
         self._cli_args = cli_args
 
     def run(self):
-        parser = self.build_cli_parser()
-        self.operation_cls.prepare_cli_parser(parser=parser)
-        namespace = self.parse_cli_args(parser=parser)
+        runner_namespace = self.parse_runner_cli_args()
+        metrics_path = runner_namespace.metrics_path
+        try:
+            if runner_namespace.profile_path is None:
+                self.run_operation()
+            else:
+                self.run_operation_profiled(
+                    path=runner_namespace.profile_path,
+                    sort=runner_namespace.profile_sort,
+                )
+        except BaseException:
+            # metrics of failed runs are saved too, a saving failure doesn't
+            # hide the running one
+            if metrics_path is not None:
+                try:
+                    self.metrics.dump(path=Path(metrics_path))
+                except Exception as err:
+                    logger.error(
+                        "%r. unable to save metrics into %r: %r.",
+                        self,
+                        metrics_path,
+                        err,
+                    )
+            raise
+
+        if metrics_path is not None:
+            self.metrics.dump(path=Path(metrics_path))
 
-        operation = self.operation_cls()
+    def run_operation_profiled(self, path: str, sort: str):
+        import cProfile
+
+        # parsers building and arguments parsing are profiled too
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(self.run_operation)
+        finally:
+            self.report_profile(profiler=profiler, path=path, sort=sort)
+
+    def run_operation(self):
+        with self.metrics.measure(phase="parser_building"):
+            parser = self.build_cli_parser()
+            self.prepare_cli_parser(parser=parser)
+        with self.metrics.measure(phase="argument_parsing"):
+            namespace = self.parse_cli_args(parser=parser)
+
+        operation = self.build_operation()
         self._operation = operation
 
         operation.set_cli_namespace(namespace=namespace)
+        operation.set_metrics(value=self.metrics)
         logger.debug("%r. running operation: %r.", self, operation)
-        operation.run()
+        with self.metrics.measure(phase="running"):
+            operation.run()
 
     def build_cli_parser(self) -> "ArgumentParser":
         params = self.get_cli_parser_creating_parameters()
         logger.debug("CLI parser creating parameters: %r.", params)
-        return ArgumentParser(**params)
+        parser = ArgumentParser(**params)
+        self.prepare_runner_cli_parser(parser=parser)
+        return parser
+
+    @classmethod
+    def prepare_runner_cli_parser(cls, parser: "ArgumentParser"):
+        parser.add_argument(
+            "--profile",
+            dest="profile_path",
+            metavar="PATH",
+            default=None,
+            help=(
+                "Profiles running by cProfile, saves stats into a .pstats file"
+                " and prints the hottest functions."
+            ),
+        )
+        parser.add_argument(
+            "--profile-sort",
+            dest="profile_sort",
+            choices=cls.cli_profile_sort_choices,
+            default="cumulative",
+            help=(
+                "Specifies a sorting of printed profile stats."
+                " cumulative by default."
+            ),
+        )
+        parser.add_argument(
+            "--metrics-json",
+            dest="metrics_path",
+            metavar="PATH",
+            default=None,
+            help=(
+                "Saves wall and CPU times of running phases and counters of"
+                " processed files into a JSON file."
+            ),
+        )
+
+    def parse_runner_cli_args(self) -> "Namespace":
+        # runner options are parsed before building the whole parser
+        parser = ArgumentParser(
+            prog=self.cli_prog,
+            add_help=False,
+            allow_abbrev=False,
+            formatter_class=CliHelpFormatter,
+        )
+        self.prepare_runner_cli_parser(parser=parser)
+        namespace, _ = parser.parse_known_args(self._cli_args)
+        return namespace
+
+    def report_profile(self, profiler: "Profile", path: str, sort: str):
+        import pstats
+
+        profiler.dump_stats(path)
+        logger.info("%r. profile stats are saved into %r.", self, path)
+
+        # stdout belongs to operations output
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats(sort).print_stats(self.cli_profile_limit)
+
+    def prepare_cli_parser(self, parser: "ArgumentParser"):
+        self.operation_cls.prepare_cli_parser(parser=parser)
+
+    def build_operation(self) -> "BaseCliOperation":
+        return self.operation_cls()
 
     def get_cli_parser_creating_parameters(self) -> dict:
         return {
             "prog": self.cli_prog,
             "description": self.operation_cls.cli_description,
+            "formatter_class": CliHelpFormatter,
         }
 
     def parse_cli_args(self, parser: "ArgumentParser") -> "Namespace":
@@ -0,0 +1,99 @@
+__all__ = (
+    "EXIT_FRAME",
+    "SERVED_OPERATIONS",
+    "SOCKET_ENV_NAME",
+    "STDERR_FRAME",
+    "STDOUT_FRAME",
+    "FramesWriter",
+    "dump_request",
+    "load_request",
+    "read_frame",
+    "write_exit_frame",
+    "write_frame",
+)
+
+import io
+import json
+import struct
+import typing as t
+
+if t.TYPE_CHECKING:
+    from typing import BinaryIO
+
+# the module is imported by the thin client, heavy modules aren't imported
+# here
+
+SOCKET_ENV_NAME = "PY_BOOTSTRAP_SOCKET"
+SERVED_OPERATIONS = ("build", "export", "list")
+
+STDOUT_FRAME = b"o"
+STDERR_FRAME = b"e"
+EXIT_FRAME = b"x"
+
+# a frame kind and a size of its data. an exit frame has no data, an exit
+# status is kept instead of the size
+FRAME_HEADER = struct.Struct(">cI")
+
+
+def dump_request(cli_args: list[str], cwd: str) -> bytes:
+    return json.dumps({"args": cli_args, "cwd": cwd}).encode() + b"\n"
+
+
+def load_request(line: bytes) -> tuple[list[str], str]:
+    data = json.loads(line)
+    cli_args, cwd = data["args"], data["cwd"]
+    if not (
+        isinstance(cli_args, list)
+        and all(isinstance(arg, str) for arg in cli_args)
+        and isinstance(cwd, str)
+    ):
+        raise ValueError("Request args should be strings")
+    return cli_args, cwd
+
+
+def write_frame(stream: "BinaryIO", kind: bytes, data: bytes):
+    stream.write(FRAME_HEADER.pack(kind, len(data)) + data)
+
+
+def write_exit_frame(stream: "BinaryIO", status: int):
+    stream.write(FRAME_HEADER.pack(EXIT_FRAME, status))
+    stream.flush()
+
+
+def read_frame(stream: "BinaryIO") -> t.Optional[tuple[bytes, int, bytes]]:
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+
+    kind, value = FRAME_HEADER.unpack(header)
+    if kind == EXIT_FRAME:
+        return kind, value, b""
+
+    data = stream.read(value)
+    if len(data) < value:
+        return None
+    return kind, value, data
+
+
+class FramesWriter(io.RawIOBase):
+    _stream: "BinaryIO"
+    _kind: bytes
+
+    def __init__(self, stream: "BinaryIO", kind: bytes):
+        super().__init__()
+        self._stream = stream
+        self._kind = kind
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: t.Any) -> int:
+        data = bytes(data)
+        if data:
+            write_frame(stream=self._stream, kind=self._kind, data=data)
+        return len(data)
+
+    def flush(self):
+        super().flush()
+        if not (self.closed or self._stream.closed):
+            self._stream.flush()
@@ -1,9 +1,81 @@
 __all__ = (
+    "ArchivingFilesProcessor",
+    "AsyncCopyFilesProcessor",
+    "AsyncGenerateFilesProcessor",
     "BaseFilesProcessor",
+    "BootstrapArchive",
+    "BootstrapArchiveEntry",
+    "BuildManifest",
+    "BuildPlan",
+    "BuildPlanEntry",
     "CopyFilesProcessor",
+    "ExclusionMatcher",
+    "FilesCopier",
     "GenerateFilesProcessor",
+    "OutputArchive",
+    "PackFilesProcessor",
+    "PlanningFilesProcessor",
+    "TemplatesCache",
 )
 
-from .base import BaseFilesProcessor
-from .copy import CopyFilesProcessor
-from .generate import GenerateFilesProcessor
+import typing as t
+from importlib import import_module
+
+if t.TYPE_CHECKING:
+    from .archive import (
+        BootstrapArchive,
+        BootstrapArchiveEntry,
+        PackFilesProcessor,
+    )
+    from .archiving import ArchivingFilesProcessor, OutputArchive
+    from .asynchronous import (
+        AsyncCopyFilesProcessor,
+        AsyncGenerateFilesProcessor,
+    )
+    from .base import BaseFilesProcessor
+    from .copier import FilesCopier
+    from .copy import CopyFilesProcessor
+    from .exclusion import ExclusionMatcher
+    from .generate import GenerateFilesProcessor
+    from .manifest import BuildManifest
+    from .plan import BuildPlan, BuildPlanEntry, PlanningFilesProcessor
+    from .templates import TemplatesCache
+
+# submodules are imported on the first access to their names, e.g. asyncio
+# isn't imported until async processors are used
+_submodules_names_map = {
+    "ArchivingFilesProcessor": "archiving",
+    "AsyncCopyFilesProcessor": "asynchronous",
+    "AsyncGenerateFilesProcessor": "asynchronous",
+    "BaseFilesProcessor": "base",
+    "BootstrapArchive": "archive",
+    "BootstrapArchiveEntry": "archive",
+    "BuildManifest": "manifest",
+    "BuildPlan": "plan",
+    "BuildPlanEntry": "plan",
+    "CopyFilesProcessor": "copy",
+    "ExclusionMatcher": "exclusion",
+    "FilesCopier": "copier",
+    "GenerateFilesProcessor": "generate",
+    "OutputArchive": "archiving",
+    "PackFilesProcessor": "archive",
+    "PlanningFilesProcessor": "plan",
+    "TemplatesCache": "templates",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        submodule_name = _submodules_names_map[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value = getattr(import_module(f".{submodule_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
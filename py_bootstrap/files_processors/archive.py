@@ -0,0 +1,243 @@
+__all__ = (
+    "BootstrapArchive",
+    "BootstrapArchiveEntry",
+    "PackFilesProcessor",
+)
+
+import io
+import json
+import logging
+import mmap
+import os
+import shutil
+import struct
+import typing as t
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from hashlib import file_digest
+from pathlib import Path
+
+from .copy import CopyFilesProcessor
+
+if t.TYPE_CHECKING:
+    ...
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BootstrapArchiveEntry:
+    path: str
+    # offsets are relative to the contents start, right after the header
+    offset: int
+    size: int
+    hash: str
+    is_template: bool
+
+
+class BootstrapArchiveEntryReader(io.RawIOBase):
+    _view: memoryview
+    _position: int
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: t.Any) -> int:
+        size = min(len(buffer), len(self._view) - self._position)
+        buffer[:size] = self._view[self._position : self._position + size]
+        self._position += size
+        return size
+
+    def close(self):
+        self._view.release()
+        super().close()
+
+
+class BootstrapArchive:
+    suffix: t.ClassVar[str] = ".pybootstrap"
+    magic: t.ClassVar[bytes] = b"PYBSARCH"
+    format_version: t.ClassVar[int] = 1
+    # magic and header size
+    prefix_struct: t.ClassVar[struct.Struct] = struct.Struct("<8sI")
+
+    _path: "Path"
+    _directories: list[str]
+    _entries_map: dict[str, BootstrapArchiveEntry]
+    _contents_offset: int
+    _mmap: t.Optional[mmap.mmap] = None
+
+    @classmethod
+    def check_is_archive(cls, path: "Path") -> bool:
+        return path.suffix == cls.suffix and path.is_file()
+
+    @classmethod
+    def dump_header(
+        cls, directories: list[str], entries: list[BootstrapArchiveEntry]
+    ) -> bytes:
+        header = json.dumps(
+            {
+                "format_version": cls.format_version,
+                "directories": directories,
+                "entries": [asdict(entry) for entry in entries],
+            },
+            separators=(",", ":"),
+        ).encode()
+        return cls.prefix_struct.pack(cls.magic, len(header)) + header
+
+    @property
+    def path(self) -> "Path":
+        return self._path
+
+    @property
+    def entries(self) -> list[BootstrapArchiveEntry]:
+        return list(self._entries_map.values())
+
+    def set_path(self, path: "Path"):
+        self._path = path
+
+    def load(self):
+        with self._path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, header_size = self.prefix_struct.unpack_from(self._mmap)
+            if magic != self.magic:
+                raise ValueError(f"{self._path} isn't a bootstrap archive")
+
+            header_offset = self.prefix_struct.size
+            self._contents_offset = header_offset + header_size
+            data = json.loads(self._mmap[header_offset : self._contents_offset])
+            if data["format_version"] != self.format_version:
+                raise ValueError(
+                    "Unsupported bootstrap archive version"
+                    f" {data['format_version']}"
+                )
+            self._directories = data["directories"]
+            self._entries_map = {
+                item["path"]: BootstrapArchiveEntry(**item)
+                for item in data["entries"]
+            }
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        if self._mmap is not None:
+            # contents views are still used by someone, the mapping is
+            # closed by the garbage collector then
+            with suppress(BufferError):
+                self._mmap.close()
+            self._mmap = None
+
+    def get_entry(self, path: "Path") -> BootstrapArchiveEntry:
+        return self._entries_map[path.relative_to(self._path).as_posix()]
+
+    def read(self, path: "Path") -> memoryview:
+        assert self._mmap is not None
+        entry = self.get_entry(path=path)
+        offset = self._contents_offset + entry.offset
+        return memoryview(self._mmap)[offset : offset + entry.size]
+
+    def read_text(self, path: "Path") -> str:
+        with self.read(path=path) as view:
+            return str(view, "utf-8")
+
+    def open(self, path: "Path") -> io.BufferedReader:
+        return io.BufferedReader(
+            BootstrapArchiveEntryReader(self.read(path=path))
+        )
+
+    def walk(self) -> t.Iterator[tuple["Path", list[str], list[str]]]:
+        # the same top-down walking as Path.walk, so pruning directories
+        # names in place skips their subtrees
+        children: dict[str, tuple[list[str], list[str]]] = {".": ([], [])}
+        for directory in self._directories:
+            parent, _, name = directory.rpartition("/")
+            children.setdefault(parent or ".", ([], []))[0].append(name)
+            children.setdefault(directory, ([], []))
+        for entry_path in self._entries_map:
+            parent, _, name = entry_path.rpartition("/")
+            children.setdefault(parent or ".", ([], []))[1].append(name)
+
+        stack = ["."]
+        while stack:
+            rel_path = stack.pop()
+            dirs_names, files_names = children[rel_path]
+            root_path = self._path / rel_path
+            yield root_path, dirs_names, files_names
+
+            stack.extend(
+                f"{rel_path}/{dir_name}" if rel_path != "." else dir_name
+                for dir_name in reversed(dirs_names)
+            )
+
+
+class PackFilesProcessor(CopyFilesProcessor):
+    _directories: list[str]
+    _entries: list[BootstrapArchiveEntry]
+
+    def run(self):
+        self._directories = []
+        self._entries = []
+        # entries are collected in walking order, offsets depend on it
+        self._jobs = 1
+        super().run()
+
+    def finalize(self):
+        super().finalize()
+        archive_path = self._destination_path
+        header = BootstrapArchive.dump_header(
+            directories=self._directories, entries=self._entries
+        )
+        tmp_path = archive_path.with_name(f".{archive_path.name}.{os.getpid()}")
+        try:
+            with tmp_path.open("wb") as archive:
+                archive.write(header)
+                contents_offset = archive.tell()
+                for entry in self._entries:
+                    with (self._source_path / entry.path).open("rb") as source:
+                        shutil.copyfileobj(source, archive)
+                    if (
+                        archive.tell()
+                        != contents_offset + entry.offset + entry.size
+                    ):
+                        raise RuntimeError(
+                            f"{entry.path} is changed while packing"
+                        )
+            os.replace(tmp_path, archive_path)
+        finally:
+            with suppress(FileNotFoundError):
+                tmp_path.unlink()
+        logger.info(
+            "%r. %d files are packed into %r.",
+            self,
+            len(self._entries),
+            archive_path,
+        )
+
+    def process_directory(self, rel_path: "Path", dir_name: str):
+        self._directories.append(rel_path.joinpath(dir_name).as_posix())
+
+    def process_file(self, rel_path: "Path", file_name: str):
+        source_path = self._source_path.joinpath(rel_path, file_name)
+        with source_path.open("rb") as source:
+            content_hash = file_digest(source, "sha256").hexdigest()
+            size = source.tell()
+
+        offset = 0
+        if self._entries:
+            offset = self._entries[-1].offset + self._entries[-1].size
+        self._entries.append(
+            BootstrapArchiveEntry(
+                path=rel_path.joinpath(file_name).as_posix(),
+                offset=offset,
+                size=size,
+                hash=content_hash,
+                is_template=file_name.endswith(".tmpl"),
+            )
+        )
@@ -0,0 +1,322 @@
+__all__ = (
+    "OutputArchive",
+    "TarOutputArchive",
+    "TarGzOutputArchive",
+    "ZipOutputArchive",
+    "ArchivingFilesProcessor",
+)
+
+import gzip
+import io
+import logging
+import shutil
+import stat
+import tarfile
+import time
+import typing as t
+import zipfile
+from pathlib import Path, PurePosixPath
+from tempfile import SpooledTemporaryFile
+
+from .plan import BuildPlanEntry, HashingWriter, PlanningFilesProcessor
+
+if t.TYPE_CHECKING:
+    from typing import BinaryIO
+
+    from .plan import BuildPlan
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutputArchive:
+    # entries metadata doesn't depend on a build time or a user, the same
+    # files are archived into the same bytes. zip dates start from 1980
+    mtime: t.ClassVar[int] = 315532800
+    directory_mode: t.ClassVar[int] = 0o755
+    file_mode: t.ClassVar[int] = 0o644
+
+    def open(self, stream: "BinaryIO"):
+        raise NotImplementedError(f"{self.__class__}.open")
+
+    def add_directory(self, name: str):
+        raise NotImplementedError(f"{self.__class__}.add_directory")
+
+    def add_file(self, name: str, source: "BinaryIO", size: int):
+        raise NotImplementedError(f"{self.__class__}.add_file")
+
+    def close(self):
+        raise NotImplementedError(f"{self.__class__}.close")
+
+
+class TarOutputArchive(OutputArchive):
+    _tar: tarfile.TarFile
+
+    def open(self, stream: "BinaryIO"):
+        # the stream mode doesn't seek, e.g. stdout is a pipe
+        self._tar = tarfile.open(
+            fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT
+        )
+
+    def build_tar_info(self, name: str) -> tarfile.TarInfo:
+        info = tarfile.TarInfo(name=name)
+        info.mtime = self.mtime
+        info.uid = info.gid = 0
+        info.uname = info.gname = ""
+        return info
+
+    def add_directory(self, name: str):
+        info = self.build_tar_info(name=name)
+        info.type = tarfile.DIRTYPE
+        info.mode = self.directory_mode
+        self._tar.addfile(info)
+
+    def add_file(self, name: str, source: "BinaryIO", size: int):
+        info = self.build_tar_info(name=name)
+        info.mode = self.file_mode
+        info.size = size
+        self._tar.addfile(info, source)
+
+    def close(self):
+        self._tar.close()
+
+
+class TarGzOutputArchive(TarOutputArchive):
+    _gzip: gzip.GzipFile
+
+    def open(self, stream: "BinaryIO"):
+        # tarfile writes a current time into gzip headers of streams
+        self._gzip = gzip.GzipFile(
+            filename="", mode="wb", fileobj=stream, mtime=0
+        )
+        super().open(stream=t.cast("BinaryIO", self._gzip))
+
+    def close(self):
+        super().close()
+        self._gzip.close()
+
+
+class ZipStreamWriter:
+    # hides seeking of a stream, so zipfile writes data descriptors after
+    # contents like for pipes
+    _stream: "BinaryIO"
+
+    def __init__(self, stream: "BinaryIO"):
+        self._stream = stream
+
+    def write(self, data: bytes) -> int:
+        return self._stream.write(data)
+
+    def flush(self):
+        self._stream.flush()
+
+
+class HashingReader:
+    # archives read sources once, contents are hashed while they're read
+    _source: "BinaryIO"
+    _writer: HashingWriter
+
+    def __init__(self, source: "BinaryIO", writer: HashingWriter):
+        self._source = source
+        self._writer = writer
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        self._writer.update(data=data)
+        return data
+
+
+class ZipOutputArchive(OutputArchive):
+    _zip: zipfile.ZipFile
+
+    def open(self, stream: "BinaryIO"):
+        # files and pipes get the same bytes
+        self._zip = zipfile.ZipFile(
+            t.cast("BinaryIO", ZipStreamWriter(stream=stream)),
+            mode="w",
+            compression=zipfile.ZIP_DEFLATED,
+        )
+
+    def build_zip_info(self, name: str, mode: int) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(
+            filename=name, date_time=time.gmtime(self.mtime)[:6]
+        )
+        # unix attributes keep modes of extracted files
+        info.create_system = 3
+        info.external_attr = mode << 16
+        return info
+
+    def add_directory(self, name: str):
+        info = self.build_zip_info(
+            name=f"{name}/", mode=stat.S_IFDIR | self.directory_mode
+        )
+        # MS-DOS directory flag
+        info.external_attr |= 0x10
+        self._zip.writestr(info, b"")
+
+    def add_file(self, name: str, source: "BinaryIO", size: int):
+        info = self.build_zip_info(
+            name=name, mode=stat.S_IFREG | self.file_mode
+        )
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.file_size = size
+        with self._zip.open(
+            info, mode="w", force_zip64=size >= zipfile.ZIP64_LIMIT
+        ) as destination:
+            shutil.copyfileobj(source, destination)
+
+    def close(self):
+        self._zip.close()
+
+
+class ArchivingFilesProcessor(PlanningFilesProcessor):
+    archives_classes: t.ClassVar[dict[str, type[OutputArchive]]] = {
+        "tar": TarOutputArchive,
+        "tar.gz": TarGzOutputArchive,
+        "zip": ZipOutputArchive,
+    }
+
+    _archive: OutputArchive
+
+    @classmethod
+    def build_archive(cls, format_name: str) -> OutputArchive:
+        return cls.archives_classes[format_name]()
+
+    def set_archive(self, value: OutputArchive):
+        self._archive = value
+
+    def apply_plan(self, plan: "BuildPlan"):
+        # planned entries are archived without walking a bootstrap
+        self._plan = plan
+        self._destination_path = Path()
+        self.finalize()
+
+    def finalize(self):
+        # walking order depends on a filesystem, sorted entries make
+        # archives reproducible. parents go before their children
+        entries = sorted(
+            self._plan.entries,
+            key=lambda entry: PurePosixPath(entry.destination).parts,
+        )
+        for entry in entries:
+            self.archive_entry(entry=entry)
+        super().finalize()
+        logger.info("%r. %d entries are archived.", self, len(entries))
+
+    def archive_entry(self, entry: BuildPlanEntry):
+        try:
+            self.apply_plan_entry(entry=entry)
+        except Exception as err:
+            self.metrics.increment(counter="failures")
+            logger.exception(
+                "%r. entry %r archiving failed: %r.", self, entry, err
+            )
+
+    def apply_plan_entry(self, entry: BuildPlanEntry):
+        # archived names are checked like paths of built files
+        self.get_plan_path(root_path=Path(), path=entry.destination)
+        match entry.action:
+            case "mkdir":
+                self._archive.add_directory(name=entry.destination)
+                return
+            case "copy":
+                assert entry.source is not None
+                source_path = self.get_plan_path(
+                    root_path=self._source_path, path=entry.source
+                )
+                with (
+                    self.metrics.measure(phase="file_copying"),
+                    self.open_source_file(source_path) as source,
+                ):
+                    writer = self.add_archive_file(
+                        name=entry.destination,
+                        source=t.cast("BinaryIO", source),
+                        size=self.get_source_file_size(source_path),
+                    )
+            case "render":
+                assert entry.source is not None
+                writer = self.archive_template_file(
+                    source_path=self.get_plan_path(
+                        root_path=self._source_path, path=entry.source
+                    ),
+                    name=entry.destination,
+                )
+            case _:
+                raise ValueError(f"Unknown plan entry action {entry.action}")
+
+        # entries collected by walking a bootstrap have no hashes. archives
+        # are streamed, a changed entry fails the whole archive
+        if entry.hash is not None and (writer.size, writer.hash) != (
+            entry.size,
+            entry.hash,
+        ):
+            raise ValueError(
+                f"{entry.destination} differs from the planned one,"
+                " the bootstrap is changed after planning"
+            )
+
+    def add_archive_file(
+        self, name: str, source: "BinaryIO", size: int
+    ) -> HashingWriter:
+        writer = HashingWriter()
+        self._archive.add_file(
+            name=name,
+            source=t.cast("BinaryIO", HashingReader(source, writer=writer)),
+            size=size,
+        )
+        return writer
+
+    def archive_template_file(
+        self, source_path: "Path", name: str
+    ) -> HashingWriter:
+        with self.metrics.measure(phase="template_rendering"):
+            size = self.get_source_file_size(source_path)
+            if size <= self.streaming_threshold:
+                data = self.generate_content_from_template_file(
+                    path=source_path
+                ).encode()
+                writer = self.add_archive_file(
+                    name=name, source=io.BytesIO(data), size=len(data)
+                )
+            else:
+                writer = self.archive_big_template_file(
+                    source_path=source_path, name=name
+                )
+        self.count_rendered_bytes(size=size, written_size=writer.size)
+        return writer
+
+    def archive_big_template_file(
+        self, source_path: "Path", name: str
+    ) -> HashingWriter:
+        # archives need sizes before contents, a rendered content is spooled
+        # to a temporary file after the threshold
+        with SpooledTemporaryFile(max_size=self.streaming_threshold) as buffer:
+            destination = io.TextIOWrapper(
+                t.cast("BinaryIO", buffer), encoding="utf-8"
+            )
+            self.stream_template_file_into(
+                source_path=source_path, destination=destination
+            )
+            destination.flush()
+            destination.detach()
+
+            written_size = buffer.tell()
+            buffer.seek(0)
+            return self.add_archive_file(
+                name=name, source=t.cast("BinaryIO", buffer), size=written_size
+            )
+
+    def process_file(self, rel_path: "Path", file_name: str):
+        # contents are rendered once while archiving, so collected entries
+        # have no sizes and hashes
+        source = rel_path.joinpath(file_name)
+        destination_path = self.build_destination_file_path(
+            rel_path=rel_path, file_name=file_name
+        )
+        self._plan.entries.append(
+            BuildPlanEntry(
+                action="render" if file_name.endswith(".tmpl") else "copy",
+                destination=destination_path.as_posix(),
+                source=source.as_posix(),
+            )
+        )
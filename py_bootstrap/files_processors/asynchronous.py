@@ -0,0 +1,89 @@
+__all__ = (
+    "AsyncFilesProcessorMixin",
+    "AsyncCopyFilesProcessor",
+    "AsyncGenerateFilesProcessor",
+)
+
+import asyncio
+import logging
+import typing as t
+from functools import partial
+
+from .base import BaseFilesProcessor
+from .copy import CopyFilesProcessor
+from .generate import GenerateFilesProcessor
+
+if t.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFilesProcessorMixin(BaseFilesProcessor):
+    _concurrency: int = 8
+    _executor: t.Optional["Executor"] = None
+
+    def set_concurrency(self, value: int):
+        self._concurrency = value
+
+    def set_executor(self, value: "Executor"):
+        self._executor = value
+
+    async def run_async(self):
+        semaphore = asyncio.Semaphore(self._concurrency)
+        # walking is blocking too, the whole source tree is listed in the
+        # executor once
+        tree = await self.run_blocking(
+            semaphore, partial(list, self.walk_source())
+        )
+
+        # directories are created in walking order, so every file task is
+        # started after its parent directory exists
+        tasks: list[asyncio.Task] = []
+        for rel_path, dirs_names, files_names in tree:
+            for dir_name in dirs_names:
+                await self.run_blocking(
+                    semaphore,
+                    partial(
+                        self.handle_directory,
+                        rel_path=rel_path,
+                        dir_name=dir_name,
+                    ),
+                )
+
+            for file_name in files_names:
+                tasks.append(
+                    asyncio.create_task(
+                        self.run_blocking(
+                            semaphore,
+                            partial(
+                                self.handle_file,
+                                rel_path=rel_path,
+                                file_name=file_name,
+                            ),
+                        )
+                    )
+                )
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await self.run_blocking(semaphore, self.finalize)
+
+    async def run_blocking(
+        self, semaphore: asyncio.Semaphore, func: t.Callable[[], t.Any]
+    ) -> t.Any:
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func)
+
+
+class AsyncCopyFilesProcessor(AsyncFilesProcessorMixin, CopyFilesProcessor):
+    pass
+
+
+class AsyncGenerateFilesProcessor(
+    AsyncFilesProcessorMixin, GenerateFilesProcessor
+):
+    pass
@@ -1,20 +1,35 @@
 __all__ = ("BaseFilesProcessor",)
 
 import logging
+import os
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import file_digest
+from pathlib import Path
 
 from py_bootstrap.base.operations import BaseOperation
 
+from .exclusion import ExclusionMatcher
+
 if t.TYPE_CHECKING:
-    from pathlib import Path
+    from importlib.resources.abc import Traversable
+    from io import BufferedReader
+
+    from .archive import BootstrapArchive
 
 
 logger = logging.getLogger(__name__)
 
 
 class BaseFilesProcessor(BaseOperation):
+    ignore_file_name: t.ClassVar[str] = ".bootstrapignore"
+
     _source_path: "Path"
     _destination_path: "Path"
+    _jobs: int = 1
+    _source_archive: t.Optional["BootstrapArchive"] = None
+    _source_traversable: t.Optional["Traversable"] = None
+    _exclusion_matcher: t.Optional["ExclusionMatcher"] = None
 
     def set_source_path(self, source_path: "Path") -> None:
         self._source_path = source_path
@@ -22,70 +37,283 @@ class BaseFilesProcessor(BaseOperation):
     def set_destination_path(self, destination_path: "Path") -> None:
         self._destination_path = destination_path
 
+    def set_jobs(self, value: int) -> None:
+        self._jobs = value
+
+    def set_source_archive(self, value: "BootstrapArchive") -> None:
+        # files are read from the archive, a source path is the archive path
+        self._source_archive = value
+        self._source_path = value.path
+
+    def set_source_traversable(self, value: "Traversable") -> None:
+        if isinstance(value, Path):
+            self.set_source_path(source_path=value)
+            return
+
+        # e.g. a zip file content provided by importlib.resources, a source
+        # path is used for building relative paths only
+        self._source_traversable = value
+        self._source_path = Path(str(value))
+
+    @property
+    def exclusion_matcher(self) -> "ExclusionMatcher":
+        if self._exclusion_matcher is None:
+            matcher = ExclusionMatcher()
+            self.prepare_exclusion_matcher(matcher=matcher)
+            self._exclusion_matcher = matcher
+        return self._exclusion_matcher
+
+    def set_exclusion_matcher(self, value: "ExclusionMatcher"):
+        self._exclusion_matcher = value
+
+    def prepare_exclusion_matcher(self, matcher: "ExclusionMatcher"):
+        patterns = self.read_ignore_patterns()
+        if patterns:
+            matcher.set_ignore_patterns(patterns=patterns)
+
+    def read_ignore_patterns(self) -> list[str]:
+        # only an ignore file of a bootstrap root is read
+        path = self._source_path / self.ignore_file_name
+        try:
+            with self.open_source_file(path) as file:
+                content = file.read().decode()
+        except (OSError, KeyError):
+            return []
+
+        logger.debug("%r. ignore patterns are read from %r.", self, path)
+        return content.splitlines()
+
     def run(self):
-        for root_path, dirs_names, files_names in self._source_path.walk():
+        if self._jobs > 1:
+            self.run_concurrently()
+        else:
+            for rel_path, dirs_names, files_names in self.walk_source():
+                for dir_name in dirs_names:
+                    self.handle_directory(rel_path=rel_path, dir_name=dir_name)
+
+                for file_name in files_names:
+                    self.handle_file(rel_path=rel_path, file_name=file_name)
+
+        self.finalize()
+
+    def run_concurrently(self):
+        # directories are created in walking order, so every file task is
+        # submitted after its parent directory exists
+        with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+            for rel_path, dirs_names, files_names in self.walk_source():
+                for dir_name in dirs_names:
+                    self.handle_directory(rel_path=rel_path, dir_name=dir_name)
+
+                for file_name in files_names:
+                    executor.submit(
+                        self.handle_file, rel_path=rel_path, file_name=file_name
+                    )
+
+    def walk_source(self) -> t.Iterator[tuple["Path", list[str], list[str]]]:
+        if self._source_archive is not None:
+            walk = self._source_archive.walk()
+        elif self._source_traversable is not None:
+            walk = self.walk_source_traversable(
+                traversable=self._source_traversable
+            )
+        else:
+            walk = self._source_path.walk()
+
+        # the time of walking only is measured, not the time of processing
+        # between steps
+        walk_iterator = iter(walk)
+        while True:
+            with self.metrics.measure(phase="directory_walking"):
+                step = next(walk_iterator, None)
+            if step is None:
+                return
+
+            root_path, dirs_names, files_names = step
             logger.debug("%r. process %r source root.", self, root_path)
             rel_path = root_path.relative_to(self._source_path)
+            self.prune_directories(rel_path=rel_path, dirs_names=dirs_names)
+            self.prune_files(rel_path=rel_path, files_names=files_names)
+            yield rel_path, dirs_names, files_names
 
-            for dir_name in dirs_names:
-                if not self.check_directory_for_processing(
-                    rel_path=rel_path, dir_name=dir_name
-                ):
-                    logger.debug(
-                        "%r. directory %r/%r is skipped from processing.",
-                        self,
-                        rel_path,
-                        dir_name,
-                    )
-                    continue
-
-                try:
-                    self.process_directory(rel_path=rel_path, dir_name=dir_name)
-                except Exception as err:
-                    logger.exception(
-                        "%r. directory %r/%r processing failed: %r.",
-                        self,
-                        rel_path,
-                        dir_name,
-                        err,
-                    )
-                else:
-                    logger.debug(
-                        "%r. directory %r/%r is processed properly.",
-                        self,
-                        rel_path,
-                        dir_name,
-                    )
+    def prune_directories(self, rel_path: "Path", dirs_names: list[str]):
+        # names are removed in place, walkers don't descend into subtrees of
+        # removed directories
+        walked_dirs_names = []
+        for dir_name in dirs_names:
+            if self.check_directory_for_walking(
+                rel_path=rel_path, dir_name=dir_name
+            ):
+                walked_dirs_names.append(dir_name)
+                continue
 
-            for file_name in files_names:
-                if not self.check_file_for_processing(
-                    rel_path=rel_path, file_name=file_name
-                ):
-                    logger.debug(
-                        "%r. file %r/%r is skipped from processing.",
-                        self,
-                        rel_path,
-                        file_name,
-                    )
-                    continue
-
-                try:
-                    self.process_file(rel_path=rel_path, file_name=file_name)
-                except Exception as err:
-                    logger.exception(
-                        "%r. file %r/%r processing failed: %r",
-                        self,
-                        rel_path,
-                        file_name,
-                        err,
-                    )
+            logger.debug(
+                "%r. directory %r/%r is pruned from walking.",
+                self,
+                rel_path,
+                dir_name,
+            )
+            self.metrics.increment(counter="directories_skipped")
+        dirs_names[:] = walked_dirs_names
+
+    def prune_files(self, rel_path: "Path", files_names: list[str]):
+        walked_files_names = []
+        for file_name in files_names:
+            if self.check_file_for_walking(
+                rel_path=rel_path, file_name=file_name
+            ):
+                walked_files_names.append(file_name)
+                continue
+
+            logger.debug(
+                "%r. file %r/%r is pruned from walking.",
+                self,
+                rel_path,
+                file_name,
+            )
+            self.metrics.increment(counter="files_skipped")
+        files_names[:] = walked_files_names
+
+    def walk_source_traversable(
+        self, traversable: "Traversable"
+    ) -> t.Iterator[tuple["Path", list[str], list[str]]]:
+        # the same top-down walking as Path.walk
+        stack = [(self._source_path, traversable)]
+        while stack:
+            root_path, root = stack.pop()
+            dirs_names: list[str] = []
+            files_names: list[str] = []
+            for child in root.iterdir():
+                if child.is_dir():
+                    dirs_names.append(child.name)
                 else:
-                    logger.debug(
-                        "%r. file %r/%r is processed properly.",
-                        self,
-                        rel_path,
-                        file_name,
-                    )
+                    files_names.append(child.name)
+            yield root_path, dirs_names, files_names
+
+            stack.extend(
+                (root_path / dir_name, root.joinpath(dir_name))
+                for dir_name in reversed(dirs_names)
+            )
+
+    def finalize(self):
+        pass
+
+    def get_source_traversable(self, path: "Path") -> "Traversable":
+        assert self._source_traversable is not None
+        return self._source_traversable.joinpath(
+            *path.relative_to(self._source_path).parts
+        )
+
+    def get_source_stat_path(self, path: "Path") -> "Path":
+        # archived files change together with their archive
+        if self._source_archive is not None:
+            return self._source_archive.path
+        if self._source_traversable is not None:
+            for parent_path in path.parents:
+                if parent_path.is_file():
+                    return parent_path
+        return path
+
+    def get_source_file_size(self, path: "Path") -> int:
+        if self._source_archive is not None:
+            return self._source_archive.get_entry(path=path).size
+        if self._source_traversable is not None:
+            with self.open_source_file(path) as file:
+                return file.seek(0, os.SEEK_END)
+        return path.stat().st_size
+
+    def get_source_file_hash(self, path: "Path") -> str:
+        if self._source_archive is not None:
+            return self._source_archive.get_entry(path=path).hash
+        with self.open_source_file(path) as file:
+            return file_digest(file, "sha256").hexdigest()
+
+    def open_source_file(self, path: "Path") -> "BufferedReader":
+        if self._source_archive is not None:
+            return self._source_archive.open(path=path)
+        if self._source_traversable is not None:
+            return t.cast(
+                "BufferedReader", self.get_source_traversable(path).open("rb")
+            )
+        return path.open("rb")
+
+    def handle_directory(self, rel_path: "Path", dir_name: str):
+        if not self.check_directory_for_processing(
+            rel_path=rel_path, dir_name=dir_name
+        ):
+            logger.debug(
+                "%r. directory %r/%r is skipped from processing.",
+                self,
+                rel_path,
+                dir_name,
+            )
+            self.metrics.increment(counter="directories_skipped")
+            return
+
+        try:
+            with self.metrics.measure(phase="directory_creation"):
+                self.process_directory(rel_path=rel_path, dir_name=dir_name)
+        except Exception as err:
+            self.metrics.increment(counter="failures")
+            logger.exception(
+                "%r. directory %r/%r processing failed: %r.",
+                self,
+                rel_path,
+                dir_name,
+                err,
+            )
+        else:
+            self.metrics.increment(counter="directories")
+            logger.debug(
+                "%r. directory %r/%r is processed properly.",
+                self,
+                rel_path,
+                dir_name,
+            )
+
+    def handle_file(self, rel_path: "Path", file_name: str):
+        if not self.check_file_for_processing(
+            rel_path=rel_path, file_name=file_name
+        ):
+            logger.debug(
+                "%r. file %r/%r is skipped from processing.",
+                self,
+                rel_path,
+                file_name,
+            )
+            self.metrics.increment(counter="files_skipped")
+            return
+
+        try:
+            self.process_file(rel_path=rel_path, file_name=file_name)
+        except Exception as err:
+            self.metrics.increment(counter="failures")
+            logger.exception(
+                "%r. file %r/%r processing failed: %r",
+                self,
+                rel_path,
+                file_name,
+                err,
+            )
+        else:
+            self.metrics.increment(counter="files")
+            logger.debug(
+                "%r. file %r/%r is processed properly.",
+                self,
+                rel_path,
+                file_name,
+            )
+
+    def check_directory_for_walking(
+        self, rel_path: "Path", dir_name: str
+    ) -> bool:
+        return not self.exclusion_matcher.check_directory_is_excluded(
+            rel_path=rel_path, dir_name=dir_name
+        )
+
+    def check_file_for_walking(self, rel_path: "Path", file_name: str) -> bool:
+        return not self.exclusion_matcher.check_file_is_excluded(
+            rel_path=rel_path, file_name=file_name
+        )
 
     def check_directory_for_processing(
         self, rel_path: "Path", dir_name: str
@@ -0,0 +1,253 @@
+__all__ = ("FilesCopier",)
+
+import errno
+import logging
+import os
+import sys
+import typing as t
+from collections import Counter
+from threading import Lock
+
+from py_bootstrap.base.metrics import OperationMetrics
+
+if t.TYPE_CHECKING:
+    from io import BufferedIOBase, BufferedReader, BufferedWriter
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+
+class FilesCopier:
+    strategies: t.ClassVar[tuple[str, ...]] = (
+        "reflink",
+        "copy_file_range",
+        "sendfile",
+        "buffered",
+    )
+    link_modes: t.ClassVar[tuple[str, ...]] = (
+        "copy",
+        "hardlink",
+        "reflink",
+        "symlink",
+    )
+    # linked files share content with their sources
+    sharing_link_modes: t.ClassVar[frozenset[str]] = frozenset(
+        ("hardlink", "symlink")
+    )
+    buffer_size: t.ClassVar[int] = 1024 * 1024
+    chunk_size: t.ClassVar[int] = 1024 * 1024 * 1024
+
+    # the strategy isn't supported by the platform or the filesystem at all
+    disabling_errnos: t.ClassVar[frozenset[int]] = frozenset(
+        (errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTTY, errno.EPERM)
+    )
+    # the strategy isn't applicable for the current pair of files only
+    skipping_errnos: t.ClassVar[frozenset[int]] = frozenset(
+        (errno.EXDEV, errno.EINVAL, errno.EBADF, errno.ETXTBSY)
+    )
+    # linking isn't possible, files are copied instead
+    linking_fallback_errnos: t.ClassVar[frozenset[int]] = (
+        disabling_errnos
+        | skipping_errnos
+        | frozenset((errno.EMLINK, errno.EACCES))
+    )
+
+    _lock: Lock
+    _disabled_strategies: set[str]
+    _stats: Counter[str]
+    _link_mode: str = "copy"
+    _metrics: t.Optional["OperationMetrics"] = None
+
+    def __init__(self):
+        self._lock = Lock()
+        self._disabled_strategies = {
+            strategy
+            for strategy in self.strategies
+            if not self.check_strategy_is_available(strategy=strategy)
+        }
+        self._stats = Counter()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    @property
+    def metrics(self) -> "OperationMetrics":
+        if self._metrics is None:
+            self._metrics = OperationMetrics()
+        return self._metrics
+
+    def set_link_mode(self, value: str):
+        self._link_mode = value
+
+    def set_metrics(self, value: "OperationMetrics"):
+        self._metrics = value
+
+    @classmethod
+    def check_strategy_is_available(cls, strategy: str) -> bool:
+        match strategy:
+            case "reflink":
+                return sys.platform == "linux"
+            case "copy_file_range":
+                return hasattr(os, "copy_file_range")
+            case "sendfile":
+                return sys.platform == "linux" and hasattr(os, "sendfile")
+            case _:
+                return True
+
+    def copy(self, source_path: "Path", destination_path: "Path") -> str:
+        if self._link_mode == "copy":
+            return self.copy_content(
+                source_path=source_path, destination_path=destination_path
+            )
+
+        method = getattr(self, f"link_by_{self._link_mode}")
+        try:
+            destination_path.unlink(missing_ok=True)
+            method(source_path=source_path, destination_path=destination_path)
+        except OSError as err:
+            if err.errno not in self.linking_fallback_errnos:
+                raise
+            logger.debug(
+                "%r. unable to %s %r, copy it instead: %r.",
+                self,
+                self._link_mode,
+                source_path,
+                err,
+            )
+            return self.copy_content(
+                source_path=source_path, destination_path=destination_path
+            )
+
+        with self._lock:
+            self._stats[self._link_mode] += 1
+        return self._link_mode
+
+    def write(self, data: memoryview, destination_path: "Path") -> str:
+        # archived files are written right from a mapped archive
+        self.unlink_linked_destination(destination_path=destination_path)
+        destination_path.write_bytes(data)
+        self.count_copied_bytes(size=data.nbytes)
+        with self._lock:
+            self._stats["mmap"] += 1
+        return "mmap"
+
+    def copy_stream(
+        self, source: "BufferedIOBase", destination_path: "Path"
+    ) -> str:
+        # a source without a file descriptor, e.g. a zip file content
+        self.unlink_linked_destination(destination_path=destination_path)
+        with destination_path.open("wb") as destination:
+            self.copy_by_buffered(
+                source=t.cast("BufferedReader", source),
+                destination=destination,
+            )
+            self.count_copied_bytes(size=destination.tell())
+        with self._lock:
+            self._stats["buffered"] += 1
+        return "buffered"
+
+    def copy_content(
+        self, source_path: "Path", destination_path: "Path"
+    ) -> str:
+        self.unlink_linked_destination(destination_path=destination_path)
+
+        with (
+            source_path.open("rb") as source,
+            destination_path.open("wb") as destination,
+        ):
+            for strategy in self.strategies:
+                if strategy in self._disabled_strategies:
+                    continue
+
+                method = getattr(self, f"copy_by_{strategy}")
+                try:
+                    method(source=source, destination=destination)
+                except OSError as err:
+                    if not self.handle_strategy_error(strategy, err=err):
+                        raise
+                    source.seek(0)
+                    destination.seek(0)
+                    destination.truncate()
+                    continue
+
+                # linked files aren't read and written, copied ones only
+                self.count_copied_bytes(
+                    size=os.fstat(destination.fileno()).st_size
+                )
+                with self._lock:
+                    self._stats[strategy] += 1
+                return strategy
+
+        raise RuntimeError("No copying strategy is available")
+
+    def count_copied_bytes(self, size: int):
+        self.metrics.increment(counter="bytes_read", value=size)
+        self.metrics.increment(counter="bytes_written", value=size)
+
+    def unlink_linked_destination(self, destination_path: "Path"):
+        # never write through an existed link, it changes the origin file
+        if destination_path.is_symlink() or (
+            destination_path.exists() and destination_path.stat().st_nlink > 1
+        ):
+            destination_path.unlink()
+
+    def handle_strategy_error(self, strategy: str, err: OSError) -> bool:
+        if err.errno in self.disabling_errnos:
+            logger.debug(
+                "%r. %s strategy is disabled: %r.", self, strategy, err
+            )
+            with self._lock:
+                self._disabled_strategies.add(strategy)
+            return True
+        if err.errno in self.skipping_errnos:
+            logger.debug("%r. %s strategy is skipped: %r.", self, strategy, err)
+            return True
+        return False
+
+    def link_by_hardlink(self, source_path: "Path", destination_path: "Path"):
+        destination_path.hardlink_to(source_path)
+
+    def link_by_symlink(self, source_path: "Path", destination_path: "Path"):
+        destination_path.symlink_to(source_path.resolve())
+
+    def link_by_reflink(self, source_path: "Path", destination_path: "Path"):
+        with (
+            source_path.open("rb") as source,
+            destination_path.open("wb") as destination,
+        ):
+            self.copy_by_reflink(source=source, destination=destination)
+
+    def copy_by_reflink(
+        self, source: "BufferedReader", destination: "BufferedWriter"
+    ):
+        import fcntl
+
+        fcntl.ioctl(destination.fileno(), FICLONE, source.fileno())
+
+    def copy_by_copy_file_range(
+        self, source: "BufferedReader", destination: "BufferedWriter"
+    ):
+        source_fd, destination_fd = source.fileno(), destination.fileno()
+        while os.copy_file_range(source_fd, destination_fd, self.chunk_size):
+            pass
+
+    def copy_by_sendfile(
+        self, source: "BufferedReader", destination: "BufferedWriter"
+    ):
+        source_fd, destination_fd = source.fileno(), destination.fileno()
+        while os.sendfile(destination_fd, source_fd, None, self.chunk_size):
+            pass
+
+    def copy_by_buffered(
+        self, source: "BufferedReader", destination: "BufferedWriter"
+    ):
+        buffer = bytearray(self.buffer_size)
+        view = memoryview(buffer)
+        while size := source.readinto(buffer):
+            destination.write(view[:size])
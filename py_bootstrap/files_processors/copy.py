@@ -2,13 +2,17 @@ __all__ = ("CopyFilesProcessor",)
 
 import logging
 import typing as t
-from shutil import copyfile
 
 from .base import BaseFilesProcessor
+from .copier import FilesCopier
 
 if t.TYPE_CHECKING:
     from pathlib import Path
 
+    from py_bootstrap.base.metrics import OperationMetrics
+
+    from .exclusion import ExclusionMatcher
+
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +21,42 @@ class CopyFilesProcessor(BaseFilesProcessor):
     excluded_directories: list[str] = ["__pycache__", ".DS_Store"]
     excluded_file_extensions: list[str] = [".pyc", ".pyd", ".pyo"]
 
+    _files_copier: t.Optional["FilesCopier"] = None
+
+    def set_files_copier(self, value: "FilesCopier"):
+        self._files_copier = value
+        value.set_metrics(value=self.metrics)
+
+    def set_metrics(self, value: "OperationMetrics"):
+        super().set_metrics(value=value)
+        if self._files_copier is not None:
+            self._files_copier.set_metrics(value=value)
+
+    @property
+    def files_copier(self) -> "FilesCopier":
+        if self._files_copier is None:
+            self._files_copier = FilesCopier()
+            self._files_copier.set_metrics(value=self.metrics)
+        return self._files_copier
+
+    def prepare_exclusion_matcher(self, matcher: "ExclusionMatcher"):
+        super().prepare_exclusion_matcher(matcher=matcher)
+        matcher.set_excluded_directories(names=self.excluded_directories)
+        matcher.set_excluded_files_extensions(
+            extensions=self.excluded_file_extensions
+        )
+
+    def finalize(self):
+        super().finalize()
+        logger.info(
+            "%r. files copying strategies: %r.", self, self.files_copier.stats
+        )
+
     def check_directory_for_processing(
         self, rel_path: "Path", dir_name: str
     ) -> bool:
-        return dir_name not in self.excluded_directories
+        # excluded directories aren't walked at all
+        return True
 
     def process_directory(self, rel_path: "Path", dir_name: str):
         path = self._destination_path.joinpath(rel_path, dir_name)
@@ -29,17 +65,31 @@ class CopyFilesProcessor(BaseFilesProcessor):
     def check_file_for_processing(
         self, rel_path: "Path", file_name: str
     ) -> bool:
-        for excluded_dir in self.excluded_directories:
-            if excluded_dir in rel_path.as_posix():
-                return False
-
-        for file_extension in self.excluded_file_extensions:
-            if file_name.endswith(file_extension):
-                return False
-
+        # excluded files aren't walked at all
         return True
 
     def process_file(self, rel_path: "Path", file_name: str):
         source_path = self._source_path.joinpath(rel_path, file_name)
         destination_path = self._destination_path.joinpath(rel_path, file_name)
-        copyfile(source_path, destination_path)
+        self.copy_source_file(
+            source_path=source_path, destination_path=destination_path
+        )
+
+    def copy_source_file(self, source_path: "Path", destination_path: "Path"):
+        # archived and traversable files can't be linked, their content is
+        # written
+        with self.metrics.measure(phase="file_copying"):
+            if self._source_archive is not None:
+                with self._source_archive.read(path=source_path) as data:
+                    self.files_copier.write(
+                        data=data, destination_path=destination_path
+                    )
+            elif self._source_traversable is not None:
+                with self.open_source_file(source_path) as source:
+                    self.files_copier.copy_stream(
+                        source=source, destination_path=destination_path
+                    )
+            else:
+                self.files_copier.copy(
+                    source_path=source_path, destination_path=destination_path
+                )
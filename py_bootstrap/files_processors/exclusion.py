@@ -0,0 +1,198 @@
+__all__ = ("ExclusionMatcher",)
+
+import logging
+import re
+import typing as t
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+# negated, an expression of files and directories, an expression of
+# directories only
+IgnoreRulesGroup = tuple[
+    bool, t.Optional["re.Pattern[str]"], t.Optional["re.Pattern[str]"]
+]
+
+
+class ExclusionMatcher:
+    _directories_pattern: t.Optional["re.Pattern[str]"] = None
+    _files_pattern: t.Optional["re.Pattern[str]"] = None
+    _ignore_rules_groups: tuple[IgnoreRulesGroup, ...] = ()
+
+    def set_excluded_directories(self, names: t.Iterable[str]):
+        # names are matched entirely, e.g. my__pycache__tools isn't excluded
+        # by __pycache__
+        self._directories_pattern = self.compile_alternatives(
+            alternatives=[re.escape(name) for name in names]
+        )
+
+    def set_excluded_files_extensions(self, extensions: t.Iterable[str]):
+        self._files_pattern = self.compile_alternatives(
+            alternatives=[re.escape(extension) for extension in extensions],
+            prefix=".*",
+        )
+
+    def set_ignore_patterns(self, patterns: t.Iterable[str]):
+        # the last matching rule decides like in .gitignore files. rules of
+        # the same kind in a row are matched by one expression, so a file
+        # without negated rules is matched once
+        groups: list[tuple[bool, list[str], list[str]]] = []
+        for pattern in patterns:
+            rule = self.translate_ignore_pattern(pattern=pattern)
+            if rule is None:
+                continue
+
+            negated, directory_only, expression = rule
+            if not groups or groups[-1][0] != negated:
+                groups.append((negated, [], []))
+            _, expressions, directories_expressions = groups[-1]
+            if directory_only:
+                directories_expressions.append(expression)
+            else:
+                expressions.append(expression)
+
+        self._ignore_rules_groups = tuple(
+            (
+                negated,
+                self.compile_alternatives(alternatives=expressions),
+                self.compile_alternatives(alternatives=directories_expressions),
+            )
+            for negated, expressions, directories_expressions in groups
+        )
+        logger.debug(
+            "%r. %d ignore rules groups are compiled.",
+            self,
+            len(self._ignore_rules_groups),
+        )
+
+    @staticmethod
+    def compile_alternatives(
+        alternatives: list[str], prefix: str = ""
+    ) -> t.Optional["re.Pattern[str]"]:
+        if not alternatives:
+            return None
+        return re.compile(f"{prefix}(?:{'|'.join(alternatives)})", re.DOTALL)
+
+    @classmethod
+    def translate_ignore_pattern(
+        cls, pattern: str
+    ) -> t.Optional[tuple[bool, bool, str]]:
+        # trailing spaces are ignored unless they are escaped
+        stripped_pattern = pattern.rstrip(" ")
+        if stripped_pattern.endswith("\\") and stripped_pattern != pattern:
+            stripped_pattern += " "
+        pattern = stripped_pattern
+        if not pattern or pattern.startswith("#"):
+            return None
+
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+
+        directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if not pattern:
+            return None
+
+        # patterns with a slash at the beginning or in the middle are
+        # relative to a bootstrap root, others match names at any level
+        is_anchored = "/" in pattern
+        expression = cls.translate_glob(pattern=pattern.removeprefix("/"))
+        if not is_anchored:
+            expression = f"(?:.*/)?{expression}"
+        return negated, directory_only, expression
+
+    @staticmethod
+    def translate_glob(pattern: str) -> str:
+        parts = []
+        index, length = 0, len(pattern)
+        while index < length:
+            char = pattern[index]
+            if (
+                pattern.startswith("**", index)
+                and (index == 0 or pattern[index - 1] == "/")
+                and (index + 2 == length or pattern[index + 2] == "/")
+            ):
+                if index + 2 == length:
+                    # a trailing /** matches everything inside
+                    parts.append(".*")
+                    index += 2
+                else:
+                    # a leading **/ and a middle /**/ match zero or more
+                    # directories
+                    parts.append("(?:.*/)?")
+                    index += 3
+            elif char == "*":
+                parts.append("[^/]*")
+                index += 1
+            elif char == "?":
+                parts.append("[^/]")
+                index += 1
+            elif char == "[":
+                end = index + 1
+                if end < length and pattern[end] in "!^":
+                    end += 1
+                if end < length and pattern[end] == "]":
+                    end += 1
+                while end < length and pattern[end] != "]":
+                    end += 1
+                if end >= length:
+                    parts.append(re.escape(char))
+                    index += 1
+                    continue
+
+                chars = pattern[index + 1 : end].replace("\\", "\\\\")
+                if chars[0] in "!^":
+                    chars = f"^{chars[1:]}"
+                parts.append(f"(?!/)[{chars}]")
+                index = end + 1
+            elif char == "\\" and index + 1 < length:
+                parts.append(re.escape(pattern[index + 1]))
+                index += 2
+            else:
+                parts.append(re.escape(char))
+                index += 1
+        return "".join(parts)
+
+    def check_directory_is_excluded(
+        self, rel_path: "Path", dir_name: str
+    ) -> bool:
+        if (
+            self._directories_pattern is not None
+            and self._directories_pattern.fullmatch(dir_name) is not None
+        ):
+            return True
+        return self.check_path_is_ignored(
+            rel_path=rel_path, name=dir_name, is_directory=True
+        )
+
+    def check_file_is_excluded(self, rel_path: "Path", file_name: str) -> bool:
+        if (
+            self._files_pattern is not None
+            and self._files_pattern.fullmatch(file_name) is not None
+        ):
+            return True
+        return self.check_path_is_ignored(
+            rel_path=rel_path, name=file_name, is_directory=False
+        )
+
+    def check_path_is_ignored(
+        self, rel_path: "Path", name: str, is_directory: bool
+    ) -> bool:
+        if not self._ignore_rules_groups:
+            return False
+
+        path = "/".join((*rel_path.parts, name))
+        for negated, pattern, directories_pattern in reversed(
+            self._ignore_rules_groups
+        ):
+            if (pattern is not None and pattern.fullmatch(path)) or (
+                is_directory
+                and directories_pattern is not None
+                and directories_pattern.fullmatch(path)
+            ):
+                return not negated
+        return False
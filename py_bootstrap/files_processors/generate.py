@@ -1,21 +1,37 @@
 __all__ = ("GenerateFilesProcessor",)
 
+import io
 import logging
+import os
 import typing as t
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from hashlib import file_digest, sha256
+from pathlib import Path, PurePosixPath
+from threading import get_ident
 
 from .copy import CopyFilesProcessor
+from .templates import StreamingTemplateRenderer, TemplatesCache
 
 if t.TYPE_CHECKING:
-    ...
+    from typing import TextIO
+
+    from .manifest import BuildManifest
+    from .plan import BuildPlan, BuildPlanEntry
 
 
 logger = logging.getLogger(__name__)
 
 
 class GenerateFilesProcessor(CopyFilesProcessor):
+    # bigger templates are rendered chunk by chunk without caching
+    streaming_threshold: t.ClassVar[int] = 1024 * 1024
+
     _context: dict[str, str]
     _entry_point_file_name: str
+    _templates_cache: t.Optional["TemplatesCache"] = None
+    _manifest: t.Optional["BuildManifest"] = None
 
     def set_context(self, value: dict[str, str]):
         self._context = value
@@ -23,9 +39,189 @@ class GenerateFilesProcessor(CopyFilesProcessor):
     def set_entry_point_file_name(self, value: str):
         self._entry_point_file_name = value
 
+    def set_templates_cache(self, value: "TemplatesCache"):
+        self._templates_cache = value
+
+    def set_manifest(self, value: "BuildManifest"):
+        self._manifest = value
+
+    @property
+    def templates_cache(self) -> "TemplatesCache":
+        if self._templates_cache is None:
+            self._templates_cache = TemplatesCache()
+        return self._templates_cache
+
+    def finalize(self):
+        super().finalize()
+        self.templates_cache.save()
+
+    def apply_plan(self, plan: "BuildPlan"):
+        # directories go before their files in a plan, so they're created
+        # in order and files are processed concurrently
+        with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+            for entry in plan.entries:
+                if entry.action == "mkdir":
+                    self.handle_plan_entry(entry=entry)
+                else:
+                    executor.submit(self.handle_plan_entry, entry=entry)
+        self.finalize()
+
+    def handle_plan_entry(self, entry: "BuildPlanEntry"):
+        try:
+            self.apply_plan_entry(entry=entry)
+        except Exception as err:
+            self.metrics.increment(counter="failures")
+            logger.exception(
+                "%r. plan entry %r applying failed: %r.", self, entry, err
+            )
+        else:
+            self.metrics.increment(
+                counter="directories" if entry.action == "mkdir" else "files"
+            )
+            logger.debug("%r. plan entry %r is applied properly.", self, entry)
+
+    def get_plan_path(self, root_path: "Path", path: str) -> "Path":
+        # plans are loaded from files, their paths never leave the roots
+        plan_path = PurePosixPath(path)
+        if plan_path.is_absolute() or ".." in plan_path.parts:
+            raise ValueError(f"Plan path {path} is outside of {root_path}")
+        return root_path / plan_path
+
+    def get_plan_destination_path(self, entry: "BuildPlanEntry") -> "Path":
+        destination_path = self.get_plan_path(
+            root_path=self._destination_path, path=entry.destination
+        )
+        # symlinks in the destination don't lead outside of it either
+        if not destination_path.resolve().is_relative_to(
+            self._destination_path.resolve()
+        ):
+            raise ValueError(
+                f"Plan path {entry.destination} is outside of"
+                f" {self._destination_path}"
+            )
+        return destination_path
+
+    def apply_plan_entry(self, entry: "BuildPlanEntry"):
+        destination_path = self.get_plan_destination_path(entry=entry)
+        match entry.action:
+            case "mkdir":
+                with self.metrics.measure(phase="directory_creation"):
+                    destination_path.mkdir(parents=True, exist_ok=True)
+                return
+            case "copy" | "render" if self._manifest is not None:
+                assert entry.source is not None
+                is_written = self.generate_file_incrementally(
+                    source=entry.source,
+                    destination_path=destination_path,
+                    is_template=entry.action == "render",
+                )
+                if not is_written:
+                    return
+            case "copy":
+                assert entry.source is not None
+                self.copy_source_file(
+                    source_path=self.get_plan_path(
+                        root_path=self._source_path, path=entry.source
+                    ),
+                    destination_path=destination_path,
+                )
+            case "render":
+                assert entry.source is not None
+                self.generate_file_from_template_file(
+                    source_path=self.get_plan_path(
+                        root_path=self._source_path, path=entry.source
+                    ),
+                    destination_path=destination_path,
+                )
+            case _:
+                raise ValueError(f"Unknown plan entry action {entry.action}")
+
+        if not self.is_planned_file(path=destination_path, entry=entry):
+            # the bootstrap is changed after planning, a partial build is
+            # reported as failed instead of keeping unplanned contents
+            destination_path.unlink()
+            raise ValueError(
+                f"{destination_path} differs from the planned one,"
+                " the bootstrap is changed after planning"
+            )
+
+    def is_planned_file(self, path: "Path", entry: "BuildPlanEntry") -> bool:
+        if path.stat().st_size != entry.size:
+            return False
+        if entry.hash is None:
+            return True
+        with path.open("rb") as file:
+            return file_digest(file, "sha256").hexdigest() == entry.hash
+
     def generate_content_from_template(self, template: str) -> str:
         return template.format(**self._context)
 
+    def generate_content_from_template_file(self, path: "Path") -> str:
+        if self._source_archive is not None:
+            # archives keep contents hashes, archived templates are
+            # compiled once per content
+            compiled = self.templates_cache.get_or_compile(
+                content_hash=self._source_archive.get_entry(path=path).hash,
+                read_template=partial(
+                    self._source_archive.read_text, path=path
+                ),
+            )
+        elif self._source_traversable is not None:
+            template = self.get_source_traversable(path).read_text(
+                encoding="utf-8"
+            )
+            compiled = self.templates_cache.get_or_compile(
+                content_hash=sha256(template.encode()).hexdigest(),
+                read_template=lambda: template,
+            )
+        else:
+            compiled = self.templates_cache.get(path=path)
+        return compiled.render(context=self._context)
+
+    def generate_file_from_template_file(
+        self, source_path: "Path", destination_path: "Path"
+    ):
+        with self.metrics.measure(phase="template_rendering"):
+            size = self.get_source_file_size(source_path)
+            if size <= self.streaming_threshold:
+                data = self.generate_content_from_template_file(
+                    path=source_path
+                ).encode()
+                destination_path.write_bytes(data)
+                written_size = len(data)
+            else:
+                self.stream_template_file(
+                    source_path=source_path, destination_path=destination_path
+                )
+                written_size = destination_path.stat().st_size
+        self.count_rendered_bytes(size=size, written_size=written_size)
+
+    def count_rendered_bytes(self, size: int, written_size: int):
+        self.metrics.increment(counter="bytes_read", value=size)
+        self.metrics.increment(counter="bytes_written", value=written_size)
+
+    def stream_template_file(
+        self, source_path: "Path", destination_path: "Path"
+    ):
+        try:
+            with destination_path.open("w", encoding="utf-8") as destination:
+                self.stream_template_file_into(
+                    source_path=source_path, destination=destination
+                )
+        except Exception:
+            destination_path.unlink(missing_ok=True)
+            raise
+
+    def stream_template_file_into(
+        self, source_path: "Path", destination: "TextIO"
+    ):
+        renderer = StreamingTemplateRenderer()
+        renderer.set_context(value=self._context)
+        with io.TextIOWrapper(
+            self.open_source_file(source_path), encoding="utf-8"
+        ) as source:
+            renderer.render(source=source, destination=destination)
+
     def process_directory(self, rel_path: "Path", dir_name: str):
         path = self._destination_path.joinpath(rel_path, dir_name)
         path = Path(
@@ -38,28 +234,152 @@ class GenerateFilesProcessor(CopyFilesProcessor):
     ) -> bool:
         if file_name == self._entry_point_file_name:
             return False
+        # an ignore file belongs to a bootstrap, not to generated projects
+        if file_name == self.ignore_file_name and not rel_path.parts:
+            return False
         return super().check_file_for_processing(
             rel_path=rel_path, file_name=file_name
         )
 
     def process_file(self, rel_path: "Path", file_name: str):
-        if file_name.endswith(".tmpl"):
-            source_path = self._source_path.joinpath(rel_path, file_name)
-
-            file_name = file_name.removesuffix(".tmpl")
-            destination_path = self._destination_path.joinpath(
-                rel_path, file_name
+        if self._manifest is not None:
+            self.process_file_incrementally(
+                rel_path=rel_path, file_name=file_name
             )
-            destination_path = Path(
-                self.generate_content_from_template(
-                    template=destination_path.as_posix()
-                )
+        elif file_name.endswith(".tmpl"):
+            self.generate_file_from_template_file(
+                source_path=self._source_path.joinpath(rel_path, file_name),
+                destination_path=self.build_destination_file_path(
+                    rel_path=rel_path, file_name=file_name
+                ),
+            )
+        else:
+            super().process_file(rel_path=rel_path, file_name=file_name)
+
+    def build_destination_file_path(
+        self, rel_path: "Path", file_name: str
+    ) -> "Path":
+        if not file_name.endswith(".tmpl"):
+            return self._destination_path.joinpath(rel_path, file_name)
+
+        destination_path = self._destination_path.joinpath(
+            rel_path, file_name.removesuffix(".tmpl")
+        )
+        return Path(
+            self.generate_content_from_template(
+                template=destination_path.as_posix()
             )
+        )
+
+    def process_file_incrementally(self, rel_path: "Path", file_name: str):
+        self.generate_file_incrementally(
+            source=rel_path.joinpath(file_name).as_posix(),
+            destination_path=self.build_destination_file_path(
+                rel_path=rel_path, file_name=file_name
+            ),
+            is_template=file_name.endswith(".tmpl"),
+        )
+
+    def generate_file_incrementally(
+        self, source: str, destination_path: "Path", is_template: bool
+    ) -> bool:
+        assert self._manifest is not None
+        source_path = self.get_plan_path(
+            root_path=self._source_path, path=source
+        )
+        stat_source_path = self.get_source_stat_path(source_path)
+
+        if self._manifest.check_is_actual(
+            source=source,
+            source_path=stat_source_path,
+            destination_path=destination_path,
+            is_template=is_template,
+        ):
+            logger.debug("%r. file %r is up to date.", self, destination_path)
+            self.metrics.increment(counter="files_up_to_date")
+            return False
 
-            origin_content = source_path.read_text()
-            prepared_content = self.generate_content_from_template(
-                template=origin_content
+        if not is_template:
+            content_hash = self.copy_file_if_changed(
+                source_path=source_path, destination_path=destination_path
+            )
+        elif self.get_source_file_size(source_path) <= self.streaming_threshold:
+            content_hash = self.write_file_if_changed(
+                source_path=source_path, destination_path=destination_path
             )
-            destination_path.write_text(prepared_content)
         else:
-            super().process_file(rel_path=rel_path, file_name=file_name)
+            content_hash = self.stream_template_file_if_changed(
+                source_path=source_path, destination_path=destination_path
+            )
+
+        self._manifest.record(
+            source=source,
+            source_path=stat_source_path,
+            destination_path=destination_path,
+            is_template=is_template,
+            content_hash=content_hash,
+        )
+        return True
+
+    def copy_file_if_changed(
+        self, source_path: "Path", destination_path: "Path"
+    ) -> str:
+        assert self._manifest is not None
+        content_hash = self.get_source_file_hash(source_path)
+
+        if content_hash != self._manifest.get_content_hash(destination_path):
+            self.copy_source_file(
+                source_path=source_path, destination_path=destination_path
+            )
+        return content_hash
+
+    def write_file_if_changed(
+        self, source_path: "Path", destination_path: "Path"
+    ) -> str:
+        assert self._manifest is not None
+        with self.metrics.measure(phase="template_rendering"):
+            content = self.generate_content_from_template_file(path=source_path)
+            data = content.encode()
+            content_hash = sha256(data).hexdigest()
+
+            is_changed = content_hash != self._manifest.get_content_hash(
+                destination_path
+            )
+            if is_changed:
+                destination_path.write_bytes(data)
+        self.count_rendered_bytes(
+            size=self.get_source_file_size(source_path),
+            written_size=len(data) if is_changed else 0,
+        )
+        return content_hash
+
+    def stream_template_file_if_changed(
+        self, source_path: "Path", destination_path: "Path"
+    ) -> str:
+        assert self._manifest is not None
+        tmp_path = destination_path.with_name(
+            f".{destination_path.name}.{os.getpid()}.{get_ident()}"
+        )
+        try:
+            with self.metrics.measure(phase="template_rendering"):
+                self.stream_template_file(
+                    source_path=source_path, destination_path=tmp_path
+                )
+                written_size = tmp_path.stat().st_size
+                with tmp_path.open("rb") as file:
+                    content_hash = file_digest(file, "sha256").hexdigest()
+
+                if content_hash != self._manifest.get_content_hash(
+                    destination_path
+                ):
+                    os.replace(tmp_path, destination_path)
+                else:
+                    written_size = 0
+        finally:
+            with suppress(FileNotFoundError):
+                tmp_path.unlink()
+        self.count_rendered_bytes(
+            size=self.get_source_file_size(source_path),
+            written_size=written_size,
+        )
+        return content_hash
@@ -0,0 +1,181 @@
+__all__ = (
+    "BuildManifest",
+    "BuildManifestEntry",
+)
+
+import json
+import logging
+import os
+import typing as t
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from hashlib import file_digest, sha256
+from threading import Lock
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+# size, mtime in nanoseconds
+FileStat = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class BuildManifestEntry:
+    source: str
+    source_stat: FileStat
+    # None for copied files, they don't depend on a context
+    context_hash: t.Optional[str]
+    content_hash: str
+    stat: FileStat
+
+
+class BuildManifest:
+    format_version: t.ClassVar[int] = 1
+    file_name: t.ClassVar[str] = ".py-bootstrap-manifest.json"
+
+    _destination_path: "Path"
+    _context_hash: str
+    _lock: Lock
+    _entries: dict[str, BuildManifestEntry]
+    _recorded_entries: dict[str, BuildManifestEntry]
+
+    def __init__(self):
+        self._lock = Lock()
+        self._entries = {}
+        self._recorded_entries = {}
+
+    @property
+    def path(self) -> "Path":
+        return self._destination_path / self.file_name
+
+    @property
+    def context_hash(self) -> str:
+        return self._context_hash
+
+    def set_destination_path(self, destination_path: "Path"):
+        self._destination_path = destination_path
+
+    def set_context(self, value: dict[str, str]):
+        self._context_hash = sha256(
+            json.dumps(value, sort_keys=True).encode()
+        ).hexdigest()
+
+    @classmethod
+    def get_file_stat(cls, path: "Path") -> t.Optional[FileStat]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def get_key(self, destination_path: "Path") -> str:
+        return destination_path.relative_to(self._destination_path).as_posix()
+
+    def get_entry(
+        self, destination_path: "Path"
+    ) -> t.Optional[BuildManifestEntry]:
+        return self._entries.get(self.get_key(destination_path))
+
+    def check_is_actual(
+        self,
+        source: str,
+        source_path: "Path",
+        destination_path: "Path",
+        is_template: bool,
+    ) -> bool:
+        entry = self.get_entry(destination_path=destination_path)
+        if entry is None:
+            return False
+
+        is_actual = (
+            entry.source == source
+            and entry.source_stat == self.get_file_stat(source_path)
+            and entry.context_hash
+            == (self._context_hash if is_template else None)
+            and entry.stat == self.get_file_stat(destination_path)
+        )
+        if is_actual:
+            self.record_entry(destination_path=destination_path, entry=entry)
+        return is_actual
+
+    def get_content_hash(self, destination_path: "Path") -> t.Optional[str]:
+        stat = self.get_file_stat(destination_path)
+        if stat is None:
+            return None
+
+        # the file isn't changed since the last build, its hash is known
+        entry = self.get_entry(destination_path=destination_path)
+        if entry is not None and entry.stat == stat:
+            return entry.content_hash
+
+        with destination_path.open("rb") as file:
+            return file_digest(file, "sha256").hexdigest()
+
+    def record(
+        self,
+        source: str,
+        source_path: "Path",
+        destination_path: "Path",
+        is_template: bool,
+        content_hash: str,
+    ):
+        source_stat = self.get_file_stat(source_path)
+        stat = self.get_file_stat(destination_path)
+        assert source_stat is not None and stat is not None
+        entry = BuildManifestEntry(
+            source=source,
+            source_stat=source_stat,
+            context_hash=self._context_hash if is_template else None,
+            content_hash=content_hash,
+            stat=stat,
+        )
+        self.record_entry(destination_path=destination_path, entry=entry)
+
+    def record_entry(self, destination_path: "Path", entry: BuildManifestEntry):
+        with self._lock:
+            self._recorded_entries[self.get_key(destination_path)] = entry
+
+    def load(self):
+        try:
+            data = json.loads(self.path.read_text())
+            if data["format_version"] != self.format_version:
+                return
+            entries = {}
+            for key, item in data["files"].items():
+                item["source_stat"] = tuple(item["source_stat"])
+                item["stat"] = tuple(item["stat"])
+                entries[key] = BuildManifestEntry(**item)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            logger.warning(
+                "%r. unable to read manifest %r: %r.", self, self.path, err
+            )
+            return
+
+        self._entries = entries
+
+    def save(self):
+        with self._lock:
+            data = {
+                "format_version": self.format_version,
+                "context_hash": self._context_hash,
+                "files": {
+                    key: asdict(entry)
+                    for key, entry in sorted(self._recorded_entries.items())
+                },
+            }
+
+        tmp_path = self.path.with_name(f".{self.file_name}.{os.getpid()}")
+        try:
+            tmp_path.write_text(json.dumps(data, indent=2))
+            os.replace(tmp_path, self.path)
+        except OSError as err:
+            logger.warning(
+                "%r. unable to write manifest %r: %r.", self, self.path, err
+            )
+            with suppress(OSError):
+                tmp_path.unlink()
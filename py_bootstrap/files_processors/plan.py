@@ -0,0 +1,158 @@
+__all__ = (
+    "BuildPlan",
+    "BuildPlanEntry",
+    "PlanningFilesProcessor",
+)
+
+import json
+import logging
+import typing as t
+from dataclasses import asdict, dataclass, field
+from hashlib import sha256
+from pathlib import Path
+
+from .generate import GenerateFilesProcessor
+
+if t.TYPE_CHECKING:
+    from typing import TextIO
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BuildPlanEntry:
+    # mkdir, copy or render
+    action: str
+    destination: str
+    source: t.Optional[str] = None
+    size: int = 0
+    hash: t.Optional[str] = None
+
+
+@dataclass
+class BuildPlan:
+    format_version: t.ClassVar[int] = 1
+
+    bootstrap_path: str
+    context: dict[str, str]
+    entries: list[BuildPlanEntry] = field(default_factory=list)
+
+    @property
+    def total_size(self) -> int:
+        return sum(entry.size for entry in self.entries)
+
+    def dumps(self) -> str:
+        return json.dumps(
+            {
+                "format_version": self.format_version,
+                "bootstrap_path": self.bootstrap_path,
+                "context": self.context,
+                "total_size": self.total_size,
+                "entries": [asdict(entry) for entry in self.entries],
+            },
+            indent=2,
+        )
+
+    @classmethod
+    def loads(cls, value: str) -> "BuildPlan":
+        data = json.loads(value)
+        if data["format_version"] != cls.format_version:
+            raise ValueError(
+                f"Unsupported build plan version {data['format_version']}"
+            )
+        return cls(
+            bootstrap_path=data["bootstrap_path"],
+            context=data["context"],
+            entries=[BuildPlanEntry(**item) for item in data["entries"]],
+        )
+
+
+class HashingWriter:
+    _hash: t.Any
+    _size: int
+
+    def __init__(self):
+        self._hash = sha256()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def hash(self) -> str:
+        return self._hash.hexdigest()
+
+    def write(self, value: str) -> int:
+        self.update(data=value.encode())
+        return len(value)
+
+    def update(self, data: bytes):
+        self._hash.update(data)
+        self._size += len(data)
+
+
+class PlanningFilesProcessor(GenerateFilesProcessor):
+    _plan: BuildPlan
+
+    @property
+    def plan(self) -> BuildPlan:
+        return self._plan
+
+    def run(self):
+        self._plan = BuildPlan(
+            bootstrap_path=self._source_path.as_posix(), context=self._context
+        )
+        # destination paths are planned relative to a destination directory
+        self._destination_path = Path()
+        # entries are collected in walking order, directories go first
+        self._jobs = 1
+        super().run()
+
+    def process_directory(self, rel_path: "Path", dir_name: str):
+        path = self._destination_path.joinpath(rel_path, dir_name)
+        path = Path(
+            self.generate_content_from_template(template=path.as_posix())
+        )
+        self._plan.entries.append(
+            BuildPlanEntry(action="mkdir", destination=path.as_posix())
+        )
+
+    def process_file(self, rel_path: "Path", file_name: str):
+        source = rel_path.joinpath(file_name)
+        source_path = self._source_path / source
+        destination_path = self.build_destination_file_path(
+            rel_path=rel_path, file_name=file_name
+        )
+
+        writer = HashingWriter()
+        if not file_name.endswith(".tmpl"):
+            action = "copy"
+            content_hash = self.get_source_file_hash(source_path)
+            size = self.get_source_file_size(source_path)
+        else:
+            action = "render"
+            if (
+                self.get_source_file_size(source_path)
+                <= self.streaming_threshold
+            ):
+                writer.write(
+                    self.generate_content_from_template_file(path=source_path)
+                )
+            else:
+                self.stream_template_file_into(
+                    source_path=source_path,
+                    destination=t.cast("TextIO", writer),
+                )
+            content_hash, size = writer.hash, writer.size
+
+        self._plan.entries.append(
+            BuildPlanEntry(
+                action=action,
+                destination=destination_path.as_posix(),
+                source=source.as_posix(),
+                size=size,
+                hash=content_hash,
+            )
+        )
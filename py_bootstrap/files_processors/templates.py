@@ -0,0 +1,274 @@
+__all__ = (
+    "CompiledTemplate",
+    "StreamingTemplateRenderer",
+    "TemplatesCache",
+)
+
+import logging
+import marshal
+import os
+import re
+import sys
+import typing as t
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import cached_property
+from hashlib import sha256
+from string import Formatter
+from threading import Lock
+
+from py_bootstrap.base.cache import get_cache_dir
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+    from typing import TextIO
+
+
+logger = logging.getLogger(__name__)
+
+# literal text, field name, format spec, conversion
+TemplateSegment = tuple[str, t.Optional[str], t.Optional[str], t.Optional[str]]
+# inode, size, mtime in nanoseconds, content hash
+TemplateStat = tuple[int, int, int, str]
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    segments: t.Optional[tuple[TemplateSegment, ...]] = None
+    source: t.Optional[str] = None
+
+    conversions: t.ClassVar[dict[str, t.Callable[[t.Any], str]]] = {
+        "s": str,
+        "r": repr,
+        "a": ascii,
+    }
+
+    @classmethod
+    def compile(cls, template: str) -> "CompiledTemplate":
+        segments = tuple(Formatter().parse(template))
+        if all(cls.check_segment_is_simple(segment) for segment in segments):
+            return cls(segments=segments)
+        # positional, nested or indexed fields are left for str.format
+        return cls(source=template)
+
+    @classmethod
+    def check_segment_is_simple(cls, segment: TemplateSegment) -> bool:
+        _, field_name, format_spec, conversion = segment
+        if field_name is None:
+            return True
+        return (
+            field_name.isidentifier()
+            and "{" not in (format_spec or "")
+            and (conversion is None or conversion in cls.conversions)
+        )
+
+    def render(self, context: t.Mapping[str, t.Any]) -> str:
+        if self.segments is None:
+            assert self.source is not None
+            return self.source.format(**context)
+
+        parts: list[str] = []
+        for literal, field_name, format_spec, conversion in self.segments:
+            if literal:
+                parts.append(literal)
+            if field_name is None:
+                continue
+
+            value = context[field_name]
+            if conversion is not None:
+                value = self.conversions[conversion](value)
+            parts.append(format(value, format_spec or ""))
+        return "".join(parts)
+
+
+class TemplatesCache:
+    cache_dir_name: t.ClassVar[str] = (
+        f"templates-{sys.implementation.cache_tag}"
+    )
+    stats_file_name: t.ClassVar[str] = "stats.bin"
+
+    _lock: Lock
+    _templates: dict[str, CompiledTemplate]
+    _stats: t.Optional[dict[str, TemplateStat]] = None
+    _is_stats_changed: bool = False
+
+    def __init__(self):
+        self._lock = Lock()
+        self._templates = {}
+
+    @cached_property
+    def cache_path(self) -> "Path":
+        return get_cache_dir() / self.cache_dir_name
+
+    @property
+    def stats(self) -> dict[str, TemplateStat]:
+        with self._lock:
+            if self._stats is None:
+                self._stats = self.read_stats()
+            return self._stats
+
+    def get(self, path: "Path") -> CompiledTemplate:
+        stat = path.stat()
+        path_key = str(path)
+
+        template_stat = self.stats.get(path_key)
+        if template_stat is not None and template_stat[:3] == (
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            compiled = self.get_by_hash(content_hash=template_stat[3])
+            if compiled is not None:
+                return compiled
+
+        template = path.read_text(encoding="utf-8")
+        content_hash = sha256(template.encode()).hexdigest()
+        compiled = self.get_or_compile(
+            content_hash=content_hash, read_template=lambda: template
+        )
+
+        with self._lock:
+            assert self._stats is not None
+            self._stats[path_key] = (
+                stat.st_ino,
+                stat.st_size,
+                stat.st_mtime_ns,
+                content_hash,
+            )
+            self._is_stats_changed = True
+        return compiled
+
+    def get_or_compile(
+        self, content_hash: str, read_template: t.Callable[[], str]
+    ) -> CompiledTemplate:
+        compiled = self.get_by_hash(content_hash=content_hash)
+        if compiled is None:
+            compiled = CompiledTemplate.compile(template=read_template())
+            self.store(content_hash=content_hash, compiled=compiled)
+        return compiled
+
+    def get_by_hash(self, content_hash: str) -> t.Optional[CompiledTemplate]:
+        try:
+            return self._templates[content_hash]
+        except KeyError:
+            pass
+
+        path = self.cache_path / f"{content_hash}.bin"
+        try:
+            segments, source = marshal.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError, TypeError) as err:
+            logger.warning("%r. unable to read %r: %r.", self, path, err)
+            return None
+
+        compiled = CompiledTemplate(segments=segments, source=source)
+        self._templates[content_hash] = compiled
+        return compiled
+
+    def store(self, content_hash: str, compiled: CompiledTemplate):
+        self._templates[content_hash] = compiled
+        self.write_file(
+            file_name=f"{content_hash}.bin",
+            data=marshal.dumps((compiled.segments, compiled.source)),
+        )
+
+    def read_stats(self) -> dict[str, TemplateStat]:
+        path = self.cache_path / self.stats_file_name
+        try:
+            stats = marshal.loads(path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, EOFError, TypeError) as err:
+            logger.warning("%r. unable to read %r: %r.", self, path, err)
+            return {}
+        return stats if isinstance(stats, dict) else {}
+
+    def save(self):
+        with self._lock:
+            if not self._is_stats_changed or self._stats is None:
+                return
+            data = marshal.dumps(self._stats)
+            self._is_stats_changed = False
+
+        self.write_file(file_name=self.stats_file_name, data=data)
+
+    def write_file(self, file_name: str, data: bytes):
+        path = self.cache_path / file_name
+        tmp_path = path.with_name(f".{file_name}.{os.getpid()}")
+        try:
+            self.cache_path.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as err:
+            logger.warning("%r. unable to write %r: %r.", self, path, err)
+            with suppress(OSError):
+                tmp_path.unlink()
+
+
+class StreamingTemplateRenderer:
+    chunk_size: t.ClassVar[int] = 256 * 1024
+    max_field_size: t.ClassVar[int] = 64 * 1024
+
+    braces_regex: t.ClassVar[re.Pattern] = re.compile(r"[{}]")
+
+    _context: t.Mapping[str, t.Any]
+
+    def set_context(self, value: t.Mapping[str, t.Any]):
+        self._context = value
+
+    def render(self, source: "TextIO", destination: "TextIO"):
+        pending = ""
+        while chunk := source.read(self.chunk_size):
+            pending += chunk
+            cut = self.find_safe_cut(text=pending)
+            if cut:
+                destination.write(self.render_piece(piece=pending[:cut]))
+                pending = pending[cut:]
+
+            if len(pending) > self.max_field_size:
+                raise ValueError(
+                    f"Template field is longer than {self.max_field_size} "
+                    f"characters: {pending[:80]!r}..."
+                )
+
+        if pending:
+            # the rest is an unclosed field or a single brace, the formatter
+            # raises a proper error for it
+            destination.write(self.render_piece(piece=pending))
+
+    def render_piece(self, piece: str) -> str:
+        return CompiledTemplate.compile(template=piece).render(
+            context=self._context
+        )
+
+    def find_safe_cut(self, text: str) -> int:
+        # returns the length of the longest prefix without unfinished fields
+        # or escaped braces, so it is rendered the same way as a whole text
+        length = len(text)
+        position = 0
+        while match := self.braces_regex.search(text, position):
+            index = match.start()
+            if index + 1 >= length:
+                return index
+
+            brace = text[index]
+            if text[index + 1] == brace:
+                position = index + 2
+                continue
+            if brace == "}":
+                position = index + 1
+                continue
+
+            field_start = index
+            depth = 1
+            index += 1
+            while depth:
+                match = self.braces_regex.search(text, index)
+                if match is None:
+                    return field_start
+                index = match.end()
+                depth += 1 if match.group() == "{" else -1
+            position = index
+
+        return length
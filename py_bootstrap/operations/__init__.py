@@ -4,6 +4,35 @@ __all__ = (
     "BootstrapsDispatcher",
 )
 
-from .build_bootstrap import BaseBuildBootstrapOperation
-from .dispatcher import BootstrapsDispatcher
-from .export_bootstrap import BaseExportBootstrapOperation
+import typing as t
+from importlib import import_module
+
+if t.TYPE_CHECKING:
+    from .build_bootstrap import BaseBuildBootstrapOperation
+    from .dispatcher import BootstrapsDispatcher
+    from .export_bootstrap import BaseExportBootstrapOperation
+
+# submodules are imported on the first access to their names, e.g. bootstraps
+# import base operations without the dispatcher
+_submodules_names_map = {
+    "BaseBuildBootstrapOperation": "build_bootstrap",
+    "BaseExportBootstrapOperation": "export_bootstrap",
+    "BootstrapsDispatcher": "dispatcher",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        submodule_name = _submodules_names_map[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value = getattr(import_module(f".{submodule_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,129 @@
+__all__ = (
+    "BootstrapArchiveFinder",
+    "BootstrapArchiveLoader",
+)
+
+import logging
+import sys
+import typing as t
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+
+from py_bootstrap import files_processors
+
+if t.TYPE_CHECKING:
+    from importlib.abc import Loader
+    from types import ModuleType
+
+
+logger = logging.getLogger(__name__)
+
+
+# the import system doesn't require importlib.abc base classes, they import
+# importlib.resources and tempfile, and dataclasses import inspect. both are
+# imported by every command using bootstraps
+class BootstrapArchiveLoader(t.NamedTuple):
+    archive_path: "Path"
+    # a bootstrap package itself has no file
+    file_name: t.Optional[str] = None
+
+    def create_module(self, spec: "ModuleSpec") -> None:
+        return None
+
+    def exec_module(self, module: "ModuleType"):
+        if self.file_name is None:
+            return
+
+        path = self.archive_path / self.file_name
+        archive = files_processors.BootstrapArchive()
+        archive.set_path(path=self.archive_path)
+        archive.load()
+        try:
+            source = archive.read_text(path=path)
+        finally:
+            archive.close()
+
+        code = compile(source, str(path), "exec")
+        exec(code, module.__dict__)
+
+
+class BootstrapArchiveFinder:
+    @classmethod
+    def install(cls):
+        # the finder goes after the default ones, bootstraps directories
+        # take precedence over archives with the same names
+        if not any(isinstance(finder, cls) for finder in sys.meta_path):
+            sys.meta_path.append(cls())
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: t.Optional[t.Sequence[str]],
+        target: t.Optional["ModuleType"] = None,
+    ) -> t.Optional["ModuleSpec"]:
+        if not path:
+            return None
+
+        name = fullname.rpartition(".")[2]
+        for location in path:
+            location_path = Path(location)
+            if files_processors.BootstrapArchive.check_is_archive(
+                location_path
+            ):
+                return self.build_module_spec(
+                    fullname=fullname,
+                    archive_path=location_path,
+                    file_name=f"{name}.py",
+                )
+
+            archive_path = (
+                location_path
+                / f"{name}{files_processors.BootstrapArchive.suffix}"
+            )
+            if files_processors.BootstrapArchive.check_is_archive(archive_path):
+                logger.debug(
+                    "%r. %r is found in %r.", self, fullname, archive_path
+                )
+                spec = ModuleSpec(
+                    fullname,
+                    t.cast(
+                        "Loader",
+                        BootstrapArchiveLoader(archive_path=archive_path),
+                    ),
+                    origin=str(archive_path),
+                    is_package=True,
+                )
+                spec.submodule_search_locations = [str(archive_path)]
+                return spec
+        return None
+
+    def build_module_spec(
+        self, fullname: str, archive_path: "Path", file_name: str
+    ) -> t.Optional["ModuleSpec"]:
+        archive = files_processors.BootstrapArchive()
+        archive.set_path(path=archive_path)
+        try:
+            archive.load()
+            archive.get_entry(path=archive_path / file_name)
+        except KeyError:
+            return None
+        except (OSError, ValueError) as err:
+            logger.warning(
+                "%r. unable to read %r archive: %r.", self, archive_path, err
+            )
+            return None
+        finally:
+            archive.close()
+
+        spec = ModuleSpec(
+            fullname,
+            t.cast(
+                "Loader",
+                BootstrapArchiveLoader(
+                    archive_path=archive_path, file_name=file_name
+                ),
+            ),
+            origin=str(archive_path / file_name),
+        )
+        spec.has_location = True
+        return spec
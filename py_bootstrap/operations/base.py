@@ -2,24 +2,80 @@ __all__ = ("BaseBootstrapsOperation",)
 
 import logging
 import typing as t
+from argparse import ArgumentTypeError
+from functools import cached_property, partial
 from importlib import import_module
-from importlib.metadata import entry_points
+from pathlib import Path
 
+from py_bootstrap import files_processors
 from py_bootstrap.base.operations import BaseCliOperation
 
+from .bootstraps_registry import BootstrapsRegistry
+
 if t.TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from importlib.metadata import EntryPoints
+    from importlib.resources.abc import Traversable
     from types import ModuleType
 
+    from py_bootstrap.files_processors import BaseFilesProcessor, TemplatesCache
+
+    from .bootstraps_index import BootstrapsIndexEntry
+
 
 logger = logging.getLogger(__name__)
 
 
 class BaseBootstrapsOperation(BaseCliOperation):
     entry_point_module_name = "__entry_point__"
+    entry_points_group = "py_bootstrap_templates"
+
+    _bootstraps_registry: t.Optional["BootstrapsRegistry"] = None
+    _templates_cache: t.Optional["TemplatesCache"] = None
+
+    @classmethod
+    def prepare_cli_argument_jobs(cls, parser: "ArgumentParser"):
+        parser.add_argument(
+            "--jobs",
+            dest="jobs",
+            type=cls.validate_cli_argument_jobs,
+            default=1,
+            help=(
+                "Specifies a number of threads for processing files."
+                " 1 by default."
+            ),
+        )
+
+    @classmethod
+    def validate_cli_argument_jobs(cls, value: str) -> int:
+        try:
+            jobs = int(value)
+        except ValueError:
+            jobs = 0
+
+        if jobs < 1:
+            raise ArgumentTypeError("The jobs should be a positive integer.")
+        return jobs
+
+    @cached_property
+    def jobs(self) -> int:
+        return getattr(self.cli_namespace, "jobs", 1)
+
+    @classmethod
+    def find_entry_points(cls) -> "EntryPoints":
+        # importlib.metadata is imported on demand, e.g. a help doesn't
+        # discover bootstraps
+        from importlib.metadata import entry_points
+
+        return entry_points(group=cls.entry_points_group)
 
     @classmethod
     def find_bootstraps(cls) -> t.Iterator[tuple[str, "ModuleType"]]:
-        for package_entry_point in entry_points(group="py_bootstrap_templates"):
+        from .archive_finder import BootstrapArchiveFinder
+
+        # bootstraps are importable from archives too
+        BootstrapArchiveFinder.install()
+        for package_entry_point in cls.find_entry_points():
             # EntryPoint(
             #   name='ingots',
             #   value='ingots.py_bootstrap.templates',
@@ -50,3 +106,120 @@ class BaseBootstrapsOperation(BaseCliOperation):
                         err,
                         import_path,
                     )
+
+    @classmethod
+    def find_bootstrap_path(
+        cls, entry_point_module: "ModuleType"
+    ) -> "Traversable":
+        assert entry_point_module.__file__
+        path = Path(entry_point_module.__file__).parent
+        if path.exists():
+            return path
+
+        # e.g. a zipimported bootstrap, its files are read by
+        # importlib.resources without unpacking
+        from importlib.resources import files
+
+        return files(entry_point_module)
+
+    @classmethod
+    def find_bootstraps_entries(cls) -> list["BootstrapsIndexEntry"]:
+        # the index is imported on demand, e.g. a help doesn't read it
+        from .bootstraps_index import BootstrapsIndex
+
+        index = BootstrapsIndex()
+        index.set_operation_cls(cls)
+        return index.load()
+
+    @classmethod
+    def build_bootstraps_registry(cls) -> "BootstrapsRegistry":
+        registry = BootstrapsRegistry()
+        registry.set_operation_cls(cls)
+        return registry
+
+    @property
+    def bootstraps_registry(self) -> "BootstrapsRegistry":
+        if self._bootstraps_registry is None:
+            self._bootstraps_registry = self.build_bootstraps_registry()
+            self._bootstraps_registry.set_metrics(value=self.metrics)
+        return self._bootstraps_registry
+
+    def set_bootstraps_registry(self, registry: "BootstrapsRegistry"):
+        self._bootstraps_registry = registry
+
+    @property
+    def templates_cache(self) -> "TemplatesCache":
+        if self._templates_cache is None:
+            self._templates_cache = files_processors.TemplatesCache()
+        return self._templates_cache
+
+    def set_templates_cache(self, value: "TemplatesCache"):
+        self._templates_cache = value
+
+    def warm_up_templates_cache(
+        self, bootstrap_paths: t.Iterable["Traversable"]
+    ):
+        for bootstrap_path in bootstrap_paths:
+            if not isinstance(bootstrap_path, Path):
+                # templates of zipped bootstraps are compiled on building
+                continue
+            if files_processors.BootstrapArchive.check_is_archive(
+                bootstrap_path
+            ):
+                self.warm_up_archived_templates(archive_path=bootstrap_path)
+                continue
+
+            for path in bootstrap_path.rglob("*.tmpl"):
+                if (
+                    path.stat().st_size
+                    > files_processors.GenerateFilesProcessor.streaming_threshold
+                ):
+                    continue
+                try:
+                    self.templates_cache.get(path=path)
+                except Exception as err:
+                    # the error is reported by generating the template
+                    logger.debug("%r. %r isn't compiled: %r.", self, path, err)
+
+    def warm_up_archived_templates(self, archive_path: "Path"):
+        archive = files_processors.BootstrapArchive()
+        archive.set_path(path=archive_path)
+        archive.load()
+        try:
+            for entry in archive.entries:
+                if (
+                    not entry.is_template
+                    or entry.size
+                    > files_processors.GenerateFilesProcessor.streaming_threshold
+                ):
+                    continue
+                try:
+                    self.templates_cache.get_or_compile(
+                        content_hash=entry.hash,
+                        read_template=partial(
+                            archive.read_text, path=archive_path / entry.path
+                        ),
+                    )
+                except Exception as err:
+                    # the error is reported by generating the template
+                    logger.debug(
+                        "%r. %r isn't compiled: %r.", self, entry.path, err
+                    )
+        finally:
+            archive.close()
+
+    def set_files_processor_source(
+        self, processor: "BaseFilesProcessor", path: "Traversable"
+    ):
+        if not (
+            isinstance(path, Path)
+            and files_processors.BootstrapArchive.check_is_archive(path)
+        ):
+            processor.set_source_traversable(value=path)
+            return
+
+        # the archive is unmapped with the processor by the garbage collector
+        archive = files_processors.BootstrapArchive()
+        archive.set_path(path=path)
+        archive.load()
+        processor.set_source_archive(value=archive)
@@ -0,0 +1,228 @@
+__all__ = (
+    "BootstrapsIndex",
+    "BootstrapsIndexEntry",
+)
+
+import json
+import logging
+import os
+import sys
+import typing as t
+from contextlib import suppress
+from functools import cached_property
+from hashlib import sha256
+from importlib.util import find_spec
+from pathlib import Path
+
+from py_bootstrap import files_processors
+from py_bootstrap.base.cache import CACHE_DIR_ENV_NAME, get_cache_dir
+
+if t.TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+    from types import ModuleType
+
+    from .base import BaseBootstrapsOperation
+
+
+logger = logging.getLogger(__name__)
+
+
+# entries are named tuples, a listing doesn't import dataclasses and inspect
+class BootstrapsIndexEntry(t.NamedTuple):
+    name: str
+    import_path: str
+    path: str
+    description: t.Optional[str] = None
+    build_cli_description: t.Optional[str] = None
+    export_cli_description: t.Optional[str] = None
+
+
+class BootstrapsIndex:
+    format_version: t.ClassVar[int] = 1
+    cache_dir_env_name: t.ClassVar[str] = CACHE_DIR_ENV_NAME
+    cache_file_name: t.ClassVar[str] = "bootstraps-index.json"
+
+    _operation_cls: type["BaseBootstrapsOperation"]
+
+    def set_operation_cls(self, value: type["BaseBootstrapsOperation"]):
+        self._operation_cls = value
+
+    @cached_property
+    def cache_dir(self) -> "Path":
+        return get_cache_dir()
+
+    @cached_property
+    def cache_path(self) -> "Path":
+        return self.cache_dir / self.cache_file_name
+
+    def load(self) -> list[BootstrapsIndexEntry]:
+        # entry points are read by importlib.metadata after changes of
+        # sys.path directories or bootstraps packages only, distributions
+        # are installed into the directories
+        entries = self.read_unchanged()
+        if entries is not None:
+            return entries
+
+        fingerprint = self.compute_fingerprint()
+        entries = self.read(fingerprint=fingerprint)
+        if entries is None:
+            logger.debug("%r. index is missed or stale, rebuilding.", self)
+            entries = self.build()
+        # stats are refreshed too, e.g. after installing other packages
+        self.write(fingerprint=fingerprint, entries=entries)
+        return entries
+
+    def compute_fingerprint(self) -> str:
+        digest = sha256(f"{self.format_version}".encode())
+        for package_entry_point in self._operation_cls.find_entry_points():
+            digest.update(
+                self.describe_entry_point(entry_point=package_entry_point)
+            )
+            for path in self.find_package_fingerprint_paths(
+                package_name=package_entry_point.value
+            ):
+                digest.update(f"{path}:{self.get_path_mtime(path)};".encode())
+        return digest.hexdigest()
+
+    def collect_stats(self) -> dict[str, t.Any]:
+        paths = [Path(location) for location in sys.path]
+        for package_entry_point in self._operation_cls.find_entry_points():
+            paths.extend(
+                self.find_package_fingerprint_paths(
+                    package_name=package_entry_point.value
+                )
+            )
+        return {
+            "sys_path": list(sys.path),
+            "mtimes": {str(path): self.get_path_mtime(path) for path in paths},
+        }
+
+    @staticmethod
+    def get_path_mtime(path: "Path") -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return -1
+
+    @staticmethod
+    def describe_entry_point(entry_point: "EntryPoint") -> bytes:
+        # metadata files are hashed instead of parsing them by the email
+        # package, names and versions of distributions are there
+        dist = getattr(entry_point, "dist", None)
+        metadata = dist and (
+            dist.read_text("METADATA") or dist.read_text("PKG-INFO")
+        )
+        dist_id = sha256(metadata.encode()).hexdigest() if metadata else ""
+        return f"{entry_point.name}={entry_point.value}@{dist_id};".encode()
+
+    def find_package_fingerprint_paths(self, package_name: str) -> list["Path"]:
+        try:
+            spec = find_spec(package_name)
+        except (ImportError, ValueError) as err:
+            logger.debug(
+                "%r. unable to find %r package: %r.", self, package_name, err
+            )
+            return []
+
+        if spec is None or not spec.submodule_search_locations:
+            return []
+
+        entry_point_file_name = (
+            f"{self._operation_cls.entry_point_module_name}.py"
+        )
+        paths: list["Path"] = []
+        for location in spec.submodule_search_locations:
+            location_path = Path(location)
+            paths.append(location_path)
+            paths.append(location_path / "__init__.py")
+            paths.extend(
+                sorted(location_path.glob(f"*/{entry_point_file_name}"))
+            )
+            paths.extend(
+                sorted(
+                    location_path.glob(
+                        f"*{files_processors.BootstrapArchive.suffix}"
+                    )
+                )
+            )
+        return paths
+
+    def build(self) -> list[BootstrapsIndexEntry]:
+        return [
+            self.build_entry(name=name, module=entry_point_module)
+            for name, entry_point_module in self._operation_cls.find_bootstraps()
+        ]
+
+    @staticmethod
+    def build_entry(name: str, module: "ModuleType") -> BootstrapsIndexEntry:
+        description = getattr(module, "DESCRIPTION", None)
+        build_operation_cls = getattr(module, "BuildOperation", None)
+        export_operation_cls = getattr(module, "ExportOperation", None)
+        return BootstrapsIndexEntry(
+            name=name,
+            import_path=module.__name__,
+            path=str(Path(module.__file__).parent) if module.__file__ else "",
+            description=None if description is None else str(description),
+            build_cli_description=getattr(
+                build_operation_cls, "cli_description", None
+            ),
+            export_cli_description=getattr(
+                export_operation_cls, "cli_description", None
+            ),
+        )
+
+    def read_unchanged(self) -> t.Optional[list[BootstrapsIndexEntry]]:
+        try:
+            data = json.loads(self.cache_path.read_text())
+            stats = data["stats"]
+            if (
+                data["format_version"] != self.format_version
+                or stats["sys_path"] != sys.path
+                or any(
+                    self.get_path_mtime(Path(path)) != mtime
+                    for path, mtime in stats["mtimes"].items()
+                )
+            ):
+                return None
+            return [BootstrapsIndexEntry(**item) for item in data["bootstraps"]]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # broken indexes are reported by reading with a fingerprint
+            return None
+
+    def read(self, fingerprint: str) -> t.Optional[list[BootstrapsIndexEntry]]:
+        try:
+            data = json.loads(self.cache_path.read_text())
+            if (
+                data["format_version"] != self.format_version
+                or data["fingerprint"] != fingerprint
+            ):
+                return None
+            return [BootstrapsIndexEntry(**item) for item in data["bootstraps"]]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            logger.warning(
+                "%r. unable to read index %r: %r.", self, self.cache_path, err
+            )
+            return None
+
+    def write(self, fingerprint: str, entries: list[BootstrapsIndexEntry]):
+        data = {
+            "format_version": self.format_version,
+            "fingerprint": fingerprint,
+            "stats": self.collect_stats(),
+            "bootstraps": [entry._asdict() for entry in entries],
+        }
+        tmp_path = self.cache_path.with_name(
+            f".{self.cache_file_name}.{os.getpid()}"
+        )
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, indent=2))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as err:
+            logger.warning(
+                "%r. unable to write index %r: %r.", self, self.cache_path, err
+            )
+            with suppress(OSError):
+                tmp_path.unlink()
@@ -0,0 +1,82 @@
+__all__ = ("BootstrapsRegistry",)
+
+import logging
+import sys
+import typing as t
+from importlib import import_module, invalidate_caches
+
+from py_bootstrap.base.metrics import OperationMetrics
+
+if t.TYPE_CHECKING:
+    from types import ModuleType
+
+    from .base import BaseBootstrapsOperation
+    from .bootstraps_index import BootstrapsIndexEntry
+
+
+logger = logging.getLogger(__name__)
+
+
+class BootstrapsRegistry:
+    _operation_cls: type["BaseBootstrapsOperation"]
+    _entries_map: t.Optional[dict[str, "BootstrapsIndexEntry"]] = None
+    _modules_map: dict[str, "ModuleType"]
+    _metrics: t.Optional["OperationMetrics"] = None
+
+    def __init__(self):
+        self._modules_map = {}
+
+    @property
+    def metrics(self) -> "OperationMetrics":
+        if self._metrics is None:
+            self._metrics = OperationMetrics()
+        return self._metrics
+
+    def set_operation_cls(self, value: type["BaseBootstrapsOperation"]):
+        self._operation_cls = value
+
+    def set_metrics(self, value: "OperationMetrics"):
+        self._metrics = value
+
+    @property
+    def entries_map(self) -> dict[str, "BootstrapsIndexEntry"]:
+        if self._entries_map is None:
+            logger.debug("%r. discover bootstraps.", self)
+            with self.metrics.measure(phase="discovery"):
+                self._entries_map = {
+                    entry.name: entry
+                    for entry in self._operation_cls.find_bootstraps_entries()
+                }
+        return self._entries_map
+
+    def get_entries(self) -> list["BootstrapsIndexEntry"]:
+        return list(self.entries_map.values())
+
+    def get_entry(self, name: str) -> "BootstrapsIndexEntry":
+        return self.entries_map[name]
+
+    def get_module(self, name: str) -> "ModuleType":
+        try:
+            return self._modules_map[name]
+        except KeyError:
+            pass
+
+        entry = self.get_entry(name=name)
+        from .archive_finder import BootstrapArchiveFinder
+
+        BootstrapArchiveFinder.install()
+        with self.metrics.measure(phase="entry_point_importing"):
+            module = import_module(entry.import_path)
+        self._modules_map[name] = module
+        return module
+
+    def invalidate(self):
+        logger.debug("%r. invalidate discovered bootstraps.", self)
+        # imported entry-points are dropped too for re-importing
+        # updated bootstraps on the next request
+        for module in self._modules_map.values():
+            sys.modules.pop(module.__name__, None)
+        invalidate_caches()
+
+        self._entries_map = None
+        self._modules_map.clear()
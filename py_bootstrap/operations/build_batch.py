@@ -0,0 +1,319 @@
+__all__ = (
+    "BuildBatchOperation",
+    "BuildBatchRecord",
+    "BuildBatchResult",
+)
+
+import logging
+import os
+import typing as t
+from argparse import ArgumentError, ArgumentParser, ArgumentTypeError
+from functools import cached_property
+from pathlib import Path
+
+from .base import BaseBootstrapsOperation
+
+if t.TYPE_CHECKING:
+    from .build_bootstrap import BaseBuildBootstrapOperation
+
+
+logger = logging.getLogger(__name__)
+
+
+# records are named tuples, a help imports the module and doesn't import
+# dataclasses and inspect
+class BuildBatchRecord(t.NamedTuple):
+    bootstrap: str
+    destination: str
+    arguments: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, t.Any]) -> "BuildBatchRecord":
+        arguments = data.get("args", {})
+        if isinstance(arguments, dict):
+            arguments = cls.build_cli_arguments(arguments)
+        return cls(
+            bootstrap=data["bootstrap"],
+            destination=data["dest"],
+            arguments=tuple(str(argument) for argument in arguments),
+        )
+
+    @classmethod
+    def build_cli_arguments(cls, data: dict[str, t.Any]) -> list[str]:
+        arguments = []
+        for name, value in data.items():
+            if value is True:
+                arguments.append(f"--{name}")
+            elif value is False or value is None:
+                continue
+            elif isinstance(value, list):
+                arguments.extend(f"--{name}={item}" for item in value)
+            else:
+                arguments.append(f"--{name}={value}")
+        return arguments
+
+
+class BuildBatchResult(t.NamedTuple):
+    record: BuildBatchRecord
+    error: t.Optional[str] = None
+    # metrics of a forked worker, see OperationMetrics.as_dict
+    metrics: t.Optional[dict[str, t.Any]] = None
+
+    @property
+    def is_succeeded(self) -> bool:
+        return self.error is None
+
+
+RecordOperation = tuple[
+    BuildBatchRecord, t.Optional["BaseBuildBootstrapOperation"]
+]
+
+
+class BuildBatchOperation(BaseBootstrapsOperation):
+    cli_description = "Generates skeletons of many projects from a spec file."
+
+    # the batch is inherited by forked workers with imported bootstraps and
+    # compiled templates, only record indexes and results are pickled
+    _worker_batch: t.ClassVar[t.Optional["BuildBatchOperation"]] = None
+
+    _record_parsers: t.Optional[dict[str, "ArgumentParser"]] = None
+    _record_operations: list[RecordOperation]
+
+    @classmethod
+    def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""):
+        parser.add_argument(
+            "--spec",
+            dest="spec",
+            type=cls.validate_cli_argument_spec,
+            required=True,
+            help=(
+                "Specifies a JSONL or TOML file with projects. Every project"
+                " has bootstrap, dest and args keys."
+            ),
+        )
+
+        parser.add_argument(
+            "--workers",
+            dest="workers",
+            type=cls.validate_cli_argument_workers,
+            nargs="?",
+            const=os.process_cpu_count() or 1,
+            default=1,
+            help=(
+                "Specifies a number of processes generating projects."
+                " A number of CPUs if the value is omitted. 1 by default."
+            ),
+        )
+
+        cls.prepare_cli_argument_jobs(parser=parser)
+
+    @classmethod
+    def validate_cli_argument_workers(cls, value: str) -> int:
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+
+        if workers < 1:
+            raise ArgumentTypeError("The workers should be a positive integer.")
+        return workers
+
+    @classmethod
+    def validate_cli_argument_spec(cls, value: str) -> list[BuildBatchRecord]:
+        path = Path(value)
+        try:
+            return cls.load_spec(path=path)
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            raise ArgumentTypeError(f"Unable to read a spec: {err!r}.") from err
+
+    @classmethod
+    def load_spec(cls, path: "Path") -> list[BuildBatchRecord]:
+        if path.suffix == ".toml":
+            import tomllib
+
+            items = tomllib.loads(path.read_text())["projects"]
+        else:
+            import json
+
+            items = [
+                json.loads(line)
+                for line in path.read_text().splitlines()
+                if line.strip()
+            ]
+        return [BuildBatchRecord.from_dict(item) for item in items]
+
+    @cached_property
+    def workers(self) -> int:
+        return getattr(self.cli_namespace, "workers", 1)
+
+    def run(self):
+        records: list[BuildBatchRecord] = self.cli_namespace.spec
+        results = self.build_records(records=records)
+        self.print_summary(results=results)
+
+        failed_count = sum(not result.is_succeeded for result in results)
+        if failed_count:
+            logger.error(
+                "%d of %d projects are not generated.",
+                failed_count,
+                len(results),
+            )
+            raise Exception("Building projects batch")
+
+    def build_records(
+        self, records: list[BuildBatchRecord]
+    ) -> list[BuildBatchResult]:
+        # every record is validated before generating any project
+        results: list[t.Optional[BuildBatchResult]] = []
+        self._record_operations = []
+        for record in records:
+            try:
+                operation = self.prepare_record_operation(record=record)
+            except Exception as err:
+                self._record_operations.append((record, None))
+                results.append(self.build_failed_result(record, err=err))
+            else:
+                self._record_operations.append((record, operation))
+                results.append(None)
+
+        # multiprocessing is imported on demand for keeping a startup fast
+        from multiprocessing import get_all_start_methods
+
+        if self.workers > 1 and "fork" in get_all_start_methods():
+            self.build_records_concurrently(results=results)
+        else:
+            if self.workers > 1:
+                logger.warning(
+                    "%r. forking isn't supported, projects are generated"
+                    " sequentially.",
+                    self,
+                )
+            for index, result in enumerate(results):
+                if result is None:
+                    results[index] = self.build_record(index=index)
+
+        return [result for result in results if result is not None]
+
+    def build_records_concurrently(
+        self, results: list[t.Optional[BuildBatchResult]]
+    ):
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import get_context
+
+        self.warm_up_templates_cache(
+            bootstrap_paths={
+                operation.bootstrap_path
+                for _, operation in self._record_operations
+                if operation is not None
+            }
+        )
+
+        cls = type(self)
+        cls._worker_batch = self
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=get_context("fork")
+            ) as executor:
+                futures = {
+                    index: executor.submit(cls.build_worker_record, index=index)
+                    for index, result in enumerate(results)
+                    if result is None
+                }
+                for index, future in futures.items():
+                    try:
+                        result = future.result()
+                    except Exception as err:
+                        record, _ = self._record_operations[index]
+                        result = self.build_failed_result(record, err=err)
+                    if result.metrics is not None:
+                        self.metrics.merge(data=result.metrics)
+                    results[index] = result
+        finally:
+            cls._worker_batch = None
+
+    @classmethod
+    def build_worker_record(cls, index: int) -> BuildBatchResult:
+        assert cls._worker_batch is not None
+        # workers inherit metrics of the parent, records metrics are sent
+        # back for merging only
+        metrics = cls._worker_batch.metrics
+        metrics.reset()
+        result = cls._worker_batch.build_record(index=index)
+        return result._replace(metrics=metrics.as_dict())
+
+    def build_record(self, index: int) -> BuildBatchResult:
+        record, operation = self._record_operations[index]
+        try:
+            if operation is None:
+                operation = self.prepare_record_operation(record=record)
+            operation.run()
+        except Exception as err:
+            return self.build_failed_result(record, err=err)
+        return BuildBatchResult(record=record)
+
+    def build_failed_result(
+        self, record: BuildBatchRecord, err: Exception
+    ) -> BuildBatchResult:
+        logger.warning("%r. building %r failed: %r.", self, record, err)
+        return BuildBatchResult(record=record, error=str(err) or repr(err))
+
+    def prepare_record_operation(
+        self, record: BuildBatchRecord
+    ) -> "BaseBuildBootstrapOperation":
+        try:
+            entry_point_module = self.bootstraps_registry.get_module(
+                name=record.bootstrap
+            )
+        except KeyError as err:
+            raise ValueError(f"Unknown bootstrap {record.bootstrap}") from err
+
+        parser = self.get_record_parser(name=record.bootstrap)
+        try:
+            namespace = parser.parse_args(record.arguments)
+        except ArgumentError as err:
+            raise ValueError(err.message) from err
+        namespace.bootstrap = record.bootstrap
+        namespace.destination_dir = record.destination
+        namespace.jobs = self.jobs
+
+        operation: "BaseBuildBootstrapOperation" = (
+            entry_point_module.BuildOperation()
+        )
+        operation.set_cli_namespace(namespace=namespace)
+        operation.set_metrics(value=self.metrics)
+        operation.set_bootstraps_registry(registry=self.bootstraps_registry)
+        operation.set_bootstrap_path(
+            path=self.find_bootstrap_path(entry_point_module)
+        )
+        operation.set_templates_cache(value=self.templates_cache)
+        # the context is built on running, it's validated here only
+        operation.build_context()
+        return operation
+
+    def get_record_parser(self, name: str) -> "ArgumentParser":
+        if self._record_parsers is None:
+            self._record_parsers = {}
+
+        try:
+            return self._record_parsers[name]
+        except KeyError:
+            pass
+
+        entry_point_module = self.bootstraps_registry.get_module(name=name)
+        parser = ArgumentParser(prog=name, exit_on_error=False)
+        entry_point_module.BuildOperation.prepare_cli_parser(
+            parser=parser, prefix=name
+        )
+        self._record_parsers[name] = parser
+        return parser
+
+    def print_summary(self, results: list[BuildBatchResult]):
+        for result in results:
+            record = result.record
+            if result.is_succeeded:
+                print(f"ok: {record.bootstrap} -> {record.destination}")
+            else:
+                print(
+                    f"failed: {record.bootstrap} -> {record.destination}:"
+                    f" {result.error}"
+                )
@@ -6,29 +6,66 @@ __all__ = (
 import logging
 import os
 import re
+import sys
 import typing as t
-from argparse import ArgumentTypeError
-from datetime import datetime
-from functools import cached_property
+from argparse import Action, ArgumentTypeError
+from contextlib import contextmanager, suppress
+from functools import cached_property, partial
 from pathlib import Path
 
-from py_bootstrap import PY_VERSION
-from py_bootstrap.files_processors import GenerateFilesProcessor
+from py_bootstrap import PY_VERSION, files_processors
+from py_bootstrap.base.operations import LazySubParsersAction
 
 from .base import BaseBootstrapsOperation
 
 if t.TYPE_CHECKING:
-    from argparse import ArgumentParser
+    from argparse import ArgumentParser, Namespace
+    from importlib.resources.abc import Traversable
+    from typing import BinaryIO
+
+    from py_bootstrap.files_processors import (
+        BuildManifest,
+        BuildPlan,
+        GenerateFilesProcessor,
+    )
+
+    from .bootstraps_registry import BootstrapsRegistry
 
 
 logger = logging.getLogger(__name__)
 
 
+class ApplyBuildPlanArgumentAction(Action):
+    def __call__(
+        self,
+        parser: "ArgumentParser",
+        namespace: "Namespace",
+        values: t.Any,
+        option_string: t.Optional[str] = None,
+    ):
+        setattr(namespace, self.dest, values)
+        # a plan contains a bootstrap path and a context already
+        for action in parser._actions:
+            if isinstance(action, LazySubParsersAction):
+                action.required = False
+
+
 class BuildBootstrapsDispatcherOperation(BaseBootstrapsOperation):
     cli_description = "Generates a skeleton of something from given bootstrap."
+    # the same as ArchivingFilesProcessor.archives_classes, files processors
+    # aren't imported for a help
+    archive_formats: t.ClassVar[tuple[str, ...]] = ("tar", "tar.gz", "zip")
 
     @classmethod
-    def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""):
+    def prepare_cli_parser(
+        cls,
+        parser: "ArgumentParser",
+        prefix: str = "",
+        registry: t.Optional["BootstrapsRegistry"] = None,
+    ):
+        if registry is None:
+            registry = cls.build_bootstraps_registry()
+
         parser.add_argument(
             "--dest",
             dest="destination_dir",
@@ -40,34 +77,173 @@ class BuildBootstrapsDispatcherOperation(BaseBootstrapsOperation):
             ),
         )
 
-        subparsers = parser.add_subparsers(
-            title="Found bootstraps", dest="bootstrap", required=True
+        writing_group = parser.add_mutually_exclusive_group()
+        writing_group.add_argument(
+            "--incremental",
+            dest="incremental",
+            action="store_true",
+            help=(
+                "Skips writing files with unchanged content. Keeps a manifest"
+                " of generated files in the destination directory."
+            ),
+        )
+        writing_group.add_argument(
+            "--staged",
+            dest="staged",
+            action="store_true",
+            help=(
+                "Generates files into a temporary sibling of the destination"
+                " directory and moves them into place after a successful"
+                " build only."
+            ),
+        )
+        writing_group.add_argument(
+            "--format",
+            dest="archive_format",
+            choices=cls.archive_formats,
+            default=None,
+            help=(
+                "Writes generated files into an archive of a given format"
+                " instead of the destination directory."
+            ),
         )
-        # prepare parsers for templates
-        for name, entry_point_module in cls.find_bootstraps():
-            template_parser = subparsers.add_parser(
-                name,
-                description=entry_point_module.BuildOperation.cli_description,
-                help=entry_point_module.BuildOperation.cli_description,
+        parser.add_argument(
+            "--output",
+            dest="archive_output",
+            type=str,
+            default="-",
+            metavar="PATH",
+            help=(
+                "Specifies a file for an archive of --format argument."
+                " Standard output by default."
+            ),
+        )
+
+        parser.add_argument(
+            "--dry-run",
+            dest="dry_run",
+            action="store_true",
+            help=(
+                "Prints a build plan in JSON format instead of generating"
+                " files."
+            ),
+        )
+        parser.add_argument(
+            "--apply-plan",
+            dest="plan",
+            type=cls.validate_cli_argument_plan,
+            action=ApplyBuildPlanArgumentAction,
+            metavar="PLAN_PATH",
+            help=(
+                "Generates files by a build plan from a given file."
+                " A bootstrap isn't required then."
+            ),
+        )
+        parser.add_argument(
+            "--max-bytes",
+            dest="max_bytes",
+            type=cls.validate_cli_argument_max_bytes,
+            default=None,
+            help="Rejects builds generating more bytes than given.",
+        )
+
+        cls.prepare_cli_argument_jobs(parser=parser)
+
+        subparsers = LazySubParsersAction.add_to_parser(
+            parser, title="Found bootstraps", dest="bootstrap", required=True
+        )
+        # prepare parsers for templates. bootstraps are imported only when
+        # they are selected in CLI arguments
+        for entry in registry.get_entries():
+            if entry.build_cli_description is None:
+                logger.warning(
+                    "%r. bootstrap %r does not provide BuildOperation.",
+                    cls,
+                    entry.name,
+                )
+                continue
+
+            subparsers.add_lazy_parser(
+                entry.name,
+                preparer=partial(
+                    cls.prepare_bootstrap_cli_parser,
+                    name=entry.name,
+                    registry=registry,
+                ),
+                description=entry.build_cli_description,
+                help=entry.build_cli_description,
             )
-            entry_point_module.BuildOperation.prepare_cli_parser(
-                parser=template_parser, prefix=name
+
+    @classmethod
+    def prepare_bootstrap_cli_parser(
+        cls,
+        parser: "ArgumentParser",
+        name: str,
+        registry: "BootstrapsRegistry",
+    ):
+        entry_point_module = registry.get_module(name=name)
+        entry_point_module.BuildOperation.prepare_cli_parser(
+            parser=parser, prefix=name
+        )
+
+    @classmethod
+    def validate_cli_argument_plan(cls, value: str) -> "BuildPlan":
+        try:
+            return files_processors.BuildPlan.loads(Path(value).read_text())
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            raise ArgumentTypeError(
+                f"Unable to read a build plan: {err}."
+            ) from err
+
+    @classmethod
+    def validate_cli_argument_max_bytes(cls, value: str) -> int:
+        try:
+            max_bytes = int(value)
+        except ValueError:
+            max_bytes = -1
+
+        if max_bytes < 0:
+            raise ArgumentTypeError(
+                "The max bytes should be a non-negative integer."
             )
+        return max_bytes
 
     def run(self):
-        bootstrap_name = self.cli_namespace.bootstrap
-        entry_points_modules_map = dict(self.find_bootstraps())
+        plan: t.Optional["BuildPlan"] = getattr(
+            self.cli_namespace, "plan", None
+        )
+        if plan is not None:
+            self.run_plan(plan=plan)
+            return
 
-        entry_point_module = entry_points_modules_map[bootstrap_name]
-        assert entry_point_module.__file__
+        bootstrap_name = self.cli_namespace.bootstrap
+        self.metrics.set_label(name="bootstrap", value=bootstrap_name)
+        entry_point_module = self.bootstraps_registry.get_module(
+            name=bootstrap_name
+        )
 
         operation: "BaseBuildBootstrapOperation" = (
             entry_point_module.BuildOperation()
         )
         operation.set_cli_namespace(namespace=self.cli_namespace)
+        operation.set_metrics(value=self.metrics)
+        operation.set_bootstraps_registry(registry=self.bootstraps_registry)
         operation.set_bootstrap_path(
-            path=Path(entry_point_module.__file__).parent
+            path=self.find_bootstrap_path(entry_point_module)
         )
+        if self._templates_cache is not None:
+            operation.set_templates_cache(value=self._templates_cache)
+        operation.run()
+
+    def run_plan(self, plan: "BuildPlan"):
+        # a bootstrap isn't imported, the plan is applied as it is
+        operation = BaseBuildBootstrapOperation()
+        operation.set_cli_namespace(namespace=self.cli_namespace)
+        operation.set_metrics(value=self.metrics)
+        operation.set_bootstraps_registry(registry=self.bootstraps_registry)
+        operation.set_plan(value=plan)
+        if self._templates_cache is not None:
+            operation.set_templates_cache(value=self._templates_cache)
         operation.run()
 
 
@@ -75,8 +251,10 @@ class BaseBuildBootstrapOperation(BaseBootstrapsOperation):
     cli_argument_name_help: t.ClassVar[str]
     cli_argument_description_help: t.ClassVar[str]
 
-    _bootstrap_path: "Path"
+    _bootstrap_path: "Traversable"
     _context: dict[str, str]
+    _plan: t.Optional["BuildPlan"] = None
+    _staging_path: t.Optional["Path"] = None
 
     @classmethod
     def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""):
@@ -104,7 +282,7 @@ class BaseBuildBootstrapOperation(BaseBootstrapsOperation):
         return value
 
     @cached_property
-    def bootstrap_path(self) -> "Path":
+    def bootstrap_path(self) -> "Traversable":
         return self._bootstrap_path
 
     @cached_property
@@ -113,15 +291,97 @@ class BaseBuildBootstrapOperation(BaseBootstrapsOperation):
             return Path(os.getcwd(), self._cli_namespace.destination_dir)
         return Path.cwd()
 
-    def set_bootstrap_path(self, path: "Path"):
+    @property
+    def output_path(self) -> "Path":
+        # files of staged builds are generated into a staging directory
+        if self._staging_path is not None:
+            return self._staging_path
+        return self.destination_path
+
+    @cached_property
+    def incremental(self) -> bool:
+        return getattr(self.cli_namespace, "incremental", False)
+
+    @cached_property
+    def staged(self) -> bool:
+        return getattr(self.cli_namespace, "staged", False)
+
+    @cached_property
+    def dry_run(self) -> bool:
+        return getattr(self.cli_namespace, "dry_run", False)
+
+    @cached_property
+    def archive_format(self) -> t.Optional[str]:
+        return getattr(self.cli_namespace, "archive_format", None)
+
+    @cached_property
+    def archive_output(self) -> str:
+        return getattr(self.cli_namespace, "archive_output", "-")
+
+    @cached_property
+    def max_bytes(self) -> t.Optional[int]:
+        return getattr(self.cli_namespace, "max_bytes", None)
+
+    def set_bootstrap_path(self, path: "Traversable"):
         self._bootstrap_path = path
 
+    def set_plan(self, value: "BuildPlan"):
+        self._plan = value
+
+    def prepare_files_processor(self, processor: "GenerateFilesProcessor"):
+        self.set_files_processor_source(
+            processor=processor, path=self.bootstrap_path
+        )
+        processor.set_jobs(value=self.jobs)
+        processor.set_metrics(value=self.metrics)
+        processor.set_context(value=self._context)
+        processor.set_entry_point_file_name(
+            value=f"{self.entry_point_module_name}.py"
+        )
+        if self._templates_cache is not None:
+            processor.set_templates_cache(value=self._templates_cache)
+
     def run(self):
-        self._context = self.build_context()
-        self.create_destination_dir()
-        self.populate_destination_dir()
+        if self.archive_format is None and self.archive_output != "-":
+            logger.error("The --output argument requires --format one.")
+            raise Exception("Archive format is not specified")
+
+        if self._plan is not None:
+            self.check_plan(plan=self._plan)
+            self.write_plan(plan=self._plan)
+            return
+
+        with self.metrics.measure(phase="context_building"):
+            self._context = self.build_context()
+        if not self.dry_run and self.max_bytes is None:
+            if self.archive_format is not None:
+                self.archive_bootstrap()
+                return
+
+            with self.prepare_output_dir():
+                self.populate_destination_dir()
+            return
+
+        plan = self.build_plan()
+        self.check_plan(plan=plan)
+        if self.dry_run:
+            print(plan.dumps())
+            return
+
+        self.write_plan(plan=plan)
+
+    def write_plan(self, plan: "BuildPlan"):
+        if self.archive_format is not None:
+            self.archive_bootstrap(plan=plan)
+            return
+
+        with self.prepare_output_dir():
+            self.apply_plan(plan=plan)
 
     def build_context(self) -> dict[str, str]:
+        # datetime is imported by building only, e.g. a help doesn't build
+        from datetime import datetime
+
         name = self.cli_namespace.name.strip()
         name_parts: list[str] = name.split("-")
 
@@ -156,12 +416,239 @@ class BaseBuildBootstrapOperation(BaseBootstrapsOperation):
             )
             raise Exception("Creating destination directory") from err
 
-    def populate_destination_dir(self):
-        processor = GenerateFilesProcessor()
-        processor.set_source_path(source_path=self.bootstrap_path)
-        processor.set_destination_path(destination_path=self.destination_path)
-        processor.set_context(value=self._context)
-        processor.set_entry_point_file_name(
-            value=f"{self.entry_point_module_name}.py"
+    @contextmanager
+    def prepare_output_dir(self) -> t.Iterator[None]:
+        if not self.staged:
+            self.create_destination_dir()
+            yield
+            return
+
+        staging_path = self.create_staging_dir()
+        self._staging_path = staging_path
+        # files processors log and count failed files instead of raising
+        failures_count = self.metrics.counters.get("failures", 0)
+        try:
+            yield
+            failures_count = (
+                self.metrics.counters.get("failures", 0) - failures_count
+            )
+            if failures_count:
+                logger.error(
+                    "%d files are not generated, the %r directory is left"
+                    " unchanged.",
+                    failures_count,
+                    self.destination_path,
+                )
+                raise Exception("Building staged bootstrap")
+
+            with self.metrics.measure(phase="publishing"):
+                self.publish_staging_dir(staging_path=staging_path)
+        finally:
+            # a failed build is cleaned up by removing one directory
+            self._staging_path = None
+            self.remove_staging_dir(staging_path=staging_path)
+
+    def create_staging_dir(self) -> "Path":
+        # tempfile is imported on demand, e.g. a help doesn't stage files
+        from tempfile import mkdtemp
+
+        # a sibling is on the same filesystem, so it's renamed atomically
+        parent_path = self.destination_path.parent
+        try:
+            os.makedirs(parent_path, exist_ok=True)
+            staging_path = Path(
+                mkdtemp(
+                    prefix=f".{self.destination_path.name}.",
+                    suffix=".staging",
+                    dir=parent_path,
+                )
+            )
+        except OSError as err:
+            logger.error(
+                "Unable to create a staging directory in %r. Error: %r.",
+                parent_path,
+                err,
+            )
+            raise Exception("Creating staging directory") from err
+
+        # temporary directories are private, a published one gets the mode
+        # of usual directories
+        umask = os.umask(0)
+        os.umask(umask)
+        staging_path.chmod(0o777 & ~umask)
+        logger.debug("%r. files are staged in %r.", self, staging_path)
+        return staging_path
+
+    def remove_staging_dir(self, staging_path: "Path"):
+        import shutil
+
+        shutil.rmtree(staging_path, ignore_errors=True)
+
+    def publish_staging_dir(self, staging_path: "Path"):
+        # a rename replaces existing empty directories too, e.g. a current
+        # directory, so files are merged into any existing destination
+        if not os.path.lexists(self.destination_path):
+            try:
+                os.rename(staging_path, self.destination_path)
+            except OSError as err:
+                logger.debug(
+                    "%r. staged files are merged into %r: %r.",
+                    self,
+                    self.destination_path,
+                    err,
+                )
+            else:
+                logger.debug(
+                    "%r. staged directory is renamed into %r.",
+                    self,
+                    self.destination_path,
+                )
+                return
+
+        try:
+            self.merge_staging_dir(staging_path=staging_path)
+        except OSError as err:
+            logger.error(
+                "Unable to move staged files into the %r directory."
+                " Error: %r.",
+                self.destination_path,
+                err,
+            )
+            raise Exception("Publishing staged bootstrap") from err
+
+    def merge_staging_dir(self, staging_path: "Path"):
+        # every file is replaced atomically, readers see either an old or
+        # a new content
+        self.destination_path.mkdir(parents=True, exist_ok=True)
+        for root_path, dirs_names, files_names in staging_path.walk():
+            destination_root_path = (
+                self.destination_path / root_path.relative_to(staging_path)
+            )
+            for dir_name in dirs_names:
+                (destination_root_path / dir_name).mkdir(exist_ok=True)
+            for file_name in files_names:
+                os.replace(
+                    root_path / file_name, destination_root_path / file_name
+                )
+
+    def build_plan(self) -> "BuildPlan":
+        processor = files_processors.PlanningFilesProcessor()
+        self.prepare_files_processor(processor=processor)
+        processor.run()
+        return processor.plan
+
+    def check_plan(self, plan: "BuildPlan"):
+        if self.max_bytes is not None and plan.total_size > self.max_bytes:
+            logger.error(
+                "The build plan generates %d bytes, %d bytes are allowed.",
+                plan.total_size,
+                self.max_bytes,
+            )
+            raise Exception("Build plan is too big")
+
+    def prepare_plan_files_processor(
+        self, processor: "GenerateFilesProcessor", plan: "BuildPlan"
+    ):
+        self.set_files_processor_source(
+            processor=processor, path=Path(plan.bootstrap_path)
         )
+        processor.set_jobs(value=self.jobs)
+        processor.set_metrics(value=self.metrics)
+        processor.set_context(value=plan.context)
+        if self._templates_cache is not None:
+            processor.set_templates_cache(value=self._templates_cache)
+
+    def apply_plan(self, plan: "BuildPlan"):
+        processor = files_processors.GenerateFilesProcessor()
+        self.prepare_plan_files_processor(processor=processor, plan=plan)
+        processor.set_destination_path(destination_path=self.output_path)
+
+        manifest = self.build_manifest(context=plan.context)
+        if manifest is not None:
+            processor.set_manifest(value=manifest)
+
+        processor.apply_plan(plan=plan)
+
+        if manifest is not None:
+            manifest.save()
+
+    def archive_bootstrap(self, plan: t.Optional["BuildPlan"] = None):
+        assert self.archive_format is not None
+        processor = files_processors.ArchivingFilesProcessor()
+        if plan is None:
+            self.prepare_files_processor(processor=processor)
+        else:
+            self.prepare_plan_files_processor(processor=processor, plan=plan)
+        archive = processor.build_archive(format_name=self.archive_format)
+        processor.set_archive(value=archive)
+
+        failures_count = self.metrics.counters.get("failures", 0)
+        with self.open_archive_output() as stream:
+            archive.open(stream=stream)
+            if plan is None:
+                processor.run()
+            else:
+                processor.apply_plan(plan=plan)
+            archive.close()
+
+            failures_count = (
+                self.metrics.counters.get("failures", 0) - failures_count
+            )
+            if failures_count:
+                logger.error(
+                    "%d files are not archived, the archive is incomplete.",
+                    failures_count,
+                )
+                raise Exception("Archiving bootstrap")
+
+    @contextmanager
+    def open_archive_output(self) -> t.Iterator["BinaryIO"]:
+        if self.archive_output == "-":
+            yield sys.stdout.buffer
+            sys.stdout.buffer.flush()
+            return
+
+        # an archive appears complete or doesn't appear at all
+        archive_path = Path(os.getcwd(), self.archive_output)
+        tmp_path = archive_path.with_name(f".{archive_path.name}.{os.getpid()}")
+        try:
+            stream = tmp_path.open("wb")
+        except OSError as err:
+            logger.error(
+                "Unable to write the %r archive. Error: %r.", archive_path, err
+            )
+            raise Exception("Opening archive output") from err
+
+        try:
+            with stream:
+                yield stream
+            os.replace(tmp_path, archive_path)
+        finally:
+            with suppress(FileNotFoundError):
+                tmp_path.unlink()
+
+    def populate_destination_dir(self):
+        processor = files_processors.GenerateFilesProcessor()
+        self.prepare_files_processor(processor=processor)
+        processor.set_destination_path(destination_path=self.output_path)
+
+        manifest = self.build_manifest(context=self._context)
+        if manifest is not None:
+            processor.set_manifest(value=manifest)
+
         processor.run()
+
+        if manifest is not None:
+            manifest.save()
+
+    def build_manifest(
+        self, context: dict[str, str]
+    ) -> t.Optional["BuildManifest"]:
+        if not self.incremental:
+            return None
+
+        manifest = files_processors.BuildManifest()
+        manifest.set_destination_path(destination_path=self.destination_path)
+        manifest.set_context(value=context)
+        manifest.load()
+        return manifest
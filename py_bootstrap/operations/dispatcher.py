@@ -2,81 +2,111 @@ __all__ = ("BootstrapsDispatcher",)
 
 import logging
 import typing as t
+from functools import partial
+from importlib import import_module
+
+from py_bootstrap.base.operations import LazySubParsersAction
 
 from .base import BaseBootstrapsOperation
-from .build_bootstrap import BuildBootstrapsDispatcherOperation
-from .export_bootstrap import ExportBootstrapsDispatcherOperation
-from .list_bootstraps import ListBootstrapsOperation
-from .register_bootstrap import RegisterBootstrapOperation
 
 if t.TYPE_CHECKING:
     from argparse import ArgumentParser
 
+    from .bootstraps_registry import BootstrapsRegistry
+    from .serve import ServeBootstrapsOperation
+
 logger = logging.getLogger(__name__)
 
 
 class BootstrapsDispatcher(BaseBootstrapsOperation):
     cli_description = "Bootstrapping Python projects management tool."
 
-    op_list_cls = ListBootstrapsOperation
-    op_build_cls = BuildBootstrapsDispatcherOperation
-    op_export_cls = ExportBootstrapsDispatcherOperation
-    op_register_cls = RegisterBootstrapOperation
+    # operations modules are imported when they're selected, a help and
+    # other operations don't import them
+    operations_classes_paths: t.ClassVar[dict[str, str]] = {
+        "list": ".list_bootstraps.ListBootstrapsOperation",
+        "build": ".build_bootstrap.BuildBootstrapsDispatcherOperation",
+        "build-batch": ".build_batch.BuildBatchOperation",
+        "export": ".export_bootstrap.ExportBootstrapsDispatcherOperation",
+        "register": ".register_bootstrap.RegisterBootstrapOperation",
+        "serve": ".serve.ServeBootstrapsOperation",
+    }
+    # the same as cli_description of operations classes
+    operations_descriptions: t.ClassVar[dict[str, str]] = {
+        "list": (
+            "Finds and prints the list of available bootstraps"
+            " with brief description."
+        ),
+        "build": "Generates a skeleton of something from given bootstrap.",
+        "build-batch": "Generates skeletons of many projects from a spec file.",
+        "export": "Exports a bootstrap by given name.",
+        "register": "Registers a new bootstrap.",
+        "serve": (
+            "Serves build, export and list requests over a Unix domain socket."
+        ),
+    }
+    # bootstraps parsers of the operations are prepared from the registry
+    registry_operations: t.ClassVar[tuple[str, ...]] = ("build", "export")
+
+    @classmethod
+    def get_operation_cls(cls, name: str) -> type["BaseBootstrapsOperation"]:
+        module_name, _, cls_name = cls.operations_classes_paths[
+            name
+        ].rpartition(".")
+        return getattr(import_module(module_name, __package__), cls_name)
 
     @classmethod
-    def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""):
-        subparsers = parser.add_subparsers(
+    def prepare_cli_parser(
+        cls,
+        parser: "ArgumentParser",
+        prefix: str = "",
+        registry: t.Optional["BootstrapsRegistry"] = None,
+    ):
+        if registry is None:
+            registry = cls.build_bootstraps_registry()
+
+        subparsers = LazySubParsersAction.add_to_parser(
+            parser,
             title="Bootstraps management operations",
             dest="operation",
             required=True,
         )
-        list_parser = subparsers.add_parser(
-            "list",
-            description=cls.op_list_cls.cli_description,
-            help=cls.op_list_cls.cli_description,
-        )
-        cls.op_list_cls.prepare_cli_parser(parser=list_parser, prefix="list")
-
-        build_parser = subparsers.add_parser(
-            "build",
-            description=cls.op_build_cls.cli_description,
-            help=cls.op_build_cls.cli_description,
-        )
-        cls.op_build_cls.prepare_cli_parser(parser=build_parser, prefix="build")
+        for name in cls.operations_classes_paths:
+            kwargs: dict[str, t.Any] = {}
+            if name in cls.registry_operations:
+                kwargs["registry"] = registry
+            subparsers.add_lazy_parser(
+                name,
+                preparer=partial(
+                    cls.prepare_operation_cli_parser, name=name, **kwargs
+                ),
+                description=cls.operations_descriptions[name],
+                help=cls.operations_descriptions[name],
+            )
 
-        export_parser = subparsers.add_parser(
-            "export",
-            description=cls.op_export_cls.cli_description,
-            help=cls.op_export_cls.cli_description,
-        )
-        cls.op_export_cls.prepare_cli_parser(
-            parser=export_parser, prefix="export"
-        )
-
-        register_parser = subparsers.add_parser(
-            "register",
-            description=cls.op_register_cls.cli_description,
-            help=cls.op_register_cls.cli_description,
-        )
-        cls.op_register_cls.prepare_cli_parser(
-            parser=register_parser, prefix="register"
-        )
+    @classmethod
+    def prepare_operation_cli_parser(
+        cls, parser: "ArgumentParser", name: str, **kwargs
+    ):
+        operation_cls = cls.get_operation_cls(name=name)
+        operation_cls.prepare_cli_parser(parser=parser, prefix=name, **kwargs)
 
     def run(self):
         operation_name = self.cli_namespace.operation
-        operation: "BaseBootstrapsOperation"
-        match operation_name:
-            case "list":
-                operation = self.op_list_cls()
-            case "build":
-                operation = self.op_build_cls()
-            case "export":
-                operation = self.op_export_cls()
-            case "register":
-                operation = self.op_register_cls()
-            case _:
-                logger.error("r. unknown operation: %s", operation_name)
-                raise ValueError(f"Unknown operation {operation_name}")
+        if operation_name not in self.operations_classes_paths:
+            logger.error("%r. unknown operation: %s", self, operation_name)
+            raise ValueError(f"Unknown operation {operation_name}")
+
+        operation = self.get_operation_cls(name=operation_name)()
+        if operation_name == "serve":
+            # requests are dispatched by the same dispatcher class
+            t.cast("ServeBootstrapsOperation", operation).set_dispatcher_cls(
+                value=type(self)
+            )
 
         operation.set_cli_namespace(self.cli_namespace)
+        operation.set_metrics(value=self.metrics)
+        operation.set_bootstraps_registry(registry=self.bootstraps_registry)
+        if self._templates_cache is not None:
+            operation.set_templates_cache(value=self._templates_cache)
         operation.run()
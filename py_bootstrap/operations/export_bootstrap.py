@@ -6,15 +6,19 @@ __all__ = (
 import logging
 import os
 import typing as t
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
 
-from py_bootstrap.files_processors import CopyFilesProcessor
+from py_bootstrap import files_processors
+from py_bootstrap.base.operations import LazySubParsersAction
 
 from .base import BaseBootstrapsOperation
 
 if t.TYPE_CHECKING:
     from argparse import ArgumentParser
+    from importlib.resources.abc import Traversable
+
+    from .bootstraps_registry import BootstrapsRegistry
 
 
 logger = logging.getLogger(__name__)
@@ -24,7 +28,15 @@ class ExportBootstrapsDispatcherOperation(BaseBootstrapsOperation):
     cli_description = "Exports a bootstrap by given name."
 
     @classmethod
-    def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""):
+    def prepare_cli_parser(
+        cls,
+        parser: "ArgumentParser",
+        prefix: str = "",
+        registry: t.Optional["BootstrapsRegistry"] = None,
+    ):
+        if registry is None:
+            registry = cls.build_bootstraps_registry()
+
         parser.add_argument(
             "--dest",
             dest="destination_dir",
@@ -36,46 +48,86 @@ class ExportBootstrapsDispatcherOperation(BaseBootstrapsOperation):
             ),
         )
 
-        subparsers = parser.add_subparsers(
-            title="Found bootstraps", dest="bootstrap", required=True
+        parser.add_argument(
+            "--link-mode",
+            dest="link_mode",
+            choices=files_processors.FilesCopier.link_modes,
+            default="copy",
+            help=(
+                "Specifies how files are exported. hardlink and symlink"
+                " files share content with the registered bootstrap, editing"
+                " them in place corrupts the installed templates. Files are"
+                " copied if linking isn't possible. copy by default."
+            ),
+        )
+
+        cls.prepare_cli_argument_jobs(parser=parser)
+
+        subparsers = LazySubParsersAction.add_to_parser(
+            parser, title="Found bootstraps", dest="bootstrap", required=True
         )
-        # prepare parsers for templates
-        for name, entry_point_module in cls.find_bootstraps():
-            template_parser = subparsers.add_parser(
-                name,
-                description=entry_point_module.ExportOperation.cli_description,
-                help=entry_point_module.ExportOperation.cli_description,
-            )
-            entry_point_module.ExportOperation.prepare_cli_parser(
-                parser=template_parser, prefix=name
+        # prepare parsers for templates. bootstraps are imported only when
+        # they are selected in CLI arguments
+        for entry in registry.get_entries():
+            if entry.export_cli_description is None:
+                logger.warning(
+                    "%r. bootstrap %r does not provide ExportOperation.",
+                    cls,
+                    entry.name,
+                )
+                continue
+
+            subparsers.add_lazy_parser(
+                entry.name,
+                preparer=partial(
+                    cls.prepare_bootstrap_cli_parser,
+                    name=entry.name,
+                    registry=registry,
+                ),
+                description=entry.export_cli_description,
+                help=entry.export_cli_description,
             )
 
+    @classmethod
+    def prepare_bootstrap_cli_parser(
+        cls,
+        parser: "ArgumentParser",
+        name: str,
+        registry: "BootstrapsRegistry",
+    ):
+        entry_point_module = registry.get_module(name=name)
+        entry_point_module.ExportOperation.prepare_cli_parser(
+            parser=parser, prefix=name
+        )
+
     def run(self):
         bootstrap_name = self.cli_namespace.bootstrap
-        entry_points_modules_map = dict(self.find_bootstraps())
-
-        entry_point_module = entry_points_modules_map[bootstrap_name]
-        assert entry_point_module.__file__
+        self.metrics.set_label(name="bootstrap", value=bootstrap_name)
+        entry_point_module = self.bootstraps_registry.get_module(
+            name=bootstrap_name
+        )
 
         operation: "BaseExportBootstrapOperation" = (
             entry_point_module.ExportOperation()
         )
 
         operation.set_cli_namespace(namespace=self.cli_namespace)
+        operation.set_metrics(value=self.metrics)
+        operation.set_bootstraps_registry(registry=self.bootstraps_registry)
         operation.set_bootstrap_path(
-            path=Path(entry_point_module.__file__).parent
+            path=self.find_bootstrap_path(entry_point_module)
         )
         operation.run()
 
 
 class BaseExportBootstrapOperation(BaseBootstrapsOperation):
-    _bootstrap_path: "Path"
+    _bootstrap_path: "Traversable"
 
     @classmethod
     def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""): ...
 
     @cached_property
-    def bootstrap_path(self) -> "Path":
+    def bootstrap_path(self) -> "Traversable":
         return self._bootstrap_path
 
     @cached_property
@@ -84,7 +136,11 @@ class BaseExportBootstrapOperation(BaseBootstrapsOperation):
             return Path(os.getcwd(), self._cli_namespace.destination_dir)
         return Path.cwd()
 
-    def set_bootstrap_path(self, path: "Path"):
+    @cached_property
+    def link_mode(self) -> str:
+        return getattr(self.cli_namespace, "link_mode", "copy")
+
+    def set_bootstrap_path(self, path: "Traversable"):
         self._bootstrap_path = path
 
     def run(self):
@@ -103,7 +159,21 @@ class BaseExportBootstrapOperation(BaseBootstrapsOperation):
             raise Exception("Creating destination directory") from err
 
     def populate_destination_dir(self):
-        processor = CopyFilesProcessor()
-        processor.set_source_path(source_path=self.bootstrap_path)
+        if self.link_mode in files_processors.FilesCopier.sharing_link_modes:
+            logger.warning(
+                "%r. files are exported by %s, editing them in place"
+                " corrupts the installed templates in %s.",
+                self,
+                self.link_mode,
+                self.bootstrap_path,
+            )
+
+        processor = files_processors.CopyFilesProcessor()
+        self.set_files_processor_source(
+            processor=processor, path=self.bootstrap_path
+        )
         processor.set_destination_path(destination_path=self.destination_path)
+        processor.set_jobs(value=self.jobs)
+        processor.set_metrics(value=self.metrics)
+        processor.files_copier.set_link_mode(value=self.link_mode)
         processor.run()
@@ -7,7 +7,8 @@ from .base import BaseBootstrapsOperation
 
 if t.TYPE_CHECKING:
     from argparse import ArgumentParser
-    from types import ModuleType
+
+    from .bootstraps_index import BootstrapsIndexEntry
 
 
 logger = logging.getLogger(__name__)
@@ -23,16 +24,16 @@ class ListBootstrapsOperation(BaseBootstrapsOperation):
     def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""): ...
 
     def run(self):
-        for name, entry_point_module in self.find_bootstraps():
-            self.process_bootstrap_entry_point(
-                name=name, module=entry_point_module
-            )
+        for entry in self.bootstraps_registry.get_entries():
+            self.process_bootstrap_entry(entry=entry)
 
-    def process_bootstrap_entry_point(self, name: str, module: "ModuleType"):
-        try:
-            print(f"{name}: {module.DESCRIPTION}")
-        except Exception as err:
+    def process_bootstrap_entry(self, entry: "BootstrapsIndexEntry"):
+        if entry.description is None:
             logger.warning(
-                "%r. failed to print description for %r: %s.", self, name, err
+                "%r. failed to print description for %r: DESCRIPTION is missed.",
+                self,
+                entry.name,
             )
             return
+
+        print(f"{entry.name}: {entry.description}")
@@ -1,20 +1,21 @@
 __all__ = ("RegisterBootstrapOperation",)
 
 import logging
-import shutil
 import typing as t
 from argparse import ArgumentTypeError
 from functools import cached_property
 from pathlib import Path
 
 import py_bootstrap.templates as templates_module
-from py_bootstrap.files_processors import CopyFilesProcessor
+from py_bootstrap import files_processors
 
 from .base import BaseBootstrapsOperation
 
 if t.TYPE_CHECKING:
     from argparse import ArgumentParser
 
+    from py_bootstrap.files_processors import CopyFilesProcessor
+
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,15 @@ class RegisterBootstrapOperation(BaseBootstrapsOperation):
                 " Current directory by default."
             ),
         )
+        parser.add_argument(
+            "--archive",
+            dest="archive",
+            action="store_true",
+            help=(
+                "Registers the bootstrap as a single-file archive instead"
+                " of a directory."
+            ),
+        )
         parser.add_argument(
             "-y",
             "--yes-upload",
@@ -49,6 +59,7 @@ class RegisterBootstrapOperation(BaseBootstrapsOperation):
             action="store_true",
             help="Do not prompt for confirmation.",
         )
+        cls.prepare_cli_argument_jobs(parser=parser)
 
     @classmethod
     def validate_cli_argument_source_path(cls, value: str) -> "Path":
@@ -65,6 +76,16 @@ class RegisterBootstrapOperation(BaseBootstrapsOperation):
     def bootstrap_path(self) -> "Path":
         return Path(self.templates_path) / self._cli_namespace.bootstrap_name
 
+    @cached_property
+    def archive_path(self) -> "Path":
+        return self.bootstrap_path.with_name(
+            f"{self.bootstrap_path.name}{files_processors.BootstrapArchive.suffix}"
+        )
+
+    @cached_property
+    def archive(self) -> bool:
+        return getattr(self.cli_namespace, "archive", False)
+
     @cached_property
     def source_path(self) -> "Path":
         return self._cli_namespace.source_path
@@ -83,6 +104,7 @@ class RegisterBootstrapOperation(BaseBootstrapsOperation):
 
         self.prepare_bootstrap_dir()
         self.populate_bootstrap_dir()
+        self.bootstraps_registry.invalidate()
 
     def validate_source_dir(self):
         entry_point_path = (
@@ -115,13 +137,26 @@ class RegisterBootstrapOperation(BaseBootstrapsOperation):
             )
 
     def prepare_bootstrap_dir(self):
+        # a bootstrap is registered either as a directory or as an archive,
+        # shutil is imported by registering only
+        import shutil
+
         if self.bootstrap_path.exists():
             shutil.rmtree(self.bootstrap_path)
+        self.archive_path.unlink(missing_ok=True)
 
-        self.bootstrap_path.mkdir()
+        if not self.archive:
+            self.bootstrap_path.mkdir()
 
     def populate_bootstrap_dir(self):
-        processor = CopyFilesProcessor()
+        processor: "CopyFilesProcessor"
+        if self.archive:
+            processor = files_processors.PackFilesProcessor()
+            processor.set_destination_path(destination_path=self.archive_path)
+        else:
+            processor = files_processors.CopyFilesProcessor()
+            processor.set_destination_path(destination_path=self.bootstrap_path)
         processor.set_source_path(source_path=self.source_path)
-        processor.set_destination_path(destination_path=self.bootstrap_path)
+        processor.set_jobs(value=self.jobs)
+        processor.set_metrics(value=self.metrics)
         processor.run()
@@ -0,0 +1,245 @@
+__all__ = ("ServeBootstrapsOperation",)
+
+import logging
+import os
+import sys
+import typing as t
+from argparse import ArgumentParser, ArgumentTypeError
+from functools import cached_property
+from pathlib import Path
+
+from py_bootstrap.base.metrics import OperationMetrics
+from py_bootstrap.base.operations import (
+    BaseOperationsRunner,
+    LazySubParsersAction,
+)
+
+from .base import BaseBootstrapsOperation
+
+if t.TYPE_CHECKING:
+    from argparse import Namespace
+
+    from .dispatcher import BootstrapsDispatcher
+
+
+logger = logging.getLogger(__name__)
+
+
+class ServeBootstrapsOperation(BaseBootstrapsOperation):
+    cli_description = (
+        "Serves build, export and list requests over a Unix domain socket."
+    )
+    cli_prog: t.ClassVar[str] = "bootstrap"
+
+    _dispatcher_cls: type["BootstrapsDispatcher"]
+    _cli_parser: t.Optional["ArgumentParser"] = None
+    _fingerprint: t.Optional[str] = None
+
+    @classmethod
+    def prepare_cli_parser(cls, parser: "ArgumentParser", prefix: str = ""):
+        # the protocol is imported on demand, e.g. a build doesn't serve
+        from py_bootstrap.base import serving
+
+        socket_path = os.environ.get(serving.SOCKET_ENV_NAME)
+        parser.add_argument(
+            "--socket",
+            dest="socket_path",
+            default=socket_path or None,
+            required=not socket_path,
+            metavar="PATH",
+            help=(
+                "Specifies a path of the Unix domain socket."
+                f" {serving.SOCKET_ENV_NAME} environment variable by default."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            dest="workers",
+            type=cls.validate_cli_argument_workers,
+            default=os.process_cpu_count() or 1,
+            help=(
+                "Specifies a number of requests processed concurrently."
+                " A number of CPUs by default."
+            ),
+        )
+
+    @classmethod
+    def validate_cli_argument_workers(cls, value: str) -> int:
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+
+        if workers < 1:
+            raise ArgumentTypeError("The workers should be a positive integer.")
+        return workers
+
+    @cached_property
+    def socket_path(self) -> "Path":
+        return Path(os.getcwd(), self.cli_namespace.socket_path)
+
+    @cached_property
+    def workers(self) -> int:
+        return getattr(self.cli_namespace, "workers", 1)
+
+    @property
+    def cli_parser(self) -> "ArgumentParser":
+        if self._cli_parser is None:
+            self._cli_parser = self.build_served_cli_parser()
+        return self._cli_parser
+
+    def set_dispatcher_cls(self, value: type["BootstrapsDispatcher"]):
+        self._dispatcher_cls = value
+
+    def run(self):
+        import signal
+
+        # sockets are imported on demand, e.g. a help doesn't serve
+        from .serve_server import BootstrapsServer
+
+        self.warm_up()
+        server = BootstrapsServer.listen(path=self.socket_path)
+        server.set_operation(value=self)
+        # a forked child serves a request, the server waits for finishing
+        # of one of children before accepting more requests
+        server.max_children = self.workers
+        logger.info(
+            "%r. requests are served on %r by %d workers.",
+            self,
+            self.socket_path,
+            self.workers,
+        )
+        # service managers stop servers by SIGTERM, the socket is removed
+        # like after interrupting
+        termination_handler = signal.signal(
+            signal.SIGTERM, self.handle_termination
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("%r. serving is stopped.", self)
+        finally:
+            signal.signal(signal.SIGTERM, termination_handler)
+            server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def handle_termination(self, signum: int, frame: t.Any):
+        raise KeyboardInterrupt
+
+    def warm_up(self):
+        # children are forked with imported bootstraps, prepared parsers and
+        # compiled templates
+        with self.metrics.measure(phase="warming_up"):
+            self._fingerprint = self.compute_bootstraps_fingerprint()
+            bootstrap_paths = []
+            for entry in self.bootstraps_registry.get_entries():
+                try:
+                    entry_point_module = self.bootstraps_registry.get_module(
+                        name=entry.name
+                    )
+                except Exception as err:
+                    logger.exception(
+                        "%r. bootstrap %r importing failed: %r.",
+                        self,
+                        entry.name,
+                        err,
+                    )
+                    continue
+                bootstrap_paths.append(
+                    self.find_bootstrap_path(entry_point_module)
+                )
+
+            self._cli_parser = self.build_served_cli_parser()
+            self.warm_up_templates_cache(bootstrap_paths=bootstrap_paths)
+        logger.info(
+            "%r. %d bootstraps are warmed up.", self, len(bootstrap_paths)
+        )
+
+    def compute_bootstraps_fingerprint(self) -> str:
+        from .bootstraps_index import BootstrapsIndex
+
+        index = BootstrapsIndex()
+        index.set_operation_cls(type(self))
+        return index.compute_fingerprint()
+
+    def build_served_cli_parser(self) -> "ArgumentParser":
+        parser = ArgumentParser(
+            prog=self.cli_prog, description=self._dispatcher_cls.cli_description
+        )
+        # runner options are accepted like by the CLI, metrics are saved
+        BaseOperationsRunner.prepare_runner_cli_parser(parser=parser)
+        self._dispatcher_cls.prepare_cli_parser(
+            parser=parser, registry=self.bootstraps_registry
+        )
+        for action in parser._actions:
+            if not isinstance(action, LazySubParsersAction):
+                continue
+            try:
+                action.prepare_lazy_parsers()
+            except Exception as err:
+                # the rest parsers are prepared on parsing requests
+                logger.exception(
+                    "%r. CLI parsers preparing failed: %r.", self, err
+                )
+        return parser
+
+    def refresh(self):
+        # entry-points and bootstraps changes are found by the fingerprint of
+        # the bootstraps index, templates are checked by the cache itself
+        fingerprint = self.compute_bootstraps_fingerprint()
+        if fingerprint == self._fingerprint:
+            return
+
+        logger.info("%r. bootstraps are changed, caches are refreshed.", self)
+        self.bootstraps_registry.invalidate()
+        self.warm_up()
+
+    def run_request(self, cli_args: list[str], cwd: str) -> int:
+        metrics = OperationMetrics()
+        metrics.set_label(name="prog", value=self.cli_prog)
+        metrics_path = None
+        try:
+            os.chdir(cwd)
+            with metrics.measure(phase="argument_parsing"):
+                # runner options are parsed before like by the CLI
+                runner_namespace = self.parse_runner_cli_args(cli_args)
+                metrics_path = runner_namespace.metrics_path
+                namespace, _ = self.cli_parser.parse_known_args(cli_args)
+
+            operation = self._dispatcher_cls()
+            operation.set_cli_namespace(namespace=namespace)
+            operation.set_metrics(value=metrics)
+            operation.set_bootstraps_registry(registry=self.bootstraps_registry)
+            operation.set_templates_cache(value=self.templates_cache)
+            with metrics.measure(phase="running"):
+                operation.run()
+        except SystemExit as err:
+            return self.get_exit_status(err=err)
+        except Exception:
+            # the same output as a failed CLI run has
+            import traceback
+
+            traceback.print_exc()
+            return 1
+        finally:
+            # metrics of failed runs are saved too
+            if metrics_path is not None:
+                metrics.dump(path=Path(metrics_path))
+        return 0
+
+    def parse_runner_cli_args(self, cli_args: list[str]) -> "Namespace":
+        parser = ArgumentParser(
+            prog=self.cli_prog, add_help=False, allow_abbrev=False
+        )
+        BaseOperationsRunner.prepare_runner_cli_parser(parser=parser)
+        namespace, _ = parser.parse_known_args(cli_args)
+        return namespace
+
+    @staticmethod
+    def get_exit_status(err: SystemExit) -> int:
+        if err.code is None:
+            return 0
+        if isinstance(err.code, int):
+            return err.code
+        print(err.code, file=sys.stderr)
+        return 1
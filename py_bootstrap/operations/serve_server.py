@@ -0,0 +1,139 @@
+__all__ = (
+    "BootstrapsServer",
+    "BootstrapsRequestHandler",
+)
+
+import io
+import logging
+import os
+import socket
+import sys
+import typing as t
+from socketserver import ForkingUnixStreamServer, StreamRequestHandler
+
+from py_bootstrap.base import serving
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+    from typing import BinaryIO
+
+    from .serve import ServeBootstrapsOperation
+
+
+logger = logging.getLogger(__name__)
+
+
+class BootstrapsRequestHandler(StreamRequestHandler):
+    server: "BootstrapsServer"
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            # a client is disconnected, e.g. a probe of a starting server
+            return
+
+        try:
+            cli_args, cwd = serving.load_request(line)
+        except (ValueError, KeyError, TypeError) as err:
+            self.write_error(message=f"Invalid request: {err!r}.", status=2)
+            return
+        if not cli_args or cli_args[0] not in serving.SERVED_OPERATIONS:
+            self.write_error(
+                message=f"{cli_args[:1]} operation isn't served.", status=2
+            )
+            return
+
+        # the request is handled by a forked child, so output streams and
+        # a working directory belong to it only
+        stdout = self.build_frames_stream(kind=serving.STDOUT_FRAME)
+        stderr = self.build_frames_stream(
+            kind=serving.STDERR_FRAME, line_buffering=True
+        )
+        sys.stdout, sys.stderr = stdout, stderr
+        try:
+            status = self.server.operation.run_request(
+                cli_args=cli_args, cwd=cwd
+            )
+        finally:
+            stdout.flush()
+            stderr.flush()
+        serving.write_exit_frame(stream=self.stream, status=status)
+
+    @property
+    def stream(self) -> "BinaryIO":
+        return t.cast("BinaryIO", self.wfile)
+
+    def build_frames_stream(
+        self, kind: bytes, line_buffering: bool = False
+    ) -> io.TextIOWrapper:
+        return io.TextIOWrapper(
+            io.BufferedWriter(
+                serving.FramesWriter(stream=self.stream, kind=kind)
+            ),
+            encoding="utf-8",
+            line_buffering=line_buffering,
+        )
+
+    def write_error(self, message: str, status: int):
+        serving.write_frame(
+            stream=self.stream,
+            kind=serving.STDERR_FRAME,
+            data=f"{self.server.operation.cli_prog}: {message}\n".encode(),
+        )
+        serving.write_exit_frame(stream=self.stream, status=status)
+
+
+class BootstrapsServer(ForkingUnixStreamServer):
+    # the socket gives the same access as the CLI, so it's private for a user
+    # from its creation
+    socket_umask: t.ClassVar[int] = 0o177
+
+    _operation: "ServeBootstrapsOperation"
+
+    @classmethod
+    def listen(cls, path: "Path") -> "BootstrapsServer":
+        cls.remove_stale_socket(path=path)
+        return cls(str(path), BootstrapsRequestHandler)
+
+    @classmethod
+    def remove_stale_socket(cls, path: "Path"):
+        if not path.is_socket():
+            return
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # a socket of a killed server
+                path.unlink(missing_ok=True)
+                return
+
+        logger.error("%r. socket %r is served already.", cls, path)
+        raise Exception("Socket is served already")
+
+    @property
+    def operation(self) -> "ServeBootstrapsOperation":
+        return self._operation
+
+    def set_operation(self, value: "ServeBootstrapsOperation"):
+        self._operation = value
+
+    def server_bind(self):
+        umask = os.umask(self.socket_umask)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def handle_error(self, request, client_address):
+        # a child serves a request, errors are logged instead of printing
+        logger.exception("%r. request serving failed.", self)
+
+    def process_request(self, request, client_address):
+        # changed bootstraps are reloaded before forking, so children inherit
+        # fresh caches
+        try:
+            self._operation.refresh()
+        except Exception as err:
+            logger.exception("%r. caches refreshing failed: %r.", self, err)
+        super().process_request(request, client_address)
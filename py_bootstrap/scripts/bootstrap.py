@@ -6,12 +6,41 @@ from py_bootstrap.base.operations import BaseOperationsRunner
 from py_bootstrap.operations import BootstrapsDispatcher
 
 if t.TYPE_CHECKING:
-    ...
+    from argparse import ArgumentParser
+
+    from py_bootstrap.operations.bootstraps_registry import BootstrapsRegistry
 
 
 class BootstrapsRunner(BaseOperationsRunner):
     cli_prog = "bootstrap"
-    operation_cls = BootstrapsDispatcher
+    operation_cls: t.ClassVar[type["BootstrapsDispatcher"]] = (
+        BootstrapsDispatcher
+    )
+
+    _bootstraps_registry: t.Optional["BootstrapsRegistry"] = None
+    _operation: "BootstrapsDispatcher"
+
+    @property
+    def bootstraps_registry(self) -> "BootstrapsRegistry":
+        if self._bootstraps_registry is None:
+            self._bootstraps_registry = (
+                self.operation_cls.build_bootstraps_registry()
+            )
+            self._bootstraps_registry.set_metrics(value=self.metrics)
+        return self._bootstraps_registry
+
+    def set_bootstraps_registry(self, registry: "BootstrapsRegistry"):
+        self._bootstraps_registry = registry
+
+    def prepare_cli_parser(self, parser: "ArgumentParser"):
+        self.operation_cls.prepare_cli_parser(
+            parser=parser, registry=self.bootstraps_registry
+        )
+
+    def build_operation(self) -> "BootstrapsDispatcher":
+        operation = self.operation_cls()
+        operation.set_bootstraps_registry(registry=self.bootstraps_registry)
+        return operation
 
 
 def main(cli_args: t.Optional[list[str]] = None):
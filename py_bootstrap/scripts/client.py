@@ -0,0 +1,95 @@
+__all__ = ("BootstrapsClient", "main")
+
+import os
+import socket
+import sys
+import typing as t
+
+from py_bootstrap.base import serving
+
+# the client is a console script, operations are imported on local runs only
+
+
+class BootstrapsClient:
+    cli_prog: t.ClassVar[str] = "bootstrap"
+
+    _cli_args: list[str]
+
+    def __init__(self, cli_args: list[str]):
+        self._cli_args = cli_args
+
+    @property
+    def socket_path(self) -> t.Optional[str]:
+        return os.environ.get(serving.SOCKET_ENV_NAME) or None
+
+    @property
+    def is_forwarded(self) -> bool:
+        # profiles are taken of local runs
+        return (
+            self.socket_path is not None
+            and self._cli_args[:1] != []
+            and self._cli_args[0] in serving.SERVED_OPERATIONS
+            and not any(arg.startswith("--profile") for arg in self._cli_args)
+        )
+
+    def run(self) -> int:
+        if not self.is_forwarded:
+            return self.run_locally()
+
+        try:
+            connection = self.connect()
+        except OSError as err:
+            sys.stderr.write(
+                f"{self.cli_prog}: {self.socket_path} isn't served ({err}),"
+                " running locally.\n"
+            )
+            return self.run_locally()
+
+        with connection:
+            return self.forward(connection=connection)
+
+    def connect(self) -> socket.socket:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(t.cast(str, self.socket_path))
+        except OSError:
+            connection.close()
+            raise
+        return connection
+
+    def forward(self, connection: socket.socket) -> int:
+        connection.sendall(
+            serving.dump_request(cli_args=self._cli_args, cwd=os.getcwd())
+        )
+        outputs = {
+            serving.STDOUT_FRAME: sys.stdout.buffer,
+            serving.STDERR_FRAME: sys.stderr.buffer,
+        }
+        with connection.makefile("rb") as stream:
+            while (frame := serving.read_frame(stream)) is not None:
+                kind, value, data = frame
+                if kind == serving.EXIT_FRAME:
+                    return value
+                output = outputs[kind]
+                output.write(data)
+                output.flush()
+
+        sys.stderr.write(f"{self.cli_prog}: the request is interrupted.\n")
+        return 1
+
+    def run_locally(self) -> int:
+        from .bootstrap import main
+
+        main(cli_args=self._cli_args)
+        return 0
+
+
+def main(cli_args: t.Optional[list[str]] = None):
+    client = BootstrapsClient(
+        cli_args=sys.argv[1:] if cli_args is None else cli_args
+    )
+    sys.exit(client.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+import atexit
+import os
+from tempfile import TemporaryDirectory
+
+from py_bootstrap.base.cache import CACHE_DIR_ENV_NAME
+
+# tests and their subprocesses never write indexes and templates caches into
+# a user cache directory
+cache_dir = TemporaryDirectory()
+atexit.register(cache_dir.cleanup)
+os.environ[CACHE_DIR_ENV_NAME] = cache_dir.name
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+import typing as t
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_bootstrap.base.operations import CliHelpFormatter
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class CliHelpFormatterTestCase(TestCase):
+    tst_cls = CliHelpFormatter
+
+    def test_get_terminal_width(self):
+        with patch.dict(os.environ, {"COLUMNS": "120"}):
+            assert self.tst_cls.get_terminal_width() == 120
+            assert self.tst_cls(prog="test")._width == 118
+
+        with (
+            patch.dict(os.environ, {"COLUMNS": "test"}),
+            patch("os.get_terminal_size", side_effect=OSError),
+        ):
+            assert self.tst_cls.get_terminal_width() == 80
+
+    def test_help_without_shutil(self):
+        script = (
+            "import sys\n"
+            "from py_bootstrap.scripts.bootstrap import main\n"
+            "try:\n"
+            "    main(cli_args=['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "assert 'shutil' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert "usage: bootstrap" in result.stdout
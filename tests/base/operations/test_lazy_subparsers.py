@@ -0,0 +1,114 @@
+import contextlib
+import io
+import typing as t
+from argparse import ArgumentParser
+from unittest import TestCase
+from unittest.mock import Mock
+
+from py_bootstrap.base.operations import LazySubParsersAction
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class LazySubParsersActionTestCase(TestCase):
+    def setUp(self):
+        self.parser = ArgumentParser(prog="test")
+        self.subparsers = LazySubParsersAction.add_to_parser(
+            self.parser,
+            title="Test operations",
+            dest="operation",
+            required=True,
+        )
+        self.first_preparer = Mock(
+            side_effect=lambda parser: parser.add_argument("--first-arg")
+        )
+        self.second_preparer = Mock(
+            side_effect=lambda parser: parser.add_argument("--second-arg")
+        )
+        self.subparsers.add_lazy_parser(
+            "first", preparer=self.first_preparer, help="First operation"
+        )
+        self.subparsers.add_lazy_parser(
+            "second", preparer=self.second_preparer, help="Second operation"
+        )
+
+    def test_parse_args(self):
+        namespace = self.parser.parse_args(["first", "--first-arg=value"])
+
+        assert namespace.operation == "first"
+        assert namespace.first_arg == "value"
+        self.first_preparer.assert_called_once()
+        self.second_preparer.assert_not_called()
+
+    def test_parse_args_twice(self):
+        self.parser.parse_args(["first", "--first-arg=value"])
+        namespace = self.parser.parse_args(["first", "--first-arg=other"])
+
+        assert namespace.first_arg == "other"
+        self.first_preparer.assert_called_once()
+
+    def test_prepare_lazy_parsers(self):
+        nested_preparer = Mock(
+            side_effect=lambda parser: parser.add_argument("--nested-arg")
+        )
+
+        def prepare_second_parser(parser: ArgumentParser):
+            nested_subparsers = LazySubParsersAction.add_to_parser(
+                parser, dest="nested_operation", required=True
+            )
+            nested_subparsers.add_lazy_parser(
+                "nested", preparer=nested_preparer
+            )
+
+        self.second_preparer.side_effect = prepare_second_parser
+        self.subparsers.prepare_lazy_parsers()
+
+        self.first_preparer.assert_called_once()
+        self.second_preparer.assert_called_once()
+        nested_preparer.assert_called_once()
+
+        namespace = self.parser.parse_args(
+            ["second", "nested", "--nested-arg=value"]
+        )
+        assert namespace.nested_arg == "value"
+        nested_preparer.assert_called_once()
+
+    def test_help(self):
+        mock_stdout = io.StringIO()
+        with (
+            self.assertRaises(SystemExit),
+            contextlib.redirect_stdout(mock_stdout),
+        ):
+            self.parser.parse_args(["--help"])
+
+        output = mock_stdout.getvalue()
+        assert "{first,second}" in output
+        assert "First operation" in output
+        assert "Second operation" in output
+        self.first_preparer.assert_not_called()
+        self.second_preparer.assert_not_called()
+
+    def test_selected_parser_help(self):
+        mock_stdout = io.StringIO()
+        with (
+            self.assertRaises(SystemExit),
+            contextlib.redirect_stdout(mock_stdout),
+        ):
+            self.parser.parse_args(["second", "--help"])
+
+        output = mock_stdout.getvalue()
+        assert "usage: test second [-h] [--second-arg SECOND_ARG]" in output
+        self.first_preparer.assert_not_called()
+        self.second_preparer.assert_called_once()
+
+    def test_unknown_parser(self):
+        with (
+            self.assertRaises(SystemExit) as err_ctx,
+            contextlib.redirect_stderr(io.StringIO()),
+        ):
+            self.parser.parse_args(["third"])
+
+        assert err_ctx.exception.code == 2
+        self.first_preparer.assert_not_called()
+        self.second_preparer.assert_not_called()
@@ -0,0 +1,125 @@
+import contextlib
+import io
+import json
+import pstats
+import typing as t
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from py_bootstrap.base.operations import BaseCliOperation, BaseOperationsRunner
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class TstOperation(BaseCliOperation):
+    cli_description = "Test operation"
+
+    @classmethod
+    def prepare_cli_parser(cls, parser: ArgumentParser, prefix: str = ""):
+        parser.add_argument("--fail", action="store_true", help="Fails.")
+
+    def run(self):
+        if self.cli_namespace.fail:
+            raise Exception("Test failure")
+        sorted(range(1000), key=str)
+
+
+class TstOperationsRunner(BaseOperationsRunner):
+    cli_prog = "test"
+    operation_cls = TstOperation
+
+
+class BaseOperationsRunnerProfileTestCase(TestCase):
+    tst_cls = TstOperationsRunner
+    tst_obj: TstOperationsRunner
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.profile_path = Path(self.tmp_dir.name, "test.pstats")
+        self.tst_obj = self.tst_cls()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_tst_obj(self, cli_args: list[str]) -> str:
+        self.tst_obj.set_cli_args(cli_args)
+        mock_stderr = io.StringIO()
+        with contextlib.redirect_stderr(mock_stderr):
+            self.tst_obj.run()
+        return mock_stderr.getvalue()
+
+    def test_run_without_profile(self):
+        output = self.run_tst_obj([])
+
+        assert output == ""
+        assert not self.profile_path.exists()
+
+    def test_run_with_profile(self):
+        output = self.run_tst_obj(
+            [f"--profile={self.profile_path}", "--profile-sort=calls"]
+        )
+
+        assert "Ordered by: call count" in output
+        stats = pstats.Stats(str(self.profile_path))
+        functions_names = {name for _, _, name in stats.stats}
+        assert "run" in functions_names
+        assert "build_cli_parser" in functions_names
+
+    def test_run_failed_with_profile(self):
+        with self.assertRaises(Exception):
+            self.run_tst_obj(["--fail", f"--profile={self.profile_path}"])
+
+        assert self.profile_path.exists()
+
+    def test_run_with_metrics(self):
+        metrics_path = Path(self.tmp_dir.name, "metrics.json")
+        self.run_tst_obj([f"--metrics-json={metrics_path}"])
+
+        data = json.loads(metrics_path.read_text())
+        assert data["labels"] == {"prog": "test"}
+        assert set(data["phases"]) == {
+            "parser_building",
+            "argument_parsing",
+            "running",
+        }
+        # the operation shares metrics of the runner
+        assert self.tst_obj._operation.metrics is self.tst_obj.metrics
+
+    def test_run_failed_with_metrics(self):
+        metrics_path = Path(self.tmp_dir.name, "metrics.json")
+        with self.assertRaises(Exception):
+            self.run_tst_obj(["--fail", f"--metrics-json={metrics_path}"])
+
+        data = json.loads(metrics_path.read_text())
+        assert data["phases"]["running"]["calls"] == 1
+
+    def test_run_failed_with_unsaved_metrics(self):
+        metrics_path = Path(self.tmp_dir.name, "missed-dir", "metrics.json")
+        with (
+            self.assertRaises(Exception) as err_ctx,
+            self.assertLogs("py_bootstrap.base.operations.runner", "ERROR"),
+        ):
+            self.run_tst_obj(["--fail", f"--metrics-json={metrics_path}"])
+
+        # the running failure isn't replaced by the saving one
+        assert err_ctx.exception.args == ("Test failure",)
+
+    def test_run_with_unsaved_metrics(self):
+        metrics_path = Path(self.tmp_dir.name, "missed-dir", "metrics.json")
+        with self.assertRaises(FileNotFoundError):
+            self.run_tst_obj([f"--metrics-json={metrics_path}"])
+
+    def test_help(self):
+        mock_stdout = io.StringIO()
+        with (
+            self.assertRaises(SystemExit),
+            contextlib.redirect_stdout(mock_stdout),
+        ):
+            self.run_tst_obj(["--help"])
+
+        assert "--profile PATH" in mock_stdout.getvalue()
+        assert "--profile-sort" in mock_stdout.getvalue()
+        assert "--metrics-json PATH" in mock_stdout.getvalue()
@@ -0,0 +1,82 @@
+import json
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase
+
+from py_bootstrap.base.metrics import OperationMetrics
+
+
+class OperationMetricsTestCase(TestCase):
+    tst_cls = OperationMetrics
+    tst_obj: OperationMetrics
+
+    def setUp(self):
+        self.tst_obj = self.tst_cls()
+
+    def test_measure(self):
+        with self.tst_obj.measure(phase="test"):
+            time.sleep(0.01)
+        with self.assertRaises(ValueError):
+            with self.tst_obj.measure(phase="test"):
+                raise ValueError("Test failure")
+
+        phase = self.tst_obj.phases["test"]
+        assert phase.calls == 2
+        assert phase.wall_time >= 0.01
+        # sleeping doesn't consume CPU
+        assert phase.cpu_time < phase.wall_time
+
+    def test_increment_concurrently(self):
+        def increment():
+            for _ in range(1000):
+                self.tst_obj.increment(counter="files")
+                self.tst_obj.increment(counter="bytes_written", value=2)
+
+        threads = [Thread(target=increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert self.tst_obj.counters == {"files": 4000, "bytes_written": 8000}
+
+    def test_dump(self):
+        self.tst_obj.set_label(name="bootstrap", value="test")
+        self.tst_obj.increment(counter="files")
+        with self.tst_obj.measure(phase="test"):
+            pass
+
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir, "metrics.json")
+            self.tst_obj.dump(path=path)
+            data = json.loads(path.read_text())
+            assert [item.name for item in Path(tmp_dir).iterdir()] == [
+                "metrics.json"
+            ]
+
+        assert data["format_version"] == 1
+        assert data["labels"] == {"bootstrap": "test"}
+        assert data["counters"] == {"files": 1}
+        assert data["phases"]["test"]["calls"] == 1
+        assert set(data["phases"]["test"]) == {"calls", "wall_time", "cpu_time"}
+
+    def test_merge(self):
+        self.tst_obj.set_label(name="bootstrap", value="test")
+        self.tst_obj.increment(counter="files")
+        with self.tst_obj.measure(phase="test"):
+            pass
+        data = self.tst_obj.as_dict()
+
+        self.tst_obj.merge(data=data)
+        assert self.tst_obj.counters == {"files": 2}
+        assert self.tst_obj.phases["test"].calls == 2
+
+        self.tst_obj.reset()
+        assert self.tst_obj.as_dict() == {
+            "format_version": 1,
+            "labels": {"bootstrap": "test"},
+            "phases": {},
+            "counters": {},
+        }
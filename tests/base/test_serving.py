@@ -0,0 +1,60 @@
+import io
+import json
+from unittest import TestCase
+
+from py_bootstrap.base import serving
+
+
+class ServingTestCase(TestCase):
+    def test_request(self):
+        line = serving.dump_request(cli_args=["list", "ü"], cwd="/test-dir")
+        assert line.endswith(b"\n")
+        assert serving.load_request(line) == (["list", "ü"], "/test-dir")
+
+    def test_load_wrong_request(self):
+        for line in (
+            b"",
+            b"[]",
+            b'{"args": ["list"]}',
+            b'{"args": "list", "cwd": "/test-dir"}',
+            b'{"args": [1], "cwd": "/test-dir"}',
+            json.dumps({"args": ["list"], "cwd": None}).encode(),
+        ):
+            with self.subTest(line=line):
+                with self.assertRaises((ValueError, KeyError, TypeError)):
+                    serving.load_request(line)
+
+    def test_frames(self):
+        stream = io.BytesIO()
+        writer = io.TextIOWrapper(
+            io.BufferedWriter(
+                serving.FramesWriter(stream=stream, kind=serving.STDOUT_FRAME)
+            ),
+            encoding="utf-8",
+        )
+        writer.write("test output ü\n")
+        writer.flush()
+        serving.write_frame(
+            stream=stream, kind=serving.STDERR_FRAME, data=b"test error\n"
+        )
+        # empty writes don't send frames
+        writer.flush()
+        serving.write_exit_frame(stream=stream, status=2)
+
+        stream.seek(0)
+        frames = []
+        while (frame := serving.read_frame(stream)) is not None:
+            frames.append(frame)
+        assert frames == [
+            (serving.STDOUT_FRAME, 15, "test output ü\n".encode()),
+            (serving.STDERR_FRAME, 11, b"test error\n"),
+            (serving.EXIT_FRAME, 2, b""),
+        ]
+
+    def test_read_interrupted_frame(self):
+        stream = io.BytesIO()
+        serving.write_frame(
+            stream=stream, kind=serving.STDOUT_FRAME, data=b"test output"
+        )
+        assert serving.read_frame(io.BytesIO(stream.getvalue()[:-1])) is None
+        assert serving.read_frame(io.BytesIO(stream.getvalue()[:3])) is None
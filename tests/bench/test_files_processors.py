@@ -0,0 +1,64 @@
+import contextlib
+import io
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from benchmarks.__main__ import main
+
+
+class FilesProcessorsBenchmarkOperationTestCase(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        self.output_path = self.tmp_path / "results.json"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_benchmark(self, *args: str) -> str:
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            main(
+                [
+                    "files-processors",
+                    "--files-count=20",
+                    "--iterations=1",
+                    *args,
+                ]
+            )
+        return stdout.getvalue()
+
+    def test_run(self):
+        output = self.run_benchmark(f"--output={self.output_path}")
+
+        data = json.loads(self.output_path.read_text())
+        assert data["spec"]["files_count"] == 20
+        assert [result["name"] for result in data["results"]] == [
+            "copy",
+            "generate",
+            "export",
+            "register",
+        ]
+        for result in data["results"]:
+            # the entry-point file is copied but not generated
+            assert result["files_count"] in (20, 21)
+            assert len(result["durations"]) == 1
+            assert result["name"] in output
+
+    def test_compare(self):
+        self.run_benchmark("--case=copy", f"--output={self.output_path}")
+
+        output = self.run_benchmark(
+            "--case=copy",
+            f"--compare={self.output_path}",
+            "--threshold=1000",
+        )
+        assert "copy: median duration" in output
+
+        data = json.loads(self.output_path.read_text())
+        data["results"][0]["durations"] = [1e-9]
+        self.output_path.write_text(json.dumps(data))
+        with self.assertRaises(Exception):
+            self.run_benchmark("--case=copy", f"--compare={self.output_path}")
@@ -0,0 +1,168 @@
+import contextlib
+import io
+import json
+from argparse import Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from benchmarks.__main__ import main
+from benchmarks.startup import (
+    OVERHEAD_NAME,
+    BudgetViolation,
+    ImportTimeRecord,
+    StartupBenchmarkOperation,
+)
+
+
+class StartupBenchmarkOperationTestCase(TestCase):
+    tst_cls = StartupBenchmarkOperation
+    tst_obj: StartupBenchmarkOperation
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        self.tst_obj = self.tst_cls()
+        self.tst_obj.set_cli_namespace(
+            namespace=Namespace(threshold=0.25, min_cost=1000)
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def build_data(
+        self, baseline: float, duration: float, modules: dict[str, float]
+    ) -> dict:
+        return {
+            "python": "3.13.0",
+            "baseline": baseline,
+            "commands": {
+                "help": {
+                    "command": "help",
+                    "cli_args": ["--help"],
+                    "duration": duration,
+                    "imports_duration": 0.0,
+                    "modules": modules,
+                }
+            },
+        }
+
+    def test_parse_import_times(self):
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _io\n"
+            "import time:      1501 |      21122 |       asyncio.base_events\n"
+            "import time:       286 |      92024 | py_bootstrap.scripts.bootstrap\n"
+            "usage: bootstrap [-h]\n"
+        )
+
+        assert self.tst_cls.parse_import_times(output=output) == [
+            ImportTimeRecord(
+                name="_io", self_time=120, cumulative_time=120, level=1
+            ),
+            ImportTimeRecord(
+                name="asyncio.base_events",
+                self_time=1501,
+                cumulative_time=21122,
+                level=3,
+            ),
+            ImportTimeRecord(
+                name="py_bootstrap.scripts.bootstrap",
+                self_time=286,
+                cumulative_time=92024,
+                level=0,
+            ),
+        ]
+
+    def test_check_budgets(self):
+        budgets = self.tst_obj.build_budgets(
+            data=self.build_data(
+                baseline=10000,
+                duration=50000,
+                modules={"py_bootstrap": 20000, "json": 3000, "re": 500},
+            )
+        )
+        data = self.build_data(
+            # the machine is twice slower
+            baseline=20000,
+            duration=100000,
+            modules={
+                "py_bootstrap": 60000,
+                "json": 6500,
+                "re": 1400,
+                "asyncio": 30000,
+                "tomllib": 900,
+            },
+        )
+
+        assert self.tst_obj.check_budgets(data=data, budgets=budgets) == [
+            BudgetViolation(
+                command="help", name="asyncio", value=30000, budget=None
+            ),
+            BudgetViolation(
+                command="help", name="py_bootstrap", value=60000, budget=40000
+            ),
+        ]
+
+    def test_check_budgets_other_python(self):
+        budgets = self.tst_obj.build_budgets(
+            data=self.build_data(
+                baseline=10000, duration=50000, modules={"json": 3000}
+            )
+        )
+        budgets["python"] = "3.13.5"
+        data = self.build_data(
+            baseline=10000,
+            duration=150000,
+            modules={"json": 9000, "asyncio": 30000},
+        )
+
+        with self.assertLogs("benchmarks.startup", level="WARNING"):
+            assert self.tst_obj.check_budgets(data=data, budgets=budgets) == []
+        # targets don't depend on a Python version
+        assert self.tst_obj.check_targets(data=data)
+
+    def test_check_targets(self):
+        data = self.build_data(
+            baseline=40000,
+            duration=150000,
+            modules={"py_bootstrap": 60000, "asyncio": 30000},
+        )
+
+        assert self.tst_obj.check_targets(data=data) == [
+            BudgetViolation(
+                command="help", name="asyncio", value=30000, budget=0.0
+            ),
+            BudgetViolation(
+                command="help",
+                name=OVERHEAD_NAME,
+                value=110000,
+                # the machine is twice slower than a targets one
+                budget=100000,
+            ),
+        ]
+
+        data["commands"]["help"]["duration"] = 130000
+        del data["commands"]["help"]["modules"]["asyncio"]
+        assert self.tst_obj.check_targets(data=data) == []
+
+    def test_run(self):
+        budgets_path = self.tmp_path / "budgets.json"
+        args = ["startup", "--iterations=1", f"--budgets={budgets_path}"]
+        stdout = io.StringIO()
+        with (
+            # wall times of single runs are too noisy for targets
+            patch.object(self.tst_cls, "overhead_targets", {}),
+            contextlib.redirect_stdout(stdout),
+        ):
+            main([*args, "--update-budgets"])
+            main([*args, "--threshold=1000", "--min-cost=1000000"])
+
+        budgets = json.loads(budgets_path.read_text())
+        assert sorted(budgets["commands"]) == ["build-help", "help", "list"]
+        for command_budgets in budgets["commands"].values():
+            assert (
+                "py_bootstrap.scripts.bootstrap" in command_budgets["modules"]
+            )
+        assert "within budgets" in stdout.getvalue()
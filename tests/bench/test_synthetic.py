@@ -0,0 +1,53 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from benchmarks.synthetic import (
+    SyntheticBootstrapGenerator,
+    SyntheticBootstrapSpec,
+)
+
+
+class SyntheticBootstrapGeneratorTestCase(TestCase):
+    tst_cls = SyntheticBootstrapGenerator
+    tst_obj: SyntheticBootstrapGenerator
+
+    spec = SyntheticBootstrapSpec(files_count=40, depth=2, fan_out=2)
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        self.tst_obj = self.tst_cls()
+        self.tst_obj.set_spec(value=self.spec)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def read_tree(self, path: Path) -> dict[str, bytes]:
+        return {
+            item.relative_to(path).as_posix(): item.read_bytes()
+            for item in path.rglob("*")
+            if item.is_file()
+        }
+
+    def test_generate(self):
+        path = self.tmp_path / "synthetic"
+        bytes_count = self.tst_obj.generate(path=path)
+
+        tree = self.read_tree(path)
+        files = [name for name in tree if name != "__entry_point__.py"]
+        assert len(files) == self.spec.files_count
+        assert bytes_count == sum(len(tree[name]) for name in files)
+        assert any(name.endswith(".tmpl") for name in files)
+        # plain files are never placed into templated directories
+        assert all(
+            name.endswith(".tmpl") for name in files if "{python_name}" in name
+        )
+
+    def test_generate_reproducible(self):
+        self.tst_obj.generate(path=self.tmp_path / "first")
+        self.tst_obj.generate(path=self.tmp_path / "second")
+
+        assert self.read_tree(self.tmp_path / "first") == self.read_tree(
+            self.tmp_path / "second"
+        )
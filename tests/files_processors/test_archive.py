@@ -0,0 +1,170 @@
+import typing as t
+from hashlib import sha256
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import tests.tst_templates as tst_templates_module
+from py_bootstrap.files_processors import (
+    BootstrapArchive,
+    CopyFilesProcessor,
+    GenerateFilesProcessor,
+    PackFilesProcessor,
+)
+
+if t.TYPE_CHECKING:
+    from py_bootstrap.files_processors import BaseFilesProcessor
+
+
+class BootstrapArchiveTestCase(TestCase):
+    tst_cls = BootstrapArchive
+    tst_obj: BootstrapArchive
+
+    source_path = Path(tst_templates_module.__file__).parent / "test_bootstrap"
+    context = {
+        "name": "test-name",
+        "python_name": "test_name",
+        "upper_name": "TEST_NAME",
+        "class_name": "TestName",
+        "title": "Test title",
+        "description": "Test description",
+        "empty": "",
+        "date_today": "2026-01-01",
+        "date_year": "2026",
+        "python_major": "3",
+        "python_minor": "13",
+    }
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        self.archive_path = self.tmp_path / "test_bootstrap.pybootstrap"
+
+        processor = PackFilesProcessor()
+        processor.set_source_path(source_path=self.source_path)
+        processor.set_destination_path(destination_path=self.archive_path)
+        processor.run()
+
+        self.tst_obj = self.tst_cls()
+        self.tst_obj.set_path(path=self.archive_path)
+        self.tst_obj.load()
+
+    def tearDown(self):
+        self.tst_obj.close()
+        self.tmp_dir.cleanup()
+
+    def read_tree(self, path: Path) -> dict[str, t.Optional[bytes]]:
+        return {
+            item.relative_to(path).as_posix(): (
+                item.read_bytes() if item.is_file() else None
+            )
+            for item in path.rglob("*")
+        }
+
+    def test_entries(self):
+        assert self.tst_cls.check_is_archive(self.archive_path)
+        assert not self.tst_cls.check_is_archive(self.source_path)
+
+        entries = {entry.path: entry for entry in self.tst_obj.entries}
+        assert sorted(entries) == [
+            "__entry_point__.py",
+            "some-dir/copied-file.txt",
+            "some-file.txt",
+            "{python_name}/generated-file.txt.tmpl",
+        ]
+        for path, entry in entries.items():
+            content = (self.source_path / path).read_bytes()
+            assert entry.size == len(content)
+            assert entry.hash == sha256(content).hexdigest()
+            assert entry.is_template == path.endswith(".tmpl")
+            with self.tst_obj.read(path=self.archive_path / path) as data:
+                assert data == content
+
+    def test_walk(self):
+        walked = [
+            (root_path.relative_to(self.archive_path), dirs_names, files_names)
+            for root_path, dirs_names, files_names in self.tst_obj.walk()
+        ]
+
+        assert walked[0][0] == Path()
+        assert sorted(walked[0][1]) == ["some-dir", "{python_name}"]
+        assert sorted(walked[0][2]) == ["__entry_point__.py", "some-file.txt"]
+        assert sorted(root_path.as_posix() for root_path, _, _ in walked) == [
+            ".",
+            "some-dir",
+            "{python_name}",
+        ]
+
+    def test_walk_pruned(self):
+        walk = self.tst_obj.walk()
+        _, dirs_names, _ = next(walk)
+        dirs_names.remove("some-dir")
+
+        assert [root_path.name for root_path, _, _ in walk] == ["{python_name}"]
+
+    def test_load_broken(self):
+        path = self.tmp_path / "broken.pybootstrap"
+        path.write_bytes(b"NOTARCH\x00\x00\x00\x00\x00")
+        tst_obj = self.tst_cls()
+        tst_obj.set_path(path=path)
+
+        with self.assertRaises(ValueError):
+            tst_obj.load()
+
+    def run_processor(
+        self, processor: "BaseFilesProcessor", name: str, is_archived: bool
+    ) -> Path:
+        if is_archived:
+            processor.set_source_archive(value=self.tst_obj)
+        else:
+            processor.set_source_path(source_path=self.source_path)
+        destination_path = self.tmp_path / name
+        processor.set_destination_path(destination_path=destination_path)
+        processor.run()
+        return destination_path
+
+    def build_generate_processor(self) -> GenerateFilesProcessor:
+        processor = GenerateFilesProcessor()
+        processor.set_context(value=self.context)
+        processor.set_entry_point_file_name(value="__entry_point__.py")
+        return processor
+
+    def test_generate(self):
+        expected_path = self.run_processor(
+            self.build_generate_processor(), name="expected", is_archived=False
+        )
+        destination_path = self.run_processor(
+            self.build_generate_processor(), name="archived", is_archived=True
+        )
+
+        expected_tree = self.read_tree(expected_path)
+        assert "test_name/generated-file.txt" in expected_tree
+        assert self.read_tree(destination_path) == expected_tree
+
+    def test_generate_streaming(self):
+        with patch.object(GenerateFilesProcessor, "streaming_threshold", 0):
+            destination_path = self.run_processor(
+                self.build_generate_processor(),
+                name="archived",
+                is_archived=True,
+            )
+
+        expected_path = self.run_processor(
+            self.build_generate_processor(), name="expected", is_archived=False
+        )
+        assert self.read_tree(destination_path) == self.read_tree(expected_path)
+
+    def test_copy(self):
+        processor = CopyFilesProcessor()
+        processor.files_copier.set_link_mode(value="hardlink")
+        destination_path = self.run_processor(
+            processor, name="archived", is_archived=True
+        )
+
+        expected_path = self.run_processor(
+            CopyFilesProcessor(), name="expected", is_archived=False
+        )
+        assert self.read_tree(destination_path) == self.read_tree(expected_path)
+        # archived files can't be linked
+        assert processor.files_copier.stats == {"mmap": 4}
@@ -0,0 +1,201 @@
+import gzip
+import io
+import tarfile
+import typing as t
+import zipfile
+from dataclasses import replace
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+import tests.tst_templates as tst_templates_module
+from py_bootstrap.files_processors import (
+    ArchivingFilesProcessor,
+    PlanningFilesProcessor,
+)
+
+if t.TYPE_CHECKING:
+    from py_bootstrap.files_processors import BuildPlan
+
+
+class ArchivingFilesProcessorTestCase(TestCase):
+    tst_cls = ArchivingFilesProcessor
+
+    source_path = Path(tst_templates_module.__file__).parent / "test_bootstrap"
+    context = {
+        "name": "test-name",
+        "python_name": "test_name",
+        "upper_name": "TEST_NAME",
+        "class_name": "TestName",
+        "title": "Test title",
+        "description": "Test description",
+        "empty": "",
+        "date_today": "2026-01-01",
+        "date_year": "2026",
+        "python_major": "3",
+        "python_minor": "13",
+    }
+    names = [
+        "some-dir",
+        "some-dir/copied-file.txt",
+        "some-file.txt",
+        "test_name",
+        "test_name/generated-file.txt",
+    ]
+
+    def build_tst_obj(self, format_name: str) -> ArchivingFilesProcessor:
+        tst_obj = self.tst_cls()
+        tst_obj.set_source_path(source_path=self.source_path)
+        tst_obj.set_context(value=self.context)
+        tst_obj.set_entry_point_file_name(value="__entry_point__.py")
+        tst_obj.set_archive(
+            value=tst_obj.build_archive(format_name=format_name)
+        )
+        return tst_obj
+
+    def run_tst_obj(self, format_name: str) -> bytes:
+        tst_obj = self.build_tst_obj(format_name=format_name)
+        stream = io.BytesIO()
+        tst_obj._archive.open(stream=stream)
+        tst_obj.run()
+        tst_obj._archive.close()
+        return stream.getvalue()
+
+    def test_run_tar(self):
+        data = self.run_tst_obj(format_name="tar")
+
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            members = tar.getmembers()
+            assert [member.name for member in members] == self.names
+            assert {member.mtime for member in members} == {315532800}
+            assert {(member.uid, member.uname) for member in members} == {
+                (0, "")
+            }
+            assert [member.mode for member in members] == [
+                0o755,
+                0o644,
+                0o644,
+                0o755,
+                0o644,
+            ]
+            generated_file = tar.extractfile("test_name/generated-file.txt")
+            assert generated_file is not None
+            assert b"name = test-name" in generated_file.read()
+
+        # the same bootstrap is archived into the same bytes
+        assert self.run_tst_obj(format_name="tar") == data
+
+    def test_run_tar_gz(self):
+        data = self.run_tst_obj(format_name="tar.gz")
+
+        # no modification time in the gzip header
+        assert data[4:8] == b"\x00\x00\x00\x00"
+        assert gzip.decompress(data) == self.run_tst_obj(format_name="tar")
+        assert self.run_tst_obj(format_name="tar.gz") == data
+
+    def test_run_zip(self):
+        data = self.run_tst_obj(format_name="zip")
+
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert archive.testzip() is None
+            assert archive.namelist() == [
+                f"{name}/" if "." not in name else name for name in self.names
+            ]
+            assert {info.date_time for info in archive.infolist()} == {
+                (1980, 1, 1, 0, 0, 0)
+            }
+            assert b"name = test-name" in archive.read(
+                "test_name/generated-file.txt"
+            )
+
+        assert self.run_tst_obj(format_name="zip") == data
+
+    def test_run_walking_order(self):
+        data = self.run_tst_obj(format_name="tar")
+        walk_source = self.tst_cls.walk_source
+
+        def reversed_walk_source(processor):
+            for rel_path, dirs_names, files_names in walk_source(processor):
+                dirs_names.reverse()
+                files_names.reverse()
+                yield rel_path, dirs_names, files_names
+
+        with patch.object(
+            self.tst_cls,
+            "walk_source",
+            autospec=True,
+            side_effect=reversed_walk_source,
+        ):
+            assert self.run_tst_obj(format_name="tar") == data
+
+    def test_run_streaming(self):
+        data = self.run_tst_obj(format_name="tar")
+
+        # big templates are spooled before archiving
+        with patch.object(self.tst_cls, "streaming_threshold", 0):
+            assert self.run_tst_obj(format_name="tar") == data
+
+    def build_plan(self) -> "BuildPlan":
+        processor = PlanningFilesProcessor()
+        processor.set_source_path(source_path=self.source_path)
+        processor.set_context(value=self.context)
+        processor.set_entry_point_file_name(value="__entry_point__.py")
+        processor.run()
+        return processor.plan
+
+    def apply_plan_tst_obj(self, plan: "BuildPlan") -> ArchivingFilesProcessor:
+        tst_obj = self.build_tst_obj(format_name="zip")
+        tst_obj._archive.open(stream=io.BytesIO())
+        tst_obj.apply_plan(plan=plan)
+        tst_obj._archive.close()
+        return tst_obj
+
+    def test_apply_plan(self):
+        data = self.run_tst_obj(format_name="zip")
+
+        tst_obj = self.build_tst_obj(format_name="zip")
+        stream = io.BytesIO()
+        tst_obj._archive.open(stream=stream)
+        tst_obj.apply_plan(plan=self.build_plan())
+        tst_obj._archive.close()
+        assert stream.getvalue() == data
+        assert "failures" not in tst_obj.metrics.counters
+
+        # big templates are hashed while they're spooled
+        with patch.object(self.tst_cls, "streaming_threshold", 0):
+            tst_obj = self.apply_plan_tst_obj(plan=self.build_plan())
+        assert "failures" not in tst_obj.metrics.counters
+
+    def test_apply_plan_changed(self):
+        plan = self.build_plan()
+        # the bootstrap is changed after planning
+        for index, entry in enumerate(plan.entries):
+            if entry.destination == "some-file.txt":
+                plan.entries[index] = replace(entry, hash="0" * 64)
+            elif entry.action == "render":
+                plan.entries[index] = replace(entry, size=entry.size + 1)
+
+        with self.assertLogs(
+            "py_bootstrap.files_processors.archiving", "ERROR"
+        ) as logs_ctx:
+            tst_obj = self.apply_plan_tst_obj(plan=plan)
+
+        assert tst_obj.metrics.counters["failures"] == 2
+        assert all(
+            "differs from the planned one" in output
+            for output in logs_ctx.output
+        )
+
+    def test_run_failure(self):
+        tst_obj = self.build_tst_obj(format_name="tar")
+        tst_obj._archive.open(stream=io.BytesIO())
+
+        with (
+            patch.object(
+                tst_obj, "archive_template_file", side_effect=OSError("test")
+            ),
+            self.assertLogs("py_bootstrap.files_processors.archiving", "ERROR"),
+        ):
+            tst_obj.run()
+        tst_obj._archive.close()
+        assert tst_obj.metrics.counters["failures"] == 1
@@ -0,0 +1,98 @@
+import asyncio
+import typing as t
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import tests.tst_templates as tst_templates_module
+from py_bootstrap.files_processors import (
+    AsyncGenerateFilesProcessor,
+    GenerateFilesProcessor,
+)
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class AsyncGenerateFilesProcessorTestCase(TestCase):
+    tst_cls = AsyncGenerateFilesProcessor
+
+    source_path = Path(tst_templates_module.__file__).parent / "test_bootstrap"
+    context = {
+        "name": "test-name",
+        "python_name": "test_name",
+        "upper_name": "TEST_NAME",
+        "class_name": "TestName",
+        "title": "Test title",
+        "description": "Test description",
+        "empty": "",
+        "date_today": "2026-01-01",
+        "date_year": "2026",
+        "python_major": "3",
+        "python_minor": "13",
+    }
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def prepare_processor(
+        self, processor: GenerateFilesProcessor, name: str
+    ) -> GenerateFilesProcessor:
+        processor.set_source_path(source_path=self.source_path)
+        processor.set_destination_path(destination_path=self.tmp_path / name)
+        processor.set_context(value=self.context)
+        processor.set_entry_point_file_name(value="__entry_point__.py")
+        return processor
+
+    def read_tree(self, path: Path) -> dict[str, t.Optional[bytes]]:
+        return {
+            item.relative_to(path).as_posix(): (
+                item.read_bytes() if item.is_file() else None
+            )
+            for item in path.rglob("*")
+        }
+
+    def test_run(self):
+        self.prepare_processor(GenerateFilesProcessor(), name="sync").run()
+        tst_obj = self.prepare_processor(self.tst_cls(), name="async")
+        tst_obj.set_concurrency(value=2)
+
+        asyncio.run(tst_obj.run_async())
+
+        expected_tree = self.read_tree(self.tmp_path / "sync")
+        assert "test_name/generated-file.txt" in expected_tree
+        assert self.read_tree(self.tmp_path / "async") == expected_tree
+
+    def test_run_gathered(self):
+        self.prepare_processor(GenerateFilesProcessor(), name="sync").run()
+        tst_objs = [
+            self.prepare_processor(self.tst_cls(), name=f"async-{index}")
+            for index in range(3)
+        ]
+
+        async def run_all():
+            await asyncio.gather(*(tst_obj.run_async() for tst_obj in tst_objs))
+
+        asyncio.run(run_all())
+
+        expected_tree = self.read_tree(self.tmp_path / "sync")
+        for index in range(3):
+            assert (
+                self.read_tree(self.tmp_path / f"async-{index}")
+                == expected_tree
+            )
+
+    def test_run_blocking(self):
+        self.prepare_processor(GenerateFilesProcessor(), name="sync").run()
+        tst_obj = self.prepare_processor(self.tst_cls(), name="async")
+
+        # async processors are usable outside of event loops too
+        tst_obj.run()
+
+        assert self.read_tree(self.tmp_path / "async") == self.read_tree(
+            self.tmp_path / "sync"
+        )
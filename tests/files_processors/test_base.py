@@ -0,0 +1,103 @@
+import typing as t
+from pathlib import Path
+from threading import Lock
+from unittest import TestCase
+from unittest.mock import patch
+
+import tests.tst_templates as tst_templates_module
+from py_bootstrap.files_processors import BaseFilesProcessor
+from py_bootstrap.files_processors import base as base_module
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class TstFilesProcessor(BaseFilesProcessor):
+    def __init__(self):
+        self.lock = Lock()
+        self.directories: list[str] = []
+        self.files: list[str] = []
+
+    def check_directory_for_processing(
+        self, rel_path: "Path", dir_name: str
+    ) -> bool:
+        return dir_name not in ("some-dir", "__pycache__")
+
+    def process_directory(self, rel_path: "Path", dir_name: str):
+        self.directories.append((rel_path / dir_name).as_posix())
+
+    def check_file_for_processing(
+        self, rel_path: "Path", file_name: str
+    ) -> bool:
+        return not file_name.endswith(".pyc")
+
+    def process_file(self, rel_path: "Path", file_name: str):
+        if file_name == "some-file.txt":
+            raise ValueError("Test processing error")
+        with self.lock:
+            self.files.append((rel_path / file_name).as_posix())
+
+
+class BaseFilesProcessorTestCase(TestCase):
+    tst_cls = TstFilesProcessor
+    tst_obj: TstFilesProcessor
+
+    source_path = Path(tst_templates_module.__file__).parent / "test_bootstrap"
+
+    def setUp(self):
+        self.tst_obj = self.tst_cls()
+        self.tst_obj.set_source_path(source_path=self.source_path)
+        self.tst_obj.set_destination_path(destination_path=Path("unused"))
+
+    def test_run(self):
+        with self.assertLogs(base_module.__name__, level="ERROR") as logs_ctx:
+            self.tst_obj.run()
+
+        assert self.tst_obj.directories == ["{python_name}"]
+        assert sorted(self.tst_obj.files) == [
+            "__entry_point__.py",
+            "some-dir/copied-file.txt",
+            "{python_name}/generated-file.txt.tmpl",
+        ]
+        assert len(logs_ctx.output) == 1
+        assert "some-file.txt" in logs_ctx.output[0]
+        assert "Test processing error" in logs_ctx.output[0]
+
+        counters = self.tst_obj.metrics.counters
+        assert counters["directories"] == 1
+        assert counters["directories_skipped"] >= 1
+        assert counters["files"] == 3
+        assert counters["failures"] == 1
+        assert self.tst_obj.metrics.phases["directory_walking"].calls >= 3
+
+    def test_run_pruned(self):
+        with (
+            patch.object(
+                self.tst_obj,
+                "check_directory_for_walking",
+                side_effect=lambda rel_path, dir_name: dir_name != "some-dir",
+            ),
+            self.assertLogs(base_module.__name__, level="ERROR"),
+        ):
+            self.tst_obj.run()
+
+        assert sorted(self.tst_obj.files) == [
+            "__entry_point__.py",
+            "{python_name}/generated-file.txt.tmpl",
+        ]
+        assert self.tst_obj.metrics.counters["directories_skipped"] >= 1
+
+    def test_run_concurrently(self):
+        self.tst_obj.set_jobs(value=4)
+        with self.assertLogs(base_module.__name__, level="ERROR") as logs_ctx:
+            self.tst_obj.run()
+
+        assert self.tst_obj.directories == ["{python_name}"]
+        assert sorted(self.tst_obj.files) == [
+            "__entry_point__.py",
+            "some-dir/copied-file.txt",
+            "{python_name}/generated-file.txt.tmpl",
+        ]
+        assert len(logs_ctx.output) == 1
+        assert "some-file.txt" in logs_ctx.output[0]
+        assert "Test processing error" in logs_ctx.output[0]
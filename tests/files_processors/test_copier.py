@@ -0,0 +1,169 @@
+import errno
+import os
+import typing as t
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_bootstrap.files_processors.copier import FilesCopier
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class FilesCopierTestCase(TestCase):
+    tst_cls = FilesCopier
+    tst_obj: FilesCopier
+
+    def setUp(self):
+        self.tst_obj = self.tst_cls()
+
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        self.source_path = self.tmp_path / "source.bin"
+        self.source_path.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+        self.destination_path = self.tmp_path / "destination.bin"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_copy(self):
+        strategy = self.tst_obj.copy(
+            source_path=self.source_path,
+            destination_path=self.destination_path,
+        )
+
+        assert strategy in self.tst_cls.strategies
+        assert self.tst_obj.stats == {strategy: 1}
+        assert (
+            self.destination_path.read_bytes() == self.source_path.read_bytes()
+        )
+
+    def test_copy_by_every_strategy(self):
+        for strategy in self.tst_cls.strategies:
+            if not self.tst_cls.check_strategy_is_available(strategy=strategy):
+                continue
+
+            with patch.object(self.tst_cls, "strategies", (strategy,)):
+                try:
+                    self.tst_obj.copy(
+                        source_path=self.source_path,
+                        destination_path=self.destination_path,
+                    )
+                except RuntimeError:
+                    # the filesystem doesn't support the strategy
+                    continue
+
+            assert (
+                self.destination_path.read_bytes()
+                == self.source_path.read_bytes()
+            ), strategy
+
+    def test_copy_empty(self):
+        self.source_path.write_bytes(b"")
+        self.destination_path.write_bytes(b"previous content")
+
+        self.tst_obj.copy(
+            source_path=self.source_path,
+            destination_path=self.destination_path,
+        )
+        assert self.destination_path.read_bytes() == b""
+
+    def test_copy_fallback(self):
+        def copy_partially(source, destination):
+            destination.write(b"partial content")
+            destination.flush()
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        with (
+            patch.object(
+                self.tst_obj,
+                "copy_by_reflink",
+                side_effect=OSError(errno.EOPNOTSUPP, "Not supported"),
+            ),
+            patch.object(
+                self.tst_obj, "copy_by_copy_file_range", new=copy_partially
+            ),
+            patch.object(
+                self.tst_obj,
+                "check_strategy_is_available",
+                return_value=True,
+            ),
+        ):
+            self.tst_obj._disabled_strategies.clear()
+            strategy = self.tst_obj.copy(
+                source_path=self.source_path,
+                destination_path=self.destination_path,
+            )
+
+        assert strategy in ("sendfile", "buffered")
+        assert "reflink" in self.tst_obj._disabled_strategies
+        assert "copy_file_range" not in self.tst_obj._disabled_strategies
+        assert (
+            self.destination_path.read_bytes() == self.source_path.read_bytes()
+        )
+
+    def test_copy_error(self):
+        with (
+            patch.object(
+                self.tst_obj,
+                "copy_by_reflink",
+                side_effect=OSError(errno.ENOSPC, "No space left on device"),
+            ),
+            self.assertRaises(OSError),
+        ):
+            self.tst_obj._disabled_strategies.discard("reflink")
+            self.tst_obj.copy(
+                source_path=self.source_path,
+                destination_path=self.destination_path,
+            )
+
+    def test_copy_link_modes(self):
+        for link_mode in self.tst_cls.link_modes:
+            self.tst_obj.set_link_mode(value=link_mode)
+            strategy = self.tst_obj.copy(
+                source_path=self.source_path,
+                destination_path=self.destination_path,
+            )
+
+            assert (
+                self.destination_path.read_bytes()
+                == self.source_path.read_bytes()
+            )
+            if link_mode in ("hardlink", "symlink"):
+                assert strategy == link_mode
+                assert self.destination_path.samefile(self.source_path)
+            else:
+                assert not self.destination_path.samefile(self.source_path)
+
+    def test_copy_over_link(self):
+        self.destination_path.hardlink_to(self.source_path)
+        content = self.source_path.read_bytes()
+
+        other_path = self.tmp_path / "other.bin"
+        other_path.write_bytes(b"other content")
+        self.tst_obj.copy(
+            source_path=other_path, destination_path=self.destination_path
+        )
+
+        assert self.destination_path.read_bytes() == b"other content"
+        assert self.source_path.read_bytes() == content
+
+    def test_copy_link_fallback(self):
+        self.tst_obj.set_link_mode(value="hardlink")
+        with patch.object(
+            self.tst_obj,
+            "link_by_hardlink",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ):
+            strategy = self.tst_obj.copy(
+                source_path=self.source_path,
+                destination_path=self.destination_path,
+            )
+
+        assert strategy in self.tst_cls.strategies
+        assert not self.destination_path.samefile(self.source_path)
+        assert (
+            self.destination_path.read_bytes() == self.source_path.read_bytes()
+        )
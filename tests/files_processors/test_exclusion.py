@@ -0,0 +1,200 @@
+import typing as t
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_bootstrap.files_processors.copy import CopyFilesProcessor
+from py_bootstrap.files_processors.exclusion import ExclusionMatcher
+from py_bootstrap.files_processors.generate import GenerateFilesProcessor
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class ExclusionMatcherTestCase(TestCase):
+    tst_cls = ExclusionMatcher
+    tst_obj: ExclusionMatcher
+
+    def setUp(self):
+        self.tst_obj = self.tst_cls()
+        self.tst_obj.set_excluded_directories(names=["__pycache__", ".git"])
+        self.tst_obj.set_excluded_files_extensions(extensions=[".pyc", ".o"])
+
+    def test_check_directory_is_excluded(self):
+        rel_path = Path("some-dir")
+        for dir_name in ("__pycache__", ".git"):
+            assert self.tst_obj.check_directory_is_excluded(
+                rel_path=rel_path, dir_name=dir_name
+            )
+        for dir_name in ("my__pycache__tools", "__pycache__2", "xgit", "git"):
+            assert not self.tst_obj.check_directory_is_excluded(
+                rel_path=rel_path, dir_name=dir_name
+            )
+
+    def test_check_file_is_excluded(self):
+        rel_path = Path("some-dir")
+        for file_name in ("module.pyc", "lib.o", "new\nline.o"):
+            assert self.tst_obj.check_file_is_excluded(
+                rel_path=rel_path, file_name=file_name
+            )
+        for file_name in ("module.py", "pyc", "lib.obj", "logo"):
+            assert not self.tst_obj.check_file_is_excluded(
+                rel_path=rel_path, file_name=file_name
+            )
+
+    def test_set_ignore_patterns(self):
+        tst_obj = self.tst_cls()
+        tst_obj.set_ignore_patterns(
+            patterns=[
+                "# comment",
+                "",
+                ".venv/",
+                "node_modules",
+                "/build",
+                "docs/**/*.html",
+                "**/dist",
+                "logs/**",
+                "*.lo[gc]",
+                "!keep.log",
+                "trailing\\ ",
+                "\\#hash",
+                "\\!bang",
+                "spaces   ",
+            ]
+        )
+        cases = [
+            ("", ".venv", True, True),
+            ("sub", ".venv", True, True),
+            ("", ".venv", False, False),
+            ("sub/dir", "node_modules", False, True),
+            ("", "build", True, True),
+            ("sub", "build", True, False),
+            ("docs", "index.html", False, True),
+            ("docs/a/b", "index.html", False, True),
+            ("sub/docs", "index.html", False, False),
+            ("a/b", "dist", True, True),
+            ("logs", "today.txt", False, True),
+            ("", "logs", True, False),
+            ("sub", "app.log", False, True),
+            ("sub", "app.loc", False, True),
+            ("sub", "app.lox", False, False),
+            ("sub", "keep.log", False, False),
+            ("", "trailing ", False, True),
+            ("", "#hash", False, True),
+            ("", "!bang", False, True),
+            ("", "spaces", False, True),
+            ("", "comment", False, False),
+        ]
+        for rel_path, name, is_directory, is_ignored in cases:
+            with self.subTest(rel_path=rel_path, name=name):
+                assert (
+                    tst_obj.check_path_is_ignored(
+                        rel_path=Path(rel_path),
+                        name=name,
+                        is_directory=is_directory,
+                    )
+                    is is_ignored
+                )
+
+    def test_empty(self):
+        tst_obj = self.tst_cls()
+        tst_obj.set_excluded_directories(names=[])
+
+        assert not tst_obj.check_directory_is_excluded(
+            rel_path=Path("."), dir_name="__pycache__"
+        )
+        assert not tst_obj.check_file_is_excluded(
+            rel_path=Path("."), file_name="module.pyc"
+        )
+
+
+class CopyFilesProcessorExclusionTestCase(TestCase):
+    tst_cls = CopyFilesProcessor
+    tst_obj: CopyFilesProcessor
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.source_path = Path(self.tmp_dir.name, "source")
+        self.destination_path = Path(self.tmp_dir.name, "destination")
+        for rel_path in (
+            "module.py",
+            "module.pyc",
+            "__pycache__/module.cpython-313.pyc",
+            "__pycache__/nested/file.txt",
+            "my__pycache__tools/file.txt",
+            "package/__pycache__/file.txt",
+        ):
+            path = self.source_path / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rel_path)
+        self.destination_path.mkdir()
+
+        self.tst_obj = self.tst_cls()
+        self.tst_obj.set_source_path(source_path=self.source_path)
+        self.tst_obj.set_destination_path(
+            destination_path=self.destination_path
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_run(self):
+        with patch.object(
+            self.tst_cls,
+            "check_file_for_processing",
+            autospec=True,
+            side_effect=self.tst_cls.check_file_for_processing,
+        ) as mock_check_file:
+            self.tst_obj.run()
+
+        assert sorted(
+            path.relative_to(self.destination_path).as_posix()
+            for path in self.destination_path.rglob("*")
+        ) == [
+            "module.py",
+            "my__pycache__tools",
+            "my__pycache__tools/file.txt",
+            "package",
+        ]
+        # files of excluded directories aren't even checked
+        checked_files_names = sorted(
+            call.kwargs["file_name"] for call in mock_check_file.call_args_list
+        )
+        assert checked_files_names == ["file.txt", "module.py"]
+        assert self.tst_obj.metrics.counters["directories_skipped"] == 2
+        assert self.tst_obj.metrics.counters["files_skipped"] == 1
+
+    def test_run_ignored(self):
+        (self.source_path / ".bootstrapignore").write_text(
+            "# development artefacts\n"
+            "my__pycache__tools/\n"
+            "*.py\n"
+            "!/module.py\n"
+        )
+        self.tst_obj.run()
+
+        assert sorted(
+            path.relative_to(self.destination_path).as_posix()
+            for path in self.destination_path.rglob("*")
+        ) == [".bootstrapignore", "module.py", "package"]
+        assert self.tst_obj.metrics.counters["directories_skipped"] == 3
+
+    def test_run_generated(self):
+        (self.source_path / ".bootstrapignore").write_text("package/\n")
+        tst_obj = GenerateFilesProcessor()
+        tst_obj.set_source_path(source_path=self.source_path)
+        tst_obj.set_destination_path(destination_path=self.destination_path)
+        tst_obj.set_context(value={})
+        tst_obj.set_entry_point_file_name(value="__entry_point__.py")
+        tst_obj.run()
+
+        # an ignore file isn't a part of generated projects
+        assert sorted(
+            path.relative_to(self.destination_path).as_posix()
+            for path in self.destination_path.rglob("*")
+        ) == [
+            "module.py",
+            "my__pycache__tools",
+            "my__pycache__tools/file.txt",
+        ]
@@ -0,0 +1,158 @@
+import os
+import subprocess
+import sys
+from hashlib import sha256
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_bootstrap.base.cache import CACHE_DIR_ENV_NAME
+from py_bootstrap.files_processors import GenerateFilesProcessor
+from py_bootstrap.files_processors.plan import BuildPlan, BuildPlanEntry
+
+# renders the bootstrap with and without streaming of templates
+RENDERING_SCRIPT = """
+import sys
+from hashlib import sha256
+from pathlib import Path
+from unittest.mock import patch
+
+from py_bootstrap.files_processors import GenerateFilesProcessor
+
+tmp_path = Path(sys.argv[1])
+for name, threshold in (("in-memory", 1 << 20), ("streaming", 0)):
+    (tmp_path / name).mkdir()
+    processor = GenerateFilesProcessor()
+    processor.set_source_path(source_path=tmp_path / "bootstrap")
+    processor.set_destination_path(destination_path=tmp_path / name)
+    processor.set_context(value={"name": "t\\u00ebst-name"})
+    processor.set_entry_point_file_name(value="__entry_point__.py")
+    with patch.object(GenerateFilesProcessor, "streaming_threshold", threshold):
+        processor.run()
+    assert not processor.metrics.counters.get("failures")
+"""
+
+
+class GenerateFilesProcessorTestCase(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def apply_plan(self, entries: list[BuildPlanEntry]) -> "Path":
+        source_path = self.tmp_path / "bootstrap"
+        source_path.mkdir(exist_ok=True)
+        (source_path / "readme.txt").write_text("test content")
+        destination_path = self.tmp_path / "destination"
+        destination_path.mkdir(exist_ok=True)
+
+        processor = GenerateFilesProcessor()
+        processor.set_source_path(source_path=source_path)
+        processor.set_destination_path(destination_path=destination_path)
+        processor.set_context(value={})
+        plan = BuildPlan(
+            bootstrap_path=str(source_path), context={}, entries=entries
+        )
+        with (
+            patch.dict(
+                os.environ, {CACHE_DIR_ENV_NAME: str(self.tmp_path / "cache")}
+            ),
+            self.assertLogs("py_bootstrap.files_processors.generate"),
+        ):
+            processor.apply_plan(plan=plan)
+        assert processor.metrics.counters.get("failures") == len(entries)
+        return destination_path
+
+    def test_apply_plan_outside_paths(self):
+        escaping_path = self.tmp_path / "escaping.txt"
+        (self.tmp_path / "destination").mkdir()
+        (self.tmp_path / "destination" / "link").symlink_to(self.tmp_path)
+        self.apply_plan(
+            entries=[
+                BuildPlanEntry(action="mkdir", destination="../escaping-dir"),
+                BuildPlanEntry(
+                    action="copy",
+                    destination="../escaping.txt",
+                    source="readme.txt",
+                    size=12,
+                ),
+                BuildPlanEntry(
+                    action="copy",
+                    destination=str(escaping_path),
+                    source="readme.txt",
+                    size=12,
+                ),
+                BuildPlanEntry(
+                    action="copy",
+                    destination="link/escaping.txt",
+                    source="readme.txt",
+                    size=12,
+                ),
+                BuildPlanEntry(
+                    action="copy",
+                    destination="readme.txt",
+                    source="../bootstrap/readme.txt",
+                    size=12,
+                ),
+            ]
+        )
+        assert not (self.tmp_path / "escaping-dir").exists()
+        assert not escaping_path.exists()
+        assert not (self.tmp_path / "destination" / "readme.txt").exists()
+
+    def test_apply_plan_changed_files(self):
+        destination_path = self.apply_plan(
+            entries=[
+                BuildPlanEntry(
+                    action="copy",
+                    destination="hashed.txt",
+                    source="readme.txt",
+                    size=12,
+                    hash=sha256(b"test changed").hexdigest(),
+                ),
+                BuildPlanEntry(
+                    action="copy",
+                    destination="sized.txt",
+                    source="readme.txt",
+                    size=42,
+                ),
+            ]
+        )
+        # unplanned contents aren't kept
+        assert list(destination_path.iterdir()) == []
+
+    def test_run_non_ascii(self):
+        bootstrap_path = self.tmp_path / "bootstrap"
+        bootstrap_path.mkdir()
+        (bootstrap_path / "readme.txt.tmpl").write_bytes(
+            "name = {name} — ü€\n".encode()
+        )
+
+        # templates are UTF-8 regardless of a locale encoding
+        subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "utf8=0",
+                "-c",
+                RENDERING_SCRIPT,
+                str(self.tmp_path),
+            ],
+            env=dict(
+                os.environ,
+                LC_ALL="C",
+                PYTHONCOERCECLOCALE="0",
+                PYTHONPATH=os.getcwd(),
+                PY_BOOTSTRAP_CACHE_DIR=str(self.tmp_path / "cache"),
+            ),
+            check=True,
+        )
+
+        expected = "name = tëst-name — ü€\n".encode()
+        for name in ("in-memory", "streaming"):
+            with self.subTest(name=name):
+                path = self.tmp_path / name / "readme.txt"
+                assert path.read_bytes() == expected
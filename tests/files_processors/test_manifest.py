@@ -0,0 +1,81 @@
+import typing as t
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from py_bootstrap.files_processors import manifest as manifest_module
+from py_bootstrap.files_processors.manifest import BuildManifest
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class BuildManifestTestCase(TestCase):
+    tst_cls = BuildManifest
+    tst_obj: BuildManifest
+
+    context = {"name": "test-name"}
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        self.source_path = self.tmp_path / "source.txt.tmpl"
+        self.source_path.write_text("{name}")
+        self.destination_path = self.tmp_path / "destination.txt"
+        self.destination_path.write_text("test-name")
+
+        self.tst_obj = self.build_tst_obj()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def build_tst_obj(self) -> BuildManifest:
+        tst_obj = self.tst_cls()
+        tst_obj.set_destination_path(destination_path=self.tmp_path)
+        tst_obj.set_context(value=self.context)
+        tst_obj.load()
+        return tst_obj
+
+    def check_is_actual(self, tst_obj: BuildManifest) -> bool:
+        return tst_obj.check_is_actual(
+            source="source.txt.tmpl",
+            source_path=self.source_path,
+            destination_path=self.destination_path,
+            is_template=True,
+        )
+
+    def test_save_load(self):
+        assert not self.check_is_actual(tst_obj=self.tst_obj)
+        self.tst_obj.record(
+            source="source.txt.tmpl",
+            source_path=self.source_path,
+            destination_path=self.destination_path,
+            is_template=True,
+            content_hash="hash",
+        )
+        self.tst_obj.save()
+
+        tst_obj = self.build_tst_obj()
+        assert self.check_is_actual(tst_obj=tst_obj)
+        assert (
+            tst_obj.get_content_hash(destination_path=self.destination_path)
+            == "hash"
+        )
+
+        tst_obj.set_context(value={"name": "other-name"})
+        assert not self.check_is_actual(tst_obj=tst_obj)
+
+        self.destination_path.write_text("other-name")
+        tst_obj = self.build_tst_obj()
+        assert not self.check_is_actual(tst_obj=tst_obj)
+        assert (
+            tst_obj.get_content_hash(destination_path=self.destination_path)
+            != "hash"
+        )
+
+    def test_load_broken(self):
+        self.tst_obj.path.write_text("{broken")
+
+        with self.assertLogs(manifest_module.__name__, level="WARNING"):
+            tst_obj = self.build_tst_obj()
+        assert not self.check_is_actual(tst_obj=tst_obj)
@@ -0,0 +1,44 @@
+import json
+import typing as t
+from unittest import TestCase
+
+from py_bootstrap.files_processors.plan import BuildPlan, BuildPlanEntry
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class BuildPlanTestCase(TestCase):
+    tst_cls = BuildPlan
+
+    def test_dumps_loads(self):
+        tst_obj = self.tst_cls(
+            bootstrap_path="/some/bootstrap",
+            context={"name": "test-name"},
+            entries=[
+                BuildPlanEntry(action="mkdir", destination="some-dir"),
+                BuildPlanEntry(
+                    action="render",
+                    destination="some-dir/file.txt",
+                    source="some-dir/file.txt.tmpl",
+                    size=42,
+                    hash="hash",
+                ),
+            ],
+        )
+
+        value = tst_obj.dumps()
+        assert json.loads(value)["total_size"] == 42
+        assert self.tst_cls.loads(value) == tst_obj
+
+    def test_loads_unsupported_version(self):
+        value = json.dumps(
+            {
+                "format_version": 0,
+                "bootstrap_path": "/some/bootstrap",
+                "context": {},
+                "entries": [],
+            }
+        )
+        with self.assertRaises(ValueError):
+            self.tst_cls.loads(value)
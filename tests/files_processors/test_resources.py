@@ -0,0 +1,122 @@
+import typing as t
+import zipfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import tests.tst_templates as tst_templates_module
+from py_bootstrap.files_processors import (
+    BuildManifest,
+    CopyFilesProcessor,
+    GenerateFilesProcessor,
+)
+
+if t.TYPE_CHECKING:
+    from py_bootstrap.files_processors import BaseFilesProcessor
+
+
+class TraversableSourceTestCase(TestCase):
+    source_path = Path(tst_templates_module.__file__).parent / "test_bootstrap"
+    context = {
+        "name": "test-name",
+        "python_name": "test_name",
+        "upper_name": "TEST_NAME",
+        "class_name": "TestName",
+        "title": "Test title",
+        "description": "Test description",
+        "empty": "",
+        "date_today": "2026-01-01",
+        "date_year": "2026",
+        "python_major": "3",
+        "python_minor": "13",
+    }
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        self.zip_path = self.tmp_path / "bootstraps.zip"
+
+        with zipfile.ZipFile(self.zip_path, "w") as zip_file:
+            for root_path, _, files_names in self.source_path.walk():
+                for file_name in files_names:
+                    path = root_path / file_name
+                    zip_file.write(
+                        path,
+                        arcname=Path(
+                            "test_bootstrap", path.relative_to(self.source_path)
+                        ).as_posix(),
+                    )
+        self.traversable = zipfile.Path(self.zip_path, at="test_bootstrap/")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def read_tree(self, path: Path) -> dict[str, t.Optional[bytes]]:
+        return {
+            item.relative_to(path).as_posix(): (
+                item.read_bytes() if item.is_file() else None
+            )
+            for item in path.rglob("*")
+        }
+
+    def run_processor(
+        self, processor: "BaseFilesProcessor", name: str, is_zipped: bool
+    ) -> Path:
+        if is_zipped:
+            processor.set_source_traversable(value=self.traversable)
+        else:
+            processor.set_source_traversable(value=self.source_path)
+        destination_path = self.tmp_path / name
+        processor.set_destination_path(destination_path=destination_path)
+        processor.run()
+        return destination_path
+
+    def build_generate_processor(self) -> GenerateFilesProcessor:
+        processor = GenerateFilesProcessor()
+        processor.set_context(value=self.context)
+        processor.set_entry_point_file_name(value="__entry_point__.py")
+        return processor
+
+    def test_generate(self):
+        expected_path = self.run_processor(
+            self.build_generate_processor(), name="expected", is_zipped=False
+        )
+        destination_path = self.run_processor(
+            self.build_generate_processor(), name="zipped", is_zipped=True
+        )
+
+        expected_tree = self.read_tree(expected_path)
+        assert "test_name/generated-file.txt" in expected_tree
+        assert self.read_tree(destination_path) == expected_tree
+
+    def test_generate_incrementally(self):
+        destination_path = self.tmp_path / "zipped"
+        for _ in range(2):
+            manifest = BuildManifest()
+            manifest.set_destination_path(destination_path=destination_path)
+            manifest.set_context(value=self.context)
+            manifest.load()
+            processor = self.build_generate_processor()
+            processor.set_manifest(value=manifest)
+            self.run_processor(processor, name="zipped", is_zipped=True)
+            manifest.save()
+
+        # zipped files are tracked by the zip file state
+        assert manifest.check_is_actual(
+            source="some-file.txt",
+            source_path=self.zip_path,
+            destination_path=destination_path / "some-file.txt",
+            is_template=False,
+        )
+
+    def test_copy(self):
+        processor = CopyFilesProcessor()
+        destination_path = self.run_processor(
+            processor, name="zipped", is_zipped=True
+        )
+
+        expected_path = self.run_processor(
+            CopyFilesProcessor(), name="expected", is_zipped=False
+        )
+        assert self.read_tree(destination_path) == self.read_tree(expected_path)
+        assert processor.files_copier.stats == {"buffered": 4}
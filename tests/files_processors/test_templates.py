@@ -0,0 +1,181 @@
+import io
+import os
+import typing as t
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_bootstrap.base.cache import CACHE_DIR_ENV_NAME
+from py_bootstrap.files_processors import templates as templates_module
+from py_bootstrap.files_processors.templates import (
+    CompiledTemplate,
+    StreamingTemplateRenderer,
+    TemplatesCache,
+)
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class CompiledTemplateTestCase(TestCase):
+    tst_cls = CompiledTemplate
+
+    context = {"name": "value", "number": 42}
+
+    def test_render(self):
+        for template in (
+            "",
+            "plain text",
+            "{name}",
+            "before {name} after {number}",
+            "{{escaped}} {name!r} {name!s:>10} {number:05d} {name!a}",
+        ):
+            compiled = self.tst_cls.compile(template=template)
+            assert compiled.segments is not None
+            assert compiled.render(context=self.context) == template.format(
+                **self.context
+            )
+
+    def test_render_fallback(self):
+        for template in ("{name[0]}", "{number:{number}}", "{name.upper}"):
+            compiled = self.tst_cls.compile(template=template)
+            assert compiled.segments is None
+            assert compiled.render(context=self.context) == template.format(
+                **self.context
+            )
+
+    def test_render_missed_field(self):
+        compiled = self.tst_cls.compile(template="{missed}")
+        with self.assertRaises(KeyError):
+            compiled.render(context=self.context)
+
+    def test_compile_malformed(self):
+        with self.assertRaises(ValueError):
+            self.tst_cls.compile(template="{name")
+
+
+class StreamingTemplateRendererTestCase(TestCase):
+    tst_cls = StreamingTemplateRenderer
+    tst_obj: StreamingTemplateRenderer
+
+    context = {"name": "value", "number": 42}
+    template = (
+        "{{escaped}} {name} }}{{ {number:05d} {name!r:>{number}}\n"
+        "{number:{number}} {{{name}}} {name[0]}\n"
+    ) * 3
+
+    def setUp(self):
+        self.tst_obj = self.tst_cls()
+        self.tst_obj.set_context(value=self.context)
+
+    def render(self, template: str) -> str:
+        destination = io.StringIO()
+        self.tst_obj.render(
+            source=io.StringIO(template), destination=destination
+        )
+        return destination.getvalue()
+
+    def test_render(self):
+        expected = self.template.format(**self.context)
+        for chunk_size in (1, 2, 3, 5, 8, 13, 1024):
+            with patch.object(self.tst_cls, "chunk_size", chunk_size):
+                assert self.render(template=self.template) == expected
+
+    def test_render_malformed(self):
+        for template in ("text {name", "text {name} }", "text {"):
+            with (
+                patch.object(self.tst_cls, "chunk_size", 2),
+                self.assertRaises(ValueError),
+            ):
+                self.render(template=template)
+
+    def test_render_too_long_field(self):
+        with (
+            patch.object(self.tst_cls, "chunk_size", 4),
+            patch.object(self.tst_cls, "max_field_size", 16),
+            self.assertRaises(ValueError),
+        ):
+            self.render(template="text {" + "a" * 32 + "}")
+
+    def test_find_safe_cut(self):
+        assert self.tst_obj.find_safe_cut(text="text") == 4
+        assert self.tst_obj.find_safe_cut(text="text {") == 5
+        assert self.tst_obj.find_safe_cut(text="text }") == 5
+        assert self.tst_obj.find_safe_cut(text="text {{") == 7
+        assert self.tst_obj.find_safe_cut(text="text {name") == 5
+        assert self.tst_obj.find_safe_cut(text="text {a:{b}") == 5
+        assert self.tst_obj.find_safe_cut(text="text {a:{b}} x") == 14
+
+
+class TemplatesCacheTestCase(TestCase):
+    tst_cls = TemplatesCache
+    tst_obj: TemplatesCache
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        self.env_patcher = patch.dict(
+            os.environ, {CACHE_DIR_ENV_NAME: str(self.tmp_path / "cache")}
+        )
+        self.env_patcher.start()
+
+        self.template_path = self.tmp_path / "file.txt.tmpl"
+        self.template_path.write_text("Hello, {name}!")
+        self.tst_obj = self.tst_cls()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def test_get(self):
+        compiled = self.tst_obj.get(path=self.template_path)
+        assert compiled.render(context={"name": "test"}) == "Hello, test!"
+        assert len(list(self.tst_obj.cache_path.glob("*.bin"))) == 1
+
+        self.tst_obj.save()
+        assert (self.tst_obj.cache_path / self.tst_cls.stats_file_name).exists()
+
+    def test_get_from_disk(self):
+        self.tst_obj.get(path=self.template_path)
+        self.tst_obj.save()
+
+        tst_obj = self.tst_cls()
+        with (
+            patch.object(
+                templates_module.CompiledTemplate, "compile"
+            ) as mock_compile,
+            patch.object(Path, "read_text") as mock_read_text,
+        ):
+            compiled = tst_obj.get(path=self.template_path)
+        mock_compile.assert_not_called()
+        mock_read_text.assert_not_called()
+        assert compiled.render(context={"name": "test"}) == "Hello, test!"
+
+    def test_get_changed(self):
+        self.tst_obj.get(path=self.template_path)
+        self.tst_obj.save()
+
+        self.template_path.write_text("Bye, {name}!")
+        os.utime(self.template_path, ns=(0, 0))
+
+        compiled = self.tst_cls().get(path=self.template_path)
+        assert compiled.render(context={"name": "test"}) == "Bye, test!"
+
+    def test_get_broken(self):
+        compiled = self.tst_obj.get(path=self.template_path)
+        self.tst_obj.save()
+        for path in self.tst_obj.cache_path.iterdir():
+            path.write_bytes(b"broken")
+
+        with self.assertLogs(templates_module.__name__, level="WARNING"):
+            compiled = self.tst_cls().get(path=self.template_path)
+        assert compiled.render(context={"name": "test"}) == "Hello, test!"
+
+    def test_get_unwritable(self):
+        (self.tmp_path / "cache").write_text("not a directory")
+
+        with self.assertLogs(templates_module.__name__, level="WARNING"):
+            compiled = self.tst_obj.get(path=self.template_path)
+            self.tst_obj.save()
+        assert compiled.render(context={"name": "test"}) == "Hello, test!"
@@ -0,0 +1,110 @@
+import contextlib
+import io
+import sys
+import typing as t
+from argparse import Namespace
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import tests.tst_templates as tst_templates_module
+from py_bootstrap.files_processors import BuildPlan, PackFilesProcessor
+from py_bootstrap.operations.archive_finder import BootstrapArchiveFinder
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class BootstrapArchiveFinderTestCase(TestCase):
+    tst_cls = BootstrapArchiveFinder
+
+    package_name = "tst_archived_templates"
+    source_path = Path(tst_templates_module.__file__).parent / "test_bootstrap"
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        package_path = Path(self.tmp_dir.name, self.package_name)
+        package_path.mkdir()
+        (package_path / "__init__.py").write_text(
+            'ENABLED_TEMPLATES = ["test_bootstrap"]\n'
+        )
+        self.archive_path = package_path / "test_bootstrap.pybootstrap"
+
+        processor = PackFilesProcessor()
+        processor.set_source_path(source_path=self.source_path)
+        processor.set_destination_path(destination_path=self.archive_path)
+        processor.run()
+
+        sys.path.insert(0, self.tmp_dir.name)
+        self.tst_cls.install()
+
+    def tearDown(self):
+        sys.path.remove(self.tmp_dir.name)
+        for name in list(sys.modules):
+            if name.startswith(self.package_name):
+                del sys.modules[name]
+        self.tmp_dir.cleanup()
+
+    def test_install(self):
+        self.tst_cls.install()
+
+        finders = [
+            finder
+            for finder in sys.meta_path
+            if isinstance(finder, self.tst_cls)
+        ]
+        assert len(finders) == 1
+
+    def test_import(self):
+        module = import_module(
+            f"{self.package_name}.test_bootstrap.__entry_point__"
+        )
+
+        assert module.DESCRIPTION
+        assert module.BuildOperation
+        assert module.__file__
+        assert Path(module.__file__).parent == self.archive_path
+
+    def test_build(self):
+        module = import_module(
+            f"{self.package_name}.test_bootstrap.__entry_point__"
+        )
+        assert module.__file__
+        destination_path = Path(self.tmp_dir.name, "test-destination")
+        namespace = Namespace(
+            destination_dir=destination_path,
+            name="test-name",
+            description="Test project description",
+            dry_run=True,
+        )
+        operation = module.BuildOperation()
+        operation.set_cli_namespace(namespace=namespace)
+        operation.set_bootstrap_path(path=Path(module.__file__).parent)
+
+        mock_stdout = io.StringIO()
+        with contextlib.redirect_stdout(mock_stdout):
+            operation.run()
+        plan = BuildPlan.loads(mock_stdout.getvalue())
+        assert plan.bootstrap_path == self.archive_path.as_posix()
+
+        namespace.dry_run = False
+        namespace.plan = plan
+        operation = module.BuildOperation()
+        operation.set_cli_namespace(namespace=namespace)
+        operation.set_plan(value=plan)
+        operation.run()
+
+        assert (
+            (destination_path / "test_name/generated-file.txt")
+            .read_text()
+            .startswith("name = test-name\n")
+        )
+        assert (destination_path / "some-dir/copied-file.txt").is_file()
+        assert not (destination_path / "__entry_point__.py").exists()
+
+    def test_import_missed(self):
+        with self.assertRaises(ImportError):
+            import_module(f"{self.package_name}.test_bootstrap.missed")
+        with self.assertRaises(ImportError):
+            import_module(f"{self.package_name}.missed.__entry_point__")
@@ -0,0 +1,187 @@
+import json
+import os
+import sys
+import tempfile
+import typing as t
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import tests.tst_templates as tst_package
+from py_bootstrap.operations import bootstraps_index as bootstraps_index_module
+from py_bootstrap.operations.base import BaseBootstrapsOperation
+from py_bootstrap.operations.bootstraps_index import (
+    BootstrapsIndex,
+    BootstrapsIndexEntry,
+)
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class BootstrapsIndexTestCase(TestCase):
+    tst_cls = BootstrapsIndex
+    tst_obj: BootstrapsIndex
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.env_patcher = patch.dict(
+            os.environ, {BootstrapsIndex.cache_dir_env_name: self.tmp_dir.name}
+        )
+        self.env_patcher.start()
+        self.entry_points_patcher = patch(
+            "importlib.metadata.entry_points",
+            Mock(
+                return_value=[
+                    EntryPoint(
+                        "test",
+                        tst_package.__package__,
+                        "py_bootstrap_templates",
+                    )
+                ]
+            ),
+        )
+        self.entry_points_patcher.start()
+
+        self.tst_obj = self.tst_cls()
+        self.tst_obj.set_operation_cls(BaseBootstrapsOperation)
+
+    def tearDown(self):
+        self.entry_points_patcher.stop()
+        self.env_patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def test_load(self):
+        entries = self.tst_obj.load()
+
+        assert self.tst_obj.cache_path == Path(
+            self.tmp_dir.name, BootstrapsIndex.cache_file_name
+        )
+        assert self.tst_obj.cache_path.is_file()
+
+        entries_map = {entry.name: entry for entry in entries}
+        assert "test_missed_entry_point" not in entries_map
+        assert entries_map["test_bootstrap"] == BootstrapsIndexEntry(
+            name="test_bootstrap",
+            import_path="tests.tst_templates.test_bootstrap.__entry_point__",
+            path=str(Path(tst_package.__file__).parent / "test_bootstrap"),
+            description="Provides bootstrapping for test python project",
+            build_cli_description="Generates a test skeleton of python project",
+            export_cli_description="Exports a test python project template files",
+        )
+        assert entries_map["test_wrong_entry_point"].description is None
+        assert (
+            entries_map["test_wrong_entry_point"].build_cli_description is None
+        )
+
+    def test_load_from_cache(self):
+        entries = self.tst_obj.load()
+
+        index = self.tst_cls()
+        index.set_operation_cls(BaseBootstrapsOperation)
+        with patch.object(
+            BaseBootstrapsOperation, "find_bootstraps"
+        ) as mock_find_bootstraps:
+            assert index.load() == entries
+        mock_find_bootstraps.assert_not_called()
+
+    def test_load_stale_cache(self):
+        self.tst_obj.load()
+
+        data = json.loads(self.tst_obj.cache_path.read_text())
+        data["fingerprint"] = "stale"
+        data["stats"] = None
+        data["bootstraps"] = []
+        self.tst_obj.cache_path.write_text(json.dumps(data))
+
+        entries = self.tst_obj.load()
+        assert "test_bootstrap" in {entry.name for entry in entries}
+
+        data = json.loads(self.tst_obj.cache_path.read_text())
+        assert data["fingerprint"] == self.tst_obj.compute_fingerprint()
+
+    def test_load_unchanged_stats(self):
+        entries = self.tst_obj.load()
+
+        index = self.tst_cls()
+        index.set_operation_cls(BaseBootstrapsOperation)
+        with patch.object(
+            BaseBootstrapsOperation, "find_entry_points"
+        ) as mock_find_entry_points:
+            assert index.load() == entries
+        mock_find_entry_points.assert_not_called()
+
+    def test_load_changed_stats(self):
+        self.tst_obj.load()
+        # a bootstrap is added into a package
+        data = json.loads(self.tst_obj.cache_path.read_text())
+        package_path = str(Path(tst_package.__file__).parent)
+        data["stats"]["mtimes"][package_path] -= 1
+        data["fingerprint"] = "stale"
+        data["bootstraps"] = []
+        self.tst_obj.cache_path.write_text(json.dumps(data))
+        entries = self.tst_obj.load()
+        assert "test_bootstrap" in {entry.name for entry in entries}
+
+        # packages are installed into sys.path directories
+        data = json.loads(self.tst_obj.cache_path.read_text())
+        data["stats"]["sys_path"] = []
+        self.tst_obj.cache_path.write_text(json.dumps(data))
+        with patch.object(
+            BaseBootstrapsOperation, "find_bootstraps"
+        ) as mock_find_bootstraps:
+            assert self.tst_obj.load() == entries
+        mock_find_bootstraps.assert_not_called()
+        data = json.loads(self.tst_obj.cache_path.read_text())
+        assert data["stats"]["sys_path"] == sys.path
+
+    def test_load_broken_cache(self):
+        self.tst_obj.cache_path.write_text("{broken")
+
+        with self.assertLogs(
+            bootstraps_index_module.__name__, level="WARNING"
+        ) as logs_ctx:
+            entries = self.tst_obj.load()
+
+        assert "unable to read index" in logs_ctx.output[0]
+        assert "test_bootstrap" in {entry.name for entry in entries}
+
+    def test_load_unable_write_cache(self):
+        Path(self.tmp_dir.name, "file").touch()
+        with patch.dict(
+            os.environ,
+            {
+                BootstrapsIndex.cache_dir_env_name: os.path.join(
+                    self.tmp_dir.name, "file", "cache"
+                )
+            },
+        ):
+            index = self.tst_cls()
+            index.set_operation_cls(BaseBootstrapsOperation)
+            with self.assertLogs(
+                bootstraps_index_module.__name__, level="WARNING"
+            ) as logs_ctx:
+                entries = index.load()
+
+        assert any("unable to write index" in i for i in logs_ctx.output)
+        assert "test_bootstrap" in {entry.name for entry in entries}
+
+    def test_compute_fingerprint_tracks_entry_points_files(self):
+        fingerprint = self.tst_obj.compute_fingerprint()
+        assert fingerprint == self.tst_obj.compute_fingerprint()
+
+        entry_point_path = (
+            Path(tst_package.__file__).parent
+            / "test_bootstrap"
+            / "__entry_point__.py"
+        )
+        stat = entry_point_path.stat()
+        try:
+            os.utime(
+                entry_point_path,
+                ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+            )
+            assert fingerprint != self.tst_obj.compute_fingerprint()
+        finally:
+            os.utime(entry_point_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
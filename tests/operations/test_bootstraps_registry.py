@@ -0,0 +1,75 @@
+import sys
+import typing as t
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_bootstrap.operations.base import BaseBootstrapsOperation
+from py_bootstrap.operations.bootstraps_index import BootstrapsIndexEntry
+from py_bootstrap.operations.bootstraps_registry import BootstrapsRegistry
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class BootstrapsRegistryTestCase(TestCase):
+    tst_cls = BootstrapsRegistry
+    tst_obj: BootstrapsRegistry
+
+    entries = [
+        BootstrapsIndexEntry(
+            name="test_bootstrap",
+            import_path="tests.tst_templates.test_bootstrap.__entry_point__",
+            path="tests/tst_templates/test_bootstrap",
+        ),
+        BootstrapsIndexEntry(
+            name="test_wrong_entry_point",
+            import_path="tests.tst_templates.test_wrong_entry_point.__entry_point__",
+            path="tests/tst_templates/test_wrong_entry_point",
+        ),
+    ]
+
+    def setUp(self):
+        self.tst_obj = self.tst_cls()
+        self.tst_obj.set_operation_cls(BaseBootstrapsOperation)
+
+        self.find_patcher = patch.object(
+            BaseBootstrapsOperation,
+            "find_bootstraps_entries",
+            return_value=self.entries,
+        )
+        self.mock_find = self.find_patcher.start()
+
+    def tearDown(self):
+        self.find_patcher.stop()
+
+    def test_get_entries(self):
+        assert self.tst_obj.get_entries() == self.entries
+        assert self.tst_obj.get_entries() == self.entries
+        self.mock_find.assert_called_once()
+
+    def test_get_entry(self):
+        assert self.tst_obj.get_entry(name="test_bootstrap") == self.entries[0]
+        with self.assertRaises(KeyError):
+            self.tst_obj.get_entry(name="missed")
+        self.mock_find.assert_called_once()
+
+    def test_get_module(self):
+        module = self.tst_obj.get_module(name="test_bootstrap")
+        assert module.__name__ == self.entries[0].import_path
+        assert module.DESCRIPTION
+
+        with patch(
+            "py_bootstrap.operations.bootstraps_registry.import_module"
+        ) as mock_import_module:
+            assert self.tst_obj.get_module(name="test_bootstrap") is module
+        mock_import_module.assert_not_called()
+
+    def test_invalidate(self):
+        self.tst_obj.get_module(name="test_bootstrap")
+
+        self.tst_obj.invalidate()
+        assert self.entries[0].import_path not in sys.modules
+
+        module = self.tst_obj.get_module(name="test_bootstrap")
+        assert module.__name__ == self.entries[0].import_path
+        assert self.mock_find.call_count == 2
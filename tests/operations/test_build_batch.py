@@ -0,0 +1,265 @@
+import contextlib
+import io
+import json
+import shutil
+import typing as t
+from argparse import ArgumentTypeError, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_bootstrap.operations import build_batch as build_batch_module
+from py_bootstrap.operations.base import BaseBootstrapsOperation
+from py_bootstrap.operations.bootstraps_index import BootstrapsIndexEntry
+from py_bootstrap.operations.build_batch import (
+    BuildBatchOperation,
+    BuildBatchRecord,
+)
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class BuildBatchOperationTestCase(TestCase):
+    tst_cls = BuildBatchOperation
+    tst_obj: BuildBatchOperation
+
+    entries = [
+        BootstrapsIndexEntry(
+            name="test_bootstrap",
+            import_path="tests.tst_templates.test_bootstrap.__entry_point__",
+            path="tests/tst_templates/test_bootstrap",
+        ),
+    ]
+
+    def setUp(self):
+        self.tst_obj = self.tst_cls()
+
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+
+        self.find_patcher = patch.object(
+            BaseBootstrapsOperation,
+            "find_bootstraps_entries",
+            return_value=self.entries,
+        )
+        self.mock_find = self.find_patcher.start()
+
+    def tearDown(self):
+        self.find_patcher.stop()
+        self.tmp_dir.cleanup()
+        for name in ("test-destination-1", "test-destination-2"):
+            shutil.rmtree(name, ignore_errors=True)
+
+    def write_spec(self, name: str, content: str) -> str:
+        path = self.tmp_path / name
+        path.write_text(content)
+        return str(path)
+
+    def test_load_spec(self):
+        jsonl_path = self.write_spec(
+            "spec.jsonl",
+            "\n".join(
+                json.dumps(item)
+                for item in (
+                    {
+                        "bootstrap": "test_bootstrap",
+                        "dest": "test-destination-1",
+                        "args": {"name": "test-name", "flag": True},
+                    },
+                    {
+                        "bootstrap": "test_bootstrap",
+                        "dest": "test-destination-2",
+                        "args": ["--name=test-name"],
+                    },
+                )
+            ),
+        )
+        toml_path = self.write_spec(
+            "spec.toml",
+            """
+[[projects]]
+bootstrap = "test_bootstrap"
+dest = "test-destination-1"
+args = {name = "test-name", flag = true}
+
+[[projects]]
+bootstrap = "test_bootstrap"
+dest = "test-destination-2"
+args = ["--name=test-name"]
+""",
+        )
+
+        expected = [
+            BuildBatchRecord(
+                bootstrap="test_bootstrap",
+                destination="test-destination-1",
+                arguments=("--name=test-name", "--flag"),
+            ),
+            BuildBatchRecord(
+                bootstrap="test_bootstrap",
+                destination="test-destination-2",
+                arguments=("--name=test-name",),
+            ),
+        ]
+        assert self.tst_cls.validate_cli_argument_spec(jsonl_path) == expected
+        assert self.tst_cls.validate_cli_argument_spec(toml_path) == expected
+
+    def test_load_wrong_spec(self):
+        for name, content in (
+            ("spec.jsonl", "{broken"),
+            ("spec.jsonl", '{"dest": "test-destination-1"}'),
+            ("spec.toml", "[[others]]"),
+        ):
+            with self.assertRaises(ArgumentTypeError):
+                self.tst_cls.validate_cli_argument_spec(
+                    self.write_spec(name, content)
+                )
+
+    def test_run(self):
+        records = [
+            BuildBatchRecord(
+                bootstrap="test_bootstrap",
+                destination=f"test-destination-{index}",
+                arguments=(
+                    f"--name=test-name-{index}",
+                    "--description=Test project description",
+                ),
+            )
+            for index in (1, 2)
+        ]
+        self.tst_obj.set_cli_namespace(namespace=Namespace(spec=records))
+
+        mock_stdout = io.StringIO()
+        with contextlib.redirect_stdout(mock_stdout):
+            self.tst_obj.run()
+
+        output = mock_stdout.getvalue()
+        assert "ok: test_bootstrap -> test-destination-1" in output
+        assert "ok: test_bootstrap -> test-destination-2" in output
+        for index in (1, 2):
+            path = Path(
+                f"test-destination-{index}",
+                f"test_name_{index}",
+                "generated-file.txt",
+            )
+            assert f"name = test-name-{index}" in path.read_text()
+        self.mock_find.assert_called_once()
+
+    def test_run_workers(self):
+        records = [
+            BuildBatchRecord(
+                bootstrap="test_bootstrap",
+                destination=f"test-destination-{index}",
+                arguments=(
+                    f"--name=test-name-{index}",
+                    "--description=Test project description",
+                ),
+            )
+            for index in (1, 2)
+        ]
+        self.tst_obj.set_cli_namespace(
+            namespace=Namespace(spec=records, workers=2)
+        )
+
+        mock_stdout = io.StringIO()
+        with contextlib.redirect_stdout(mock_stdout):
+            self.tst_obj.run()
+
+        output = mock_stdout.getvalue()
+        assert "ok: test_bootstrap -> test-destination-1" in output
+        assert "ok: test_bootstrap -> test-destination-2" in output
+        for index in (1, 2):
+            path = Path(
+                f"test-destination-{index}",
+                f"test_name_{index}",
+                "generated-file.txt",
+            )
+            assert f"name = test-name-{index}" in path.read_text()
+        assert self.tst_cls._worker_batch is None
+
+        # metrics of workers are merged
+        counters = self.tst_obj.metrics.counters
+        assert counters["files"] == 6
+        assert counters["bytes_written"] > 0
+        phases = self.tst_obj.metrics.phases
+        assert phases["context_building"].calls == 2
+        assert phases["template_rendering"].calls == 2
+
+    def test_run_workers_failed(self):
+        records = [
+            BuildBatchRecord(
+                bootstrap="test_bootstrap",
+                destination="test-destination-1",
+                arguments=(
+                    "--name=test-name",
+                    "--description=Test project description",
+                ),
+            )
+        ]
+        self.tst_obj.set_cli_namespace(
+            namespace=Namespace(spec=records, workers=2)
+        )
+
+        mock_stdout = io.StringIO()
+        with (
+            patch.object(
+                self.tst_cls,
+                "build_record",
+                side_effect=RuntimeError("Worker error"),
+            ),
+            self.assertRaises(Exception) as err_ctx,
+            self.assertLogs(build_batch_module.__name__, level="WARNING"),
+            contextlib.redirect_stdout(mock_stdout),
+        ):
+            self.tst_obj.run()
+
+        assert err_ctx.exception.args == ("Building projects batch",)
+        assert (
+            "failed: test_bootstrap -> test-destination-1: Worker error"
+            in mock_stdout.getvalue()
+        )
+
+    def test_validate_cli_argument_workers(self):
+        assert self.tst_cls.validate_cli_argument_workers("4") == 4
+        for value in ("0", "-1", "many"):
+            with self.assertRaises(ArgumentTypeError):
+                self.tst_cls.validate_cli_argument_workers(value)
+
+    def test_run_failed(self):
+        records = [
+            BuildBatchRecord(
+                bootstrap="test_bootstrap",
+                destination="test-destination-1",
+                arguments=("--name=Wrong Name", "--description=Test"),
+            ),
+            BuildBatchRecord(
+                bootstrap="test_bootstrap",
+                destination="test-destination-2",
+                arguments=("--description=Test",),
+            ),
+            BuildBatchRecord(
+                bootstrap="missed", destination="test-destination-2"
+            ),
+        ]
+        self.tst_obj.set_cli_namespace(namespace=Namespace(spec=records))
+
+        mock_stdout = io.StringIO()
+        with (
+            self.assertRaises(Exception) as err_ctx,
+            self.assertLogs(build_batch_module.__name__, level="WARNING"),
+            contextlib.redirect_stdout(mock_stdout),
+        ):
+            self.tst_obj.run()
+
+        assert err_ctx.exception.args == ("Building projects batch",)
+        output = mock_stdout.getvalue()
+        assert (
+            "failed: test_bootstrap -> test-destination-1: The name can only"
+            in output
+        )
+        assert "the following arguments are required: --name" in output
+        assert "Unknown bootstrap missed" in output
+        assert not Path("test-destination-1").exists()
+        assert not Path("test-destination-2").exists()
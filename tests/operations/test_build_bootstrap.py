@@ -2,13 +2,27 @@ import contextlib
 import io
 import os
 import shutil
+import sys
+import tarfile
 import typing as t
+import zipfile
 from argparse import Namespace
+from hashlib import file_digest
+from importlib import import_module
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
+from unittest.mock import patch
 
 import tests.tst_templates as tst_templates_module
+from py_bootstrap.files_processors import (
+    ArchivingFilesProcessor,
+    BuildManifest,
+    BuildPlan,
+    GenerateFilesProcessor,
+)
 from py_bootstrap.operations import BaseBuildBootstrapOperation
+from py_bootstrap.operations import build_bootstrap as build_bootstrap_module
 
 if t.TYPE_CHECKING:
     ...
@@ -66,6 +80,560 @@ class BaseBuildBootstrapOperationTestCase(TestCase):
             )
         )
 
+        phases = self.tst_obj.metrics.phases
+        assert phases["context_building"].calls == 1
+        assert phases["template_rendering"].calls == 1
+        assert phases["file_copying"].calls == 2
+        counters = self.tst_obj.metrics.counters
+        assert counters["files"] == 3
+        assert counters["bytes_written"] == sum(
+            path.stat().st_size
+            for path in destination_path.rglob("*")
+            if path.is_file()
+        )
+
+    def test_run_concurrently(self):
+        namespace = Namespace(
+            destination_dir="test-destination",
+            name="test-name",
+            description="Test project description",
+            jobs=4,
+        )
+        self.tst_obj.set_cli_namespace(namespace=namespace)
+        self.tst_obj.set_bootstrap_path(
+            path=self.templates_path / "test_bootstrap"
+        )
+
+        self.tst_obj.run()
+
+        destination_path = self.tst_obj.destination_path
+        assert os.path.isfile(
+            os.path.join(destination_path, "some-dir", "copied-file.txt")
+        )
+        assert os.path.isfile(
+            os.path.join(destination_path, "test_name", "generated-file.txt")
+        )
+        assert os.path.isfile(os.path.join(destination_path, "some-file.txt"))
+
+    def test_run_streaming(self):
+        namespace = Namespace(
+            destination_dir="test-destination",
+            name="test-name",
+            description="Test project description",
+        )
+        self.tst_obj.set_cli_namespace(namespace=namespace)
+        self.tst_obj.set_bootstrap_path(
+            path=self.templates_path / "test_bootstrap"
+        )
+
+        with patch.object(GenerateFilesProcessor, "streaming_threshold", 0):
+            self.tst_obj.run()
+
+        path = Path(
+            self.tst_obj.destination_path, "test_name", "generated-file.txt"
+        )
+        template_path = Path(
+            self.templates_path,
+            "test_bootstrap",
+            "{python_name}",
+            "generated-file.txt.tmpl",
+        )
+        assert path.read_text() == template_path.read_text().format(
+            **self.tst_obj.build_context()
+        )
+
+    def test_run_incremental(self):
+        namespace = Namespace(
+            destination_dir="test-destination",
+            name="test-name",
+            description="Test project description",
+            incremental=True,
+        )
+        self.tst_obj.set_cli_namespace(namespace=namespace)
+        self.tst_obj.set_bootstrap_path(
+            path=self.templates_path / "test_bootstrap"
+        )
+        self.tst_obj.run()
+
+        destination_path = self.tst_obj.destination_path
+        assert (destination_path / BuildManifest.file_name).is_file()
+
+        # the manifest is actual, files aren't read at all
+        with (
+            patch.object(
+                GenerateFilesProcessor, "write_file_if_changed"
+            ) as mock_write,
+            patch.object(
+                GenerateFilesProcessor, "copy_file_if_changed"
+            ) as mock_copy,
+        ):
+            tst_obj = self.tst_cls()
+            tst_obj.set_cli_namespace(namespace=namespace)
+            tst_obj.set_bootstrap_path(
+                path=self.templates_path / "test_bootstrap"
+            )
+            tst_obj.run()
+        mock_write.assert_not_called()
+        mock_copy.assert_not_called()
+        assert tst_obj.metrics.counters["files_up_to_date"] == 3
+
+        generated_path = destination_path / "test_name" / "generated-file.txt"
+        copied_path = destination_path / "some-file.txt"
+        os.utime(generated_path, ns=(0, 0))
+        os.utime(copied_path, ns=(0, 0))
+
+        # files are touched, but their content is the same
+        tst_obj = self.tst_cls()
+        tst_obj.set_cli_namespace(namespace=namespace)
+        tst_obj.set_bootstrap_path(path=self.templates_path / "test_bootstrap")
+        tst_obj.run()
+        assert generated_path.stat().st_mtime_ns == 0
+        assert copied_path.stat().st_mtime_ns == 0
+
+        # the generated file is changed, it's rewritten
+        generated_path.write_text("changed content")
+        tst_obj = self.tst_cls()
+        tst_obj.set_cli_namespace(namespace=namespace)
+        tst_obj.set_bootstrap_path(path=self.templates_path / "test_bootstrap")
+        tst_obj.run()
+        assert "name = test-name" in generated_path.read_text()
+        assert copied_path.stat().st_mtime_ns == 0
+
+    def test_run_incremental_big_template(self):
+        with TemporaryDirectory() as tmp_dir:
+            bootstrap_path = Path(tmp_dir, "bootstrap")
+            bootstrap_path.mkdir()
+            template = "name = {name}\n" * (
+                GenerateFilesProcessor.streaming_threshold // 10
+            )
+            (bootstrap_path / "big-file.txt.tmpl").write_text(template)
+            namespace = Namespace(
+                destination_dir=str(Path(tmp_dir, "project")),
+                name="test-name",
+                description="Test project description",
+                incremental=True,
+            )
+
+            def run() -> BaseBuildBootstrapOperation:
+                tst_obj = self.tst_cls()
+                tst_obj.set_cli_namespace(namespace=namespace)
+                tst_obj.set_bootstrap_path(path=bootstrap_path)
+                tst_obj.run()
+                return tst_obj
+
+            tst_obj = run()
+            generated_path = tst_obj.destination_path / "big-file.txt"
+            expected_content = template.format(name="test-name")
+            assert generated_path.stat().st_size > (
+                GenerateFilesProcessor.streaming_threshold
+            )
+            assert generated_path.read_text() == expected_content
+            assert tst_obj.metrics.counters["bytes_written"] == len(
+                expected_content
+            )
+
+            # the file is touched, it's streamed again but isn't rewritten
+            os.utime(generated_path, ns=(0, 0))
+            tst_obj = run()
+            assert generated_path.stat().st_mtime_ns == 0
+            assert tst_obj.metrics.counters["bytes_written"] == 0
+            assert not list(tst_obj.destination_path.glob(".big-file.txt.*"))
+
+            # the file is changed, it's rewritten
+            generated_path.write_text("changed content")
+            run()
+            assert generated_path.read_text() == expected_content
+
+    def test_run_plan_incremental(self):
+        namespace = Namespace(
+            destination_dir="test-destination",
+            name="test-name",
+            description="Test project description",
+            max_bytes=1024 * 1024,
+            incremental=True,
+        )
+        self.tst_obj.set_cli_namespace(namespace=namespace)
+        self.tst_obj.set_bootstrap_path(
+            path=self.templates_path / "test_bootstrap"
+        )
+        self.tst_obj.run()
+
+        destination_path = self.tst_obj.destination_path
+        assert (destination_path / BuildManifest.file_name).is_file()
+        assert "files_up_to_date" not in self.tst_obj.metrics.counters
+
+        # applied plans keep the manifest too
+        self.tst_obj._context = self.tst_obj.build_context()
+        plan = self.tst_obj.build_plan()
+        tst_obj = self.tst_cls()
+        tst_obj.set_cli_namespace(
+            namespace=Namespace(
+                destination_dir="test-destination", incremental=True
+            )
+        )
+        tst_obj.set_plan(value=BuildPlan.loads(plan.dumps()))
+        tst_obj.run()
+        assert tst_obj.metrics.counters["files_up_to_date"] == 3
+
+        generated_path = destination_path / "test_name" / "generated-file.txt"
+        generated_path.write_text("changed content")
+        tst_obj = self.tst_cls()
+        tst_obj.set_cli_namespace(namespace=namespace)
+        tst_obj.set_bootstrap_path(path=self.templates_path / "test_bootstrap")
+        tst_obj.run()
+        assert "name = test-name" in generated_path.read_text()
+        assert tst_obj.metrics.counters["files_up_to_date"] == 2
+
+    def run_staged(
+        self, destination_path: t.Optional["Path"]
+    ) -> BaseBuildBootstrapOperation:
+        tst_obj = self.tst_cls()
+        tst_obj.set_cli_namespace(
+            namespace=Namespace(
+                destination_dir=(
+                    "" if destination_path is None else str(destination_path)
+                ),
+                name="test-name",
+                description="Test project description",
+                staged=True,
+            )
+        )
+        tst_obj.set_bootstrap_path(path=self.templates_path / "test_bootstrap")
+        tst_obj.run()
+        return tst_obj
+
+    def test_run_staged(self):
+        with TemporaryDirectory() as tmp_dir:
+            destination_path = Path(tmp_dir, "project")
+            with patch.object(
+                build_bootstrap_module.os,
+                "rename",
+                side_effect=build_bootstrap_module.os.rename,
+            ) as mock_rename:
+                tst_obj = self.run_staged(destination_path=destination_path)
+
+            # the whole tree is published by one rename
+            mock_rename.assert_called_once()
+            assert sorted(
+                path.relative_to(destination_path).as_posix()
+                for path in destination_path.rglob("*")
+            ) == [
+                "some-dir",
+                "some-dir/copied-file.txt",
+                "some-file.txt",
+                "test_name",
+                "test_name/generated-file.txt",
+            ]
+            assert os.listdir(tmp_dir) == ["project"]
+            # a mkdtemp directory is private, the published one isn't
+            sibling_path = Path(tmp_dir, "sibling")
+            sibling_path.mkdir()
+            assert destination_path.stat().st_mode & 0o777 == (
+                sibling_path.stat().st_mode & 0o777
+            )
+            assert tst_obj.metrics.phases["publishing"].calls == 1
+
+    def test_run_staged_merging(self):
+        with TemporaryDirectory() as tmp_dir:
+            destination_path = Path(tmp_dir, "project")
+            (destination_path / "test_name").mkdir(parents=True)
+            (destination_path / "own-file.txt").write_text("own content")
+            generated_path = (
+                destination_path / "test_name" / "generated-file.txt"
+            )
+            generated_path.write_text("previous content")
+
+            self.run_staged(destination_path=destination_path)
+
+            assert (destination_path / "own-file.txt").read_text() == (
+                "own content"
+            )
+            assert "name = test-name" in generated_path.read_text()
+            assert (destination_path / "some-dir" / "copied-file.txt").is_file()
+            assert os.listdir(tmp_dir) == ["project"]
+
+    def test_run_staged_empty_destination(self):
+        with TemporaryDirectory() as tmp_dir:
+            destination_path = Path(tmp_dir, "project")
+            destination_path.mkdir()
+            inode = destination_path.stat().st_ino
+
+            with patch.object(
+                build_bootstrap_module.os,
+                "rename",
+                side_effect=build_bootstrap_module.os.rename,
+            ) as mock_rename:
+                self.run_staged(destination_path=destination_path)
+
+            # an existing directory is kept, files are merged into it
+            mock_rename.assert_not_called()
+            assert destination_path.stat().st_ino == inode
+            assert (destination_path / "some-dir" / "copied-file.txt").is_file()
+            assert os.listdir(tmp_dir) == ["project"]
+
+    def test_run_staged_current_directory(self):
+        cwd = os.getcwd()
+        with TemporaryDirectory() as tmp_dir:
+            destination_path = Path(tmp_dir, "project")
+            destination_path.mkdir()
+            inode = destination_path.stat().st_ino
+            os.chdir(destination_path)
+            try:
+                self.run_staged(destination_path=None)
+                assert os.getcwd() == str(destination_path)
+            finally:
+                os.chdir(cwd)
+
+            assert destination_path.stat().st_ino == inode
+            assert (
+                destination_path / "test_name" / "generated-file.txt"
+            ).is_file()
+            assert os.listdir(tmp_dir) == ["project"]
+
+    def test_run_staged_failure(self):
+        with TemporaryDirectory() as tmp_dir:
+            destination_path = Path(tmp_dir, "project")
+            destination_path.mkdir()
+            (destination_path / "own-file.txt").write_text("own content")
+
+            original_process_file = GenerateFilesProcessor.process_file
+
+            def process_file(processor, rel_path, file_name):
+                if file_name == "some-file.txt":
+                    raise OSError("Test processing error")
+                original_process_file(processor, rel_path, file_name)
+
+            with (
+                patch.object(
+                    GenerateFilesProcessor,
+                    "process_file",
+                    autospec=True,
+                    side_effect=process_file,
+                ),
+                self.assertLogs(build_bootstrap_module.__name__, "ERROR"),
+                self.assertLogs("py_bootstrap.files_processors.base", "ERROR"),
+                self.assertRaises(Exception),
+            ):
+                self.run_staged(destination_path=destination_path)
+
+            # partly generated files are removed with the staging directory
+            assert os.listdir(tmp_dir) == ["project"]
+            assert os.listdir(destination_path) == ["own-file.txt"]
+
+    def run_archive(self, **kwargs: t.Any) -> BaseBuildBootstrapOperation:
+        tst_obj = self.tst_cls()
+        tst_obj.set_cli_namespace(
+            namespace=Namespace(
+                destination_dir="test-destination",
+                name="test-name",
+                description="Test project description",
+                **kwargs,
+            )
+        )
+        tst_obj.set_bootstrap_path(path=self.templates_path / "test_bootstrap")
+        tst_obj.run()
+        return tst_obj
+
+    def test_run_archive(self):
+        with TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir, "project.tar")
+            tst_obj = self.run_archive(
+                archive_format="tar", archive_output=str(output_path)
+            )
+
+            assert not os.path.exists(tst_obj.destination_path)
+            assert os.listdir(tmp_dir) == ["project.tar"]
+            with tarfile.open(output_path) as tar:
+                assert tar.getnames() == [
+                    "some-dir",
+                    "some-dir/copied-file.txt",
+                    "some-file.txt",
+                    "test_name",
+                    "test_name/generated-file.txt",
+                ]
+
+    def test_run_archive_stdout(self):
+        mock_stdout = io.TextIOWrapper(io.BytesIO())
+        with contextlib.redirect_stdout(mock_stdout):
+            self.run_archive(archive_format="zip", archive_output="-")
+        data = t.cast(io.BytesIO, mock_stdout.buffer).getvalue()
+
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert "test_name/generated-file.txt" in archive.namelist()
+
+        # archives of planned builds are the same
+        mock_stdout = io.TextIOWrapper(io.BytesIO())
+        with contextlib.redirect_stdout(mock_stdout):
+            self.run_archive(
+                archive_format="zip", archive_output="-", max_bytes=1024**2
+            )
+        assert t.cast(io.BytesIO, mock_stdout.buffer).getvalue() == data
+
+    def test_run_archive_failure(self):
+        with (
+            TemporaryDirectory() as tmp_dir,
+            patch.object(
+                ArchivingFilesProcessor,
+                "archive_template_file",
+                side_effect=OSError("Test archiving error"),
+            ),
+            self.assertLogs(build_bootstrap_module.__name__, "ERROR"),
+            self.assertLogs("py_bootstrap.files_processors.archiving", "ERROR"),
+            self.assertRaises(Exception),
+        ):
+            try:
+                self.run_archive(
+                    archive_format="tar.gz",
+                    archive_output=str(Path(tmp_dir, "project.tar.gz")),
+                )
+            finally:
+                # an incomplete archive doesn't appear
+                assert os.listdir(tmp_dir) == []
+
+    def test_run_output_without_format(self):
+        with (
+            self.assertLogs(build_bootstrap_module.__name__, "ERROR"),
+            self.assertRaises(Exception),
+        ):
+            self.run_archive(archive_output="project.tar")
+
+    def test_run_dry_run(self):
+        namespace = Namespace(
+            destination_dir="test-destination",
+            name="test-name",
+            description="Test project description",
+            dry_run=True,
+        )
+        self.tst_obj.set_cli_namespace(namespace=namespace)
+        self.tst_obj.set_bootstrap_path(
+            path=self.templates_path / "test_bootstrap"
+        )
+
+        mock_stdout = io.StringIO()
+        with contextlib.redirect_stdout(mock_stdout):
+            self.tst_obj.run()
+
+        assert not os.path.exists(self.tst_obj.destination_path)
+        plan = BuildPlan.loads(mock_stdout.getvalue())
+        assert plan.context == self.tst_obj.build_context()
+        assert sorted(
+            (entry.action, entry.destination, entry.source)
+            for entry in plan.entries
+        ) == [
+            ("copy", "some-dir/copied-file.txt", "some-dir/copied-file.txt"),
+            ("copy", "some-file.txt", "some-file.txt"),
+            ("mkdir", "some-dir", None),
+            ("mkdir", "test_name", None),
+            (
+                "render",
+                "test_name/generated-file.txt",
+                "{python_name}/generated-file.txt.tmpl",
+            ),
+        ]
+
+    def test_run_plan(self):
+        namespace = Namespace(
+            destination_dir="test-destination",
+            name="test-name",
+            description="Test project description",
+            dry_run=True,
+        )
+        self.tst_obj.set_cli_namespace(namespace=namespace)
+        self.tst_obj.set_bootstrap_path(
+            path=self.templates_path / "test_bootstrap"
+        )
+        self.tst_obj._context = self.tst_obj.build_context()
+        plan = self.tst_obj.build_plan()
+
+        tst_obj = self.tst_cls()
+        tst_obj.set_cli_namespace(
+            namespace=Namespace(destination_dir="test-destination", jobs=2)
+        )
+        tst_obj.set_plan(value=BuildPlan.loads(plan.dumps()))
+        tst_obj.run()
+
+        for entry in plan.entries:
+            path = tst_obj.destination_path / entry.destination
+            if entry.action == "mkdir":
+                assert path.is_dir()
+                continue
+            with path.open("rb") as file:
+                assert file_digest(file, "sha256").hexdigest() == entry.hash
+            assert path.stat().st_size == entry.size
+
+    def test_run_max_bytes(self):
+        namespace = Namespace(
+            destination_dir="test-destination",
+            name="test-name",
+            description="Test project description",
+            max_bytes=10,
+        )
+        self.tst_obj.set_cli_namespace(namespace=namespace)
+        self.tst_obj.set_bootstrap_path(
+            path=self.templates_path / "test_bootstrap"
+        )
+
+        with (
+            self.assertRaises(Exception) as err_ctx,
+            self.assertLogs(build_bootstrap_module.__name__, level="ERROR"),
+        ):
+            self.tst_obj.run()
+
+        assert err_ctx.exception.args == ("Build plan is too big",)
+        assert not os.path.exists(self.tst_obj.destination_path)
+
+    def test_run_zipimported(self):
+        with TemporaryDirectory() as tmp_dir:
+            zip_path = Path(tmp_dir, "bootstraps.zip")
+            source_path = self.templates_path / "test_bootstrap"
+            with zipfile.ZipFile(zip_path, "w") as zip_file:
+                zip_file.writestr("tst_zipped_templates/__init__.py", "")
+                # zipimport finds namespace packages by directories entries
+                zip_file.write(
+                    source_path, arcname="tst_zipped_templates/test_bootstrap"
+                )
+                for path in source_path.rglob("*"):
+                    zip_file.write(
+                        path,
+                        arcname=Path(
+                            "tst_zipped_templates/test_bootstrap",
+                            path.relative_to(source_path),
+                        ).as_posix(),
+                    )
+
+            sys.path.insert(0, str(zip_path))
+            try:
+                module = import_module(
+                    "tst_zipped_templates.test_bootstrap.__entry_point__"
+                )
+                bootstrap_path = self.tst_cls.find_bootstrap_path(module)
+                assert isinstance(bootstrap_path, zipfile.Path)
+
+                namespace = Namespace(
+                    destination_dir="test-destination",
+                    name="test-name",
+                    description="Test project description",
+                )
+                self.tst_obj.set_cli_namespace(namespace=namespace)
+                self.tst_obj.set_bootstrap_path(path=bootstrap_path)
+                self.tst_obj.run()
+            finally:
+                sys.path.remove(str(zip_path))
+                for name in list(sys.modules):
+                    if name.startswith("tst_zipped_templates"):
+                        del sys.modules[name]
+
+        destination_path = self.tst_obj.destination_path
+        assert os.path.isfile(
+            os.path.join(destination_path, "some-dir", "copied-file.txt")
+        )
+        assert os.path.isfile(
+            os.path.join(destination_path, "test_name", "generated-file.txt")
+        )
+        assert not os.path.exists(
+            os.path.join(destination_path, "__entry_point__.py")
+        )
+
     def test_run_on_existed_directory(self):
         namespace = Namespace(
             destination_dir="test-destination",
@@ -0,0 +1,30 @@
+import typing as t
+from argparse import Namespace
+from unittest import TestCase
+
+from py_bootstrap.operations.dispatcher import BootstrapsDispatcher
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class BootstrapsDispatcherTestCase(TestCase):
+    tst_cls = BootstrapsDispatcher
+
+    def test_operations_descriptions(self):
+        assert list(self.tst_cls.operations_descriptions) == list(
+            self.tst_cls.operations_classes_paths
+        )
+        for name, description in self.tst_cls.operations_descriptions.items():
+            with self.subTest(name=name):
+                operation_cls = self.tst_cls.get_operation_cls(name=name)
+                assert operation_cls.cli_description == description
+
+    def test_run_unknown_operation(self):
+        tst_obj = self.tst_cls()
+        tst_obj.set_cli_namespace(namespace=Namespace(operation="test"))
+        with (
+            self.assertRaises(ValueError),
+            self.assertLogs("py_bootstrap.operations.dispatcher"),
+        ):
+            tst_obj.run()
@@ -9,6 +9,7 @@ from unittest import TestCase
 
 import tests.tst_templates as tst_templates_module
 from py_bootstrap.operations import BaseExportBootstrapOperation
+from py_bootstrap.operations import export_bootstrap as export_bootstrap_module
 
 if t.TYPE_CHECKING:
     ...
@@ -68,6 +69,33 @@ class BaseExportBootstrapOperationTestCase(TestCase):
             )
         )
 
+    def test_run_link_modes(self):
+        source_path = self.templates_path / "test_bootstrap" / "some-file.txt"
+        for link_mode in ("hardlink", "symlink", "reflink", "copy"):
+            namespace = Namespace(
+                destination_dir="test-destination", link_mode=link_mode
+            )
+            tst_obj = self.tst_cls()
+            tst_obj.set_cli_namespace(namespace=namespace)
+            tst_obj.set_bootstrap_path(
+                path=self.templates_path / "test_bootstrap"
+            )
+            is_sharing = link_mode in ("hardlink", "symlink")
+            logs_ctx = (
+                self.assertLogs(export_bootstrap_module.__name__, "WARNING")
+                if is_sharing
+                else self.assertNoLogs(
+                    export_bootstrap_module.__name__, "WARNING"
+                )
+            )
+            with logs_ctx:
+                tst_obj.run()
+
+            path = tst_obj.destination_path / "some-file.txt"
+            assert path.read_bytes() == source_path.read_bytes()
+            assert path.is_symlink() == (link_mode == "symlink")
+            assert path.samefile(source_path) == is_sharing
+
     def test_run_on_existed_directory(self):
         namespace = Namespace(
             destination_dir="test-destination",
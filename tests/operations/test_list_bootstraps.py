@@ -7,7 +7,6 @@ from unittest import TestCase
 from unittest.mock import Mock, patch
 
 import tests.tst_templates as tst_package
-from py_bootstrap.operations import base as base_module
 from py_bootstrap.operations.list_bootstraps import ListBootstrapsOperation
 
 if t.TYPE_CHECKING:
@@ -34,7 +33,7 @@ class ListBootstrapsOperationTestCase(TestCase):
             ]
         )
         with (
-            patch.object(base_module, "entry_points", mock_entry_point),
+            patch("importlib.metadata.entry_points", mock_entry_point),
             contextlib.redirect_stdout(mock_stdout),
         ):
             self.tst_obj.run()
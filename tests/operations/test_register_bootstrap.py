@@ -9,6 +9,7 @@ from unittest import TestCase
 from unittest.mock import Mock, patch
 
 import tests as tst_package
+from py_bootstrap.files_processors import BootstrapArchive
 from py_bootstrap.operations.register_bootstrap import (
     RegisterBootstrapOperation,
 )
@@ -29,6 +30,7 @@ class RegisterBootstrapOperationTestCase(TestCase):
 
     def tearDown(self):
         shutil.rmtree(self.tst_obj.bootstrap_path, ignore_errors=True)
+        self.tst_obj.archive_path.unlink(missing_ok=True)
 
     def test_run(self):
         source_path = self.source_path / "tst_templates/test_bootstrap"
@@ -70,6 +72,21 @@ class RegisterBootstrapOperationTestCase(TestCase):
             )
         )
 
+    def test_run_invalidates_bootstraps_registry(self):
+        source_path = self.source_path / "tst_templates/test_bootstrap"
+        namespace = Namespace(
+            source_path=source_path,
+            bootstrap_name="test_bootstrap_copy",
+            upload_confirmation=True,
+        )
+        self.tst_obj.set_cli_namespace(namespace=namespace)
+        mock_registry = Mock()
+        self.tst_obj.set_bootstraps_registry(registry=mock_registry)
+
+        self.tst_obj.run()
+
+        mock_registry.invalidate.assert_called_once_with()
+
     def test_run_override(self):
         source_path = self.source_path / "tst_templates/test_bootstrap"
         namespace = Namespace(
@@ -91,6 +108,42 @@ class RegisterBootstrapOperationTestCase(TestCase):
             os.path.join(destination_path, "some-old--file.txt")
         )
 
+    def test_run_archive(self):
+        source_path = self.source_path / "tst_templates/test_bootstrap"
+        namespace = Namespace(
+            source_path=source_path,
+            bootstrap_name="test_bootstrap_copy",
+            upload_confirmation=True,
+            archive=True,
+        )
+        self.tst_obj.set_cli_namespace(namespace=namespace)
+        os.makedirs(self.tst_obj.bootstrap_path, exist_ok=True)
+
+        self.tst_obj.run()
+
+        assert not os.path.exists(self.tst_obj.bootstrap_path)
+        archive = BootstrapArchive()
+        archive.set_path(path=self.tst_obj.archive_path)
+        archive.load()
+        try:
+            assert sorted(entry.path for entry in archive.entries) == [
+                f"{self.tst_obj.entry_point_module_name}.py",
+                "some-dir/copied-file.txt",
+                "some-file.txt",
+                "{python_name}/generated-file.txt.tmpl",
+            ]
+        finally:
+            archive.close()
+
+        # registering a directory replaces the archive
+        namespace.archive = False
+        tst_obj = self.tst_cls()
+        tst_obj.set_cli_namespace(namespace=namespace)
+        tst_obj.run()
+
+        assert os.path.isdir(tst_obj.bootstrap_path)
+        assert not os.path.exists(tst_obj.archive_path)
+
     def test_run_interactive_no(self):
         source_path = self.source_path / "tst_templates/test_bootstrap"
         namespace = Namespace(
@@ -0,0 +1,509 @@
+import io
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import typing as t
+import zipfile
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from pathlib import Path
+from socketserver import ForkingUnixStreamServer
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from py_bootstrap.base import serving
+from py_bootstrap.base.operations import LazySubParsersAction
+from py_bootstrap.files_processors import (
+    BootstrapArchive,
+    GenerateFilesProcessor,
+    PackFilesProcessor,
+)
+from py_bootstrap.operations.base import BaseBootstrapsOperation
+from py_bootstrap.operations.bootstraps_index import BootstrapsIndexEntry
+from py_bootstrap.operations.dispatcher import BootstrapsDispatcher
+from py_bootstrap.operations.serve import ServeBootstrapsOperation
+from py_bootstrap.operations.serve_server import (
+    BootstrapsRequestHandler,
+    BootstrapsServer,
+)
+
+if t.TYPE_CHECKING:
+    ...
+
+
+class ServeBootstrapsOperationTestCase(TestCase):
+    tst_cls = ServeBootstrapsOperation
+    tst_obj: ServeBootstrapsOperation
+
+    entries = [
+        BootstrapsIndexEntry(
+            name="test_bootstrap",
+            import_path="tests.tst_templates.test_bootstrap.__entry_point__",
+            path="tests/tst_templates/test_bootstrap",
+            description="Test bootstrap template",
+            build_cli_description="Generates a test skeleton",
+        ),
+    ]
+
+    def setUp(self):
+        self.tst_obj = self.tst_cls()
+        self.tst_obj.set_dispatcher_cls(value=BootstrapsDispatcher)
+
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+
+        self.find_patcher = patch.object(
+            BaseBootstrapsOperation,
+            "find_bootstraps_entries",
+            return_value=self.entries,
+        )
+        self.mock_find = self.find_patcher.start()
+        self.fingerprint_patcher = patch.object(
+            self.tst_cls,
+            "compute_bootstraps_fingerprint",
+            return_value="test-fingerprint",
+        )
+        self.mock_fingerprint = self.fingerprint_patcher.start()
+
+    def tearDown(self):
+        self.fingerprint_patcher.stop()
+        self.find_patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def handle_request(
+        self, cli_args: list[str], line: t.Optional[bytes] = None
+    ) -> tuple[str, str, int]:
+        if line is None:
+            line = serving.dump_request(cli_args=cli_args, cwd=os.getcwd())
+        client_socket, server_socket = socket.socketpair()
+        with (
+            client_socket,
+            server_socket,
+            # the request replaces output streams of a forked child
+            patch.object(sys, "stdout", sys.stdout),
+            patch.object(sys, "stderr", sys.stderr),
+        ):
+            client_socket.sendall(line)
+            BootstrapsRequestHandler(
+                server_socket, "", Mock(operation=self.tst_obj)
+            )
+            server_socket.shutdown(socket.SHUT_WR)
+
+            outputs = {serving.STDOUT_FRAME: b"", serving.STDERR_FRAME: b""}
+            with client_socket.makefile("rb") as rfile:
+                while (frame := serving.read_frame(rfile)) is not None:
+                    kind, value, data = frame
+                    if kind == serving.EXIT_FRAME:
+                        return (
+                            outputs[serving.STDOUT_FRAME].decode(),
+                            outputs[serving.STDERR_FRAME].decode(),
+                            value,
+                        )
+                    outputs[kind] += data
+        raise AssertionError("No exit frame")
+
+    def test_prepare_cli_parser(self):
+        parser = ArgumentParser()
+        with patch.dict(os.environ, {serving.SOCKET_ENV_NAME: "test.sock"}):
+            self.tst_cls.prepare_cli_parser(parser=parser)
+        namespace = parser.parse_args(["--workers=2"])
+        assert namespace.socket_path == "test.sock"
+        assert namespace.workers == 2
+
+        parser = ArgumentParser()
+        with patch.dict(os.environ, {serving.SOCKET_ENV_NAME: ""}):
+            self.tst_cls.prepare_cli_parser(parser=parser)
+        with self.assertRaises(SystemExit), patch("sys.stderr", io.StringIO()):
+            parser.parse_args([])
+
+    def test_validate_cli_argument_workers(self):
+        assert self.tst_cls.validate_cli_argument_workers("3") == 3
+        for value in ("0", "-1", "test"):
+            with self.assertRaises(ArgumentTypeError):
+                self.tst_cls.validate_cli_argument_workers(value)
+
+    def test_warm_up(self):
+        with patch.object(
+            self.tst_cls, "warm_up_templates_cache", autospec=True
+        ) as mock_warm_up_templates:
+            self.tst_obj.warm_up()
+
+        mock_warm_up_templates.assert_called_once()
+        bootstrap_paths = mock_warm_up_templates.call_args.kwargs[
+            "bootstrap_paths"
+        ]
+        assert [path.name for path in bootstrap_paths] == ["test_bootstrap"]
+        assert (
+            "tests.tst_templates.test_bootstrap.__entry_point__" in sys.modules
+        )
+        assert self.tst_obj.metrics.phases["warming_up"].calls == 1
+
+        # parsers of bootstraps are prepared before forking
+        with patch.object(self.tst_obj.bootstraps_registry, "get_module") as m:
+            namespace = self.tst_obj.cli_parser.parse_args(
+                [
+                    "build",
+                    "test_bootstrap",
+                    "--name=test-name",
+                    "--description=Test description",
+                ]
+            )
+        m.assert_not_called()
+        assert namespace.name == "test-name"
+
+    def test_warm_up_failed_importing(self):
+        entry = BootstrapsIndexEntry(
+            name="test_missed", import_path="tests.tst_missed", path=""
+        )
+        with (
+            patch.object(
+                BaseBootstrapsOperation,
+                "find_bootstraps_entries",
+                return_value=[*self.entries, entry],
+            ),
+            patch.object(
+                self.tst_cls, "warm_up_templates_cache", autospec=True
+            ) as mock_warm_up_templates,
+            self.assertLogs("py_bootstrap.operations.serve", level="ERROR"),
+        ):
+            self.tst_obj.warm_up()
+
+        bootstrap_paths = mock_warm_up_templates.call_args.kwargs[
+            "bootstrap_paths"
+        ]
+        assert [path.name for path in bootstrap_paths] == ["test_bootstrap"]
+
+    def test_warm_up_templates_cache(self):
+        bootstrap_path = self.tmp_path / "test_bootstrap"
+        bootstrap_path.mkdir()
+        (bootstrap_path / "file.txt.tmpl").write_text("name = {name}")
+        (bootstrap_path / "broken.txt.tmpl").write_text("name = {name")
+        (bootstrap_path / "big.txt.tmpl").write_text("name = {name}" * 10)
+        (bootstrap_path / "file.txt").write_text("test content")
+        archive_path = self.tmp_path / "test_packed.pybootstrap"
+        processor = PackFilesProcessor()
+        processor.set_source_path(source_path=bootstrap_path)
+        processor.set_destination_path(destination_path=archive_path)
+        processor.run()
+        zip_path = self.tmp_path / "test_zipped.zip"
+        with zipfile.ZipFile(zip_path, "w") as zip_file:
+            zip_file.writestr("test_bootstrap/file.txt.tmpl", "name = {name}")
+
+        templates_cache = self.tst_obj.templates_cache
+        with (
+            patch.object(GenerateFilesProcessor, "streaming_threshold", 100),
+            patch.object(
+                templates_cache, "get", wraps=templates_cache.get
+            ) as mock_get,
+            patch.object(
+                templates_cache,
+                "get_or_compile",
+                wraps=templates_cache.get_or_compile,
+            ) as mock_get_or_compile,
+        ):
+            self.tst_obj.warm_up_templates_cache(
+                bootstrap_paths=[
+                    bootstrap_path,
+                    archive_path,
+                    # templates of zipped bootstraps are compiled on building
+                    zipfile.Path(zip_path, "test_bootstrap/"),
+                ]
+            )
+
+        # big templates are streamed without caching, broken ones are
+        # reported on building
+        assert sorted(
+            call.kwargs["path"].name for call in mock_get.call_args_list
+        ) == ["broken.txt.tmpl", "file.txt.tmpl"]
+        archive = BootstrapArchive()
+        archive.set_path(path=archive_path)
+        archive.load()
+        archive.close()
+        archived_hashes = {
+            entry.hash
+            for entry in archive.entries
+            if entry.is_template and entry.path != "big.txt.tmpl"
+        }
+        assert len(archived_hashes) == 2
+        assert archived_hashes <= {
+            call.kwargs["content_hash"]
+            for call in mock_get_or_compile.call_args_list
+        }
+        template = templates_cache.get(path=bootstrap_path / "file.txt.tmpl")
+        assert template.render(context={"name": "test"}) == "name = test"
+
+    def test_compute_bootstraps_fingerprint(self):
+        self.fingerprint_patcher.stop()
+        try:
+            fingerprint = self.tst_obj.compute_bootstraps_fingerprint()
+            assert fingerprint == self.tst_obj.compute_bootstraps_fingerprint()
+        finally:
+            self.fingerprint_patcher.start()
+
+    def test_build_served_cli_parser_failure(self):
+        with (
+            patch.object(
+                LazySubParsersAction,
+                "prepare_lazy_parsers",
+                side_effect=ValueError("test failure"),
+            ),
+            self.assertLogs("py_bootstrap.operations.serve", level="ERROR"),
+        ):
+            parser = self.tst_obj.build_served_cli_parser()
+
+        # the rest parsers are prepared on parsing requests
+        namespace = parser.parse_args(["list"])
+        assert namespace.operation == "list"
+
+    def test_run(self):
+        socket_path = self.tmp_path / "test.sock"
+        self.tst_obj.set_cli_namespace(
+            namespace=Namespace(socket_path=str(socket_path), workers=2)
+        )
+
+        def serve_forever(server):
+            assert server.max_children == 2
+            assert server.operation is self.tst_obj
+            assert socket_path.is_socket()
+            # service managers stop servers by SIGTERM
+            signal.raise_signal(signal.SIGTERM)
+
+        termination_handler = signal.getsignal(signal.SIGTERM)
+        with (
+            patch.object(
+                BootstrapsServer,
+                "serve_forever",
+                autospec=True,
+                side_effect=serve_forever,
+            ) as mock_serve_forever,
+            self.assertLogs("py_bootstrap.operations.serve") as logs_ctx,
+        ):
+            self.tst_obj.run()
+
+        mock_serve_forever.assert_called_once()
+        assert "serving is stopped" in logs_ctx.output[-1]
+        assert signal.getsignal(signal.SIGTERM) == termination_handler
+        assert not socket_path.exists()
+
+    def test_refresh(self):
+        self.tst_obj.warm_up()
+        with (
+            patch.object(self.tst_obj, "warm_up") as mock_warm_up,
+            patch.object(
+                self.tst_obj.bootstraps_registry, "invalidate"
+            ) as mock_invalidate,
+        ):
+            self.tst_obj.refresh()
+            mock_warm_up.assert_not_called()
+
+            self.mock_fingerprint.return_value = "test-changed-fingerprint"
+            self.tst_obj.refresh()
+            mock_invalidate.assert_called_once()
+            mock_warm_up.assert_called_once()
+
+    def test_handle_request(self):
+        self.tst_obj.warm_up()
+        output, errors, status = self.handle_request(cli_args=["list"])
+        assert "test_bootstrap" in output
+        assert errors == ""
+        assert status == 0
+
+        destination_path = self.tmp_path / "test-destination"
+        output, errors, status = self.handle_request(
+            cli_args=[
+                "build",
+                f"--dest={destination_path}",
+                "test_bootstrap",
+                "--name=test-name",
+                "--description=Test description",
+                f"--metrics-json={self.tmp_path / 'metrics.json'}",
+            ]
+        )
+        assert status == 0
+        generated_path = destination_path / "test_name" / "generated-file.txt"
+        assert "name = test-name" in generated_path.read_text()
+        assert (self.tmp_path / "metrics.json").exists()
+
+    def test_handle_request_errors(self):
+        self.tst_obj.warm_up()
+        output, errors, status = self.handle_request(
+            cli_args=["build", "test_bootstrap"]
+        )
+        assert "the following arguments are required: --name" in errors
+        assert status == 2
+
+        output, errors, status = self.handle_request(cli_args=["register"])
+        assert "operation isn't served" in errors
+        assert status == 2
+
+        output, errors, status = self.handle_request(
+            cli_args=[], line=b"test\n"
+        )
+        assert "Invalid request" in errors
+        assert status == 2
+
+        with patch.object(
+            BootstrapsDispatcher, "run", side_effect=ValueError("test failure")
+        ):
+            output, errors, status = self.handle_request(cli_args=["list"])
+        assert "ValueError: test failure" in errors
+        assert status == 1
+
+    def test_handle_disconnected_request(self):
+        client_socket, server_socket = socket.socketpair()
+        with client_socket, server_socket:
+            client_socket.shutdown(socket.SHUT_WR)
+            BootstrapsRequestHandler(
+                server_socket, "", Mock(operation=self.tst_obj)
+            )
+            server_socket.shutdown(socket.SHUT_WR)
+            assert client_socket.recv(1) == b""
+
+    def test_get_exit_status(self):
+        assert self.tst_cls.get_exit_status(SystemExit()) == 0
+        assert self.tst_cls.get_exit_status(SystemExit(2)) == 2
+        with patch("sys.stderr", io.StringIO()) as mock_stderr:
+            assert self.tst_cls.get_exit_status(SystemExit("test")) == 1
+        assert mock_stderr.getvalue() == "test\n"
+
+
+class BootstrapsServerTestCase(TestCase):
+    tst_cls = BootstrapsServer
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        self.socket_path = self.tmp_path / "test.sock"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_listen(self):
+        # a socket of a killed server
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(self.socket_path))
+        stale.close()
+
+        server = self.tst_cls.listen(path=self.socket_path)
+        try:
+            assert self.socket_path.stat().st_mode & 0o777 == 0o600
+            with (
+                self.assertRaises(Exception),
+                self.assertLogs("py_bootstrap.operations.serve_server"),
+            ):
+                self.tst_cls.listen(path=self.socket_path)
+        finally:
+            server.server_close()
+
+    def test_listen_umask(self):
+        umasks = []
+
+        def server_bind(server):
+            # the socket is created private, it's never accessible by others
+            umasks.append(os.umask(0o022))
+            os.umask(umasks[-1])
+            socket.socket.bind(server.socket, server.server_address)
+
+        umask = os.umask(0o022)
+        try:
+            with patch.object(
+                ForkingUnixStreamServer,
+                "server_bind",
+                autospec=True,
+                side_effect=server_bind,
+            ):
+                server = self.tst_cls.listen(path=self.socket_path)
+            server.server_close()
+            assert os.umask(0o022) == 0o022
+        finally:
+            os.umask(umask)
+        assert umasks == [0o177]
+
+    def test_process_request(self):
+        server = self.tst_cls.listen(path=self.socket_path)
+        try:
+            server.set_operation(
+                value=Mock(refresh=Mock(side_effect=ValueError("test")))
+            )
+            with (
+                patch.object(
+                    ForkingUnixStreamServer, "process_request"
+                ) as mock_process_request,
+                self.assertLogs(
+                    "py_bootstrap.operations.serve_server", level="ERROR"
+                ) as logs_ctx,
+            ):
+                # a request is served with caches which weren't refreshed
+                server.process_request("test-request", "")
+                server.handle_error("test-request", "")
+        finally:
+            server.server_close()
+
+        mock_process_request.assert_called_once_with("test-request", "")
+        assert "caches refreshing failed" in logs_ctx.output[0]
+        assert "request serving failed" in logs_ctx.output[1]
+
+    def test_serve(self):
+        env = dict(os.environ, PYTHONPATH=os.getcwd())
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "py_bootstrap.scripts.bootstrap",
+                "serve",
+                f"--socket={self.socket_path}",
+                "--workers=2",
+            ],
+            env=env,
+        )
+        try:
+            deadline = time.monotonic() + 30
+            while not self.socket_path.is_socket():
+                assert process.poll() is None
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+
+            destination_path = self.tmp_path / "test-destination"
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "py_bootstrap.scripts.client",
+                    "build",
+                    f"--dest={destination_path}",
+                    "application",
+                    "--name=test-name",
+                    "--description=Test description",
+                ],
+                env=dict(
+                    env, **{serving.SOCKET_ENV_NAME: str(self.socket_path)}
+                ),
+                capture_output=True,
+            )
+            assert result.returncode == 0, result.stderr
+            assert b"isn't served" not in result.stderr
+            assert (destination_path / "pyproject.toml").exists()
+
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "py_bootstrap.scripts.client",
+                    "build",
+                    "application",
+                ],
+                env=dict(
+                    env, **{serving.SOCKET_ENV_NAME: str(self.socket_path)}
+                ),
+                capture_output=True,
+            )
+            assert result.returncode == 2
+            assert b"the following arguments are required" in result.stderr
+        finally:
+            process.terminate()
+            process.wait()
+        # the socket is removed on termination
+        assert not self.socket_path.exists()
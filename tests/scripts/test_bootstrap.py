@@ -1,14 +1,17 @@
 import contextlib
 import io
+import json
 import shutil
 import typing as t
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
+from py_bootstrap.operations.base import BaseBootstrapsOperation
 from py_bootstrap.operations.register_bootstrap import (
     RegisterBootstrapOperation,
 )
-from py_bootstrap.scripts.bootstrap import main
+from py_bootstrap.scripts.bootstrap import BootstrapsRunner, main
 
 if t.TYPE_CHECKING:
     ...
@@ -30,23 +33,27 @@ class MainTestCase(TestCase):
 
         output = mock_stdout.getvalue()
         """
-        usage: bootstrap [-h] {list,build,export,register} ...
+        usage: bootstrap [-h] {list,build,build-batch,export,register,serve} ...
         Bootstrapping Python projects management tool.
         options:
           -h, --help            show this help message and exit
         Bootstraps management operations:
-          {list,build,export,register}
+          {list,build,build-batch,export,register,serve}
             list                Finds and prints the list of available bootstraps with
                                 brief description.
             build               Generates a skeleton of something from given
                                 bootstrap.
+            build-batch         Generates skeletons of many projects from a spec
+                                file.
             export              Exports a bootstrap by given name.
             register            Registers a new bootstrap.
+            serve               Serves build, export and list requests over a
+                                Unix domain socket.
         """
         assert "usage: bootstrap [-h]" in output
         assert "Bootstrapping Python projects management tool" in output
         assert "Bootstraps management operations" in output
-        assert "{list,build,export,register}" in output
+        assert "{list,build,build-batch,export,register,serve}" in output
 
     def test_list_bootstraps_help(self):
         mock_stdout = io.StringIO()
@@ -108,6 +115,10 @@ class MainTestCase(TestCase):
             "Generates a skeleton of something from given bootstrap" in output
         )
         assert "--dest DESTINATION_DIR" in output
+        assert "--jobs JOBS" in output
+        assert "--dry-run" in output
+        assert "--apply-plan PLAN_PATH" in output
+        assert "--max-bytes MAX_BYTES" in output
         assert "Found bootstraps" in output
         assert "{application,package,bootstrap}" in output
 
@@ -164,6 +175,99 @@ class MainTestCase(TestCase):
         assert (destination_path / "requirements-dev.txt").is_file()
         assert (destination_path / "tox.ini").is_file()
 
+    def test_build_bootstrap_application_discovers_once(self):
+        runner = BootstrapsRunner()
+        runner.set_cli_args(
+            [
+                "build",
+                f"--dest={self.destination_dir}",
+                "application",
+                "--name=test-app",
+                "--description=Test application description",
+            ]
+        )
+        with patch.object(
+            BaseBootstrapsOperation,
+            "find_bootstraps_entries",
+            wraps=BaseBootstrapsOperation.find_bootstraps_entries,
+        ) as mock_find_entries:
+            runner.run()
+
+        mock_find_entries.assert_called_once()
+        assert (Path() / self.destination_dir / "pyproject.toml").is_file()
+
+    def test_build_bootstrap_application_jobs(self):
+        main(
+            cli_args=[
+                "build",
+                f"--dest={self.destination_dir}",
+                "--jobs=4",
+                "application",
+                "--name=test-app",
+                "--description=Test application description",
+            ]
+        )
+
+        destination_path = Path() / self.destination_dir
+        assert (destination_path / "tests" / "__init__.py").is_file()
+        assert (destination_path / "pyproject.toml").is_file()
+        assert (destination_path / "tox.ini").is_file()
+
+    def test_build_bootstrap_wrong_jobs(self):
+        for value in ("0", "-1", "many"):
+            with (
+                self.assertRaises(SystemExit) as err_ctx,
+                contextlib.redirect_stderr(io.StringIO()),
+            ):
+                main(cli_args=["build", f"--jobs={value}", "application"])
+
+            assert err_ctx.exception.code == 2
+
+    def test_build_bootstrap_application_plan(self):
+        mock_stdout = io.StringIO()
+        with contextlib.redirect_stdout(mock_stdout):
+            main(
+                cli_args=[
+                    "build",
+                    f"--dest={self.destination_dir}",
+                    "--dry-run",
+                    "application",
+                    "--name=test-app",
+                    "--description=Test application description",
+                ]
+            )
+
+        destination_path = Path() / self.destination_dir
+        assert not destination_path.exists()
+
+        plan_path = Path() / f"{self.destination_dir}.json"
+        self.addCleanup(plan_path.unlink)
+        plan_path.write_text(mock_stdout.getvalue())
+
+        main(
+            cli_args=[
+                "build",
+                f"--dest={self.destination_dir}",
+                f"--apply-plan={plan_path}",
+            ]
+        )
+        assert (destination_path / "tests" / "__init__.py").is_file()
+        assert (destination_path / "pyproject.toml").is_file()
+        assert (
+            'name = "test-app"'
+            in (destination_path / "pyproject.toml").read_text()
+        )
+
+    def test_build_bootstrap_wrong_plan(self):
+        with (
+            self.assertRaises(SystemExit) as err_ctx,
+            contextlib.redirect_stderr(io.StringIO()) as mock_stderr,
+        ):
+            main(cli_args=["build", "--apply-plan=missed-plan.json"])
+
+        assert err_ctx.exception.code == 2
+        assert "Unable to read a build plan" in mock_stderr.getvalue()
+
     def test_build_bootstrap_bootstrap_help(self):
         mock_stdout = io.StringIO()
         with (
@@ -282,6 +386,48 @@ class MainTestCase(TestCase):
         assert (destination_path / "requirements-dev.txt").is_file()
         assert (destination_path / "tox.ini").is_file()
 
+    def test_build_batch_help(self):
+        mock_stdout = io.StringIO()
+        with (
+            self.assertRaises(SystemExit),
+            contextlib.redirect_stdout(mock_stdout),
+        ):
+            main(cli_args=["build-batch", "--help"])
+
+        output = mock_stdout.getvalue()
+        assert "usage: bootstrap build-batch [-h] --spec SPEC" in output
+        assert "Generates skeletons of many projects from a spec file" in output
+        assert "--jobs JOBS" in output
+
+    def test_build_batch(self):
+        spec_path = Path() / f"{self.destination_dir}.jsonl"
+        self.addCleanup(spec_path.unlink)
+        spec_path.write_text(
+            "\n".join(
+                json.dumps(
+                    {
+                        "bootstrap": "application",
+                        "dest": f"{self.destination_dir}/test-app-{index}",
+                        "args": {
+                            "name": f"test-app-{index}",
+                            "description": "Test application description",
+                        },
+                    }
+                )
+                for index in (1, 2)
+            )
+        )
+
+        mock_stdout = io.StringIO()
+        with contextlib.redirect_stdout(mock_stdout):
+            main(cli_args=["build-batch", f"--spec={spec_path}"])
+
+        output = mock_stdout.getvalue()
+        for index in (1, 2):
+            path = Path(self.destination_dir, f"test-app-{index}")
+            assert f"ok: application -> {path}" in output
+            assert (path / "pyproject.toml").is_file()
+
     def test_export_bootstrap_help(self):
         mock_stdout = io.StringIO()
         with (
@@ -309,6 +455,7 @@ class MainTestCase(TestCase):
         assert "usage: bootstrap export [-h]" in output
         assert "Exports a bootstrap by given name" in output
         assert "--dest DESTINATION_DIR" in output
+        assert "--link-mode {copy,hardlink,reflink,symlink}" in output
         assert "Found bootstraps" in output
         assert "{application,package,bootstrap}" in output
 
@@ -357,6 +504,21 @@ class MainTestCase(TestCase):
         assert (destination_path / "requirements-dev.txt").is_file()
         assert (destination_path / "tox.ini.tmpl").is_file()
 
+    def test_export_bootstrap_application_symlink(self):
+        main(
+            cli_args=[
+                "export",
+                f"--dest={self.destination_dir}",
+                "--link-mode=symlink",
+                "application",
+            ]
+        )
+
+        destination_path = Path() / self.destination_dir
+        assert (destination_path / "tests").is_dir()
+        assert (destination_path / "pyproject.toml.tmpl").is_symlink()
+        assert (destination_path / "requirements.txt").is_symlink()
+
     def test_export_bootstrap_bootstrap_help(self):
         mock_stdout = io.StringIO()
         with (
@@ -477,6 +639,7 @@ class MainTestCase(TestCase):
         assert "--name BOOTSTRAP_NAME" in output
         assert "--source SOURCE_PATH" in output
         assert "-y, --yes-upload" in output
+        assert "--jobs JOBS" in output
 
     def test_register_bootstrap(self):
         try:
@@ -0,0 +1,70 @@
+import io
+import os
+import socket
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_bootstrap.base import serving
+from py_bootstrap.scripts.client import BootstrapsClient
+
+
+class BootstrapsClientTestCase(TestCase):
+    tst_cls = BootstrapsClient
+
+    def test_is_forwarded(self):
+        with patch.dict(os.environ, {serving.SOCKET_ENV_NAME: "test.sock"}):
+            assert self.tst_cls(cli_args=["build", "test"]).is_forwarded
+            assert not self.tst_cls(cli_args=["register"]).is_forwarded
+            assert not self.tst_cls(cli_args=[]).is_forwarded
+            assert not self.tst_cls(
+                cli_args=["list", "--profile=test.pstats"]
+            ).is_forwarded
+        with patch.dict(os.environ, {serving.SOCKET_ENV_NAME: ""}):
+            assert not self.tst_cls(cli_args=["list"]).is_forwarded
+
+    def test_run_locally(self):
+        tst_obj = self.tst_cls(cli_args=["list"])
+        with (
+            TemporaryDirectory() as tmp_dir,
+            patch.dict(
+                os.environ,
+                {serving.SOCKET_ENV_NAME: str(Path(tmp_dir, "test.sock"))},
+            ),
+            patch("py_bootstrap.scripts.bootstrap.main") as mock_main,
+            patch("sys.stderr", io.StringIO()) as mock_stderr,
+        ):
+            assert tst_obj.run() == 0
+
+        mock_main.assert_called_once_with(cli_args=["list"])
+        assert "running locally" in mock_stderr.getvalue()
+
+    def test_forward(self):
+        tst_obj = self.tst_cls(cli_args=["list"])
+        client_socket, server_socket = socket.socketpair()
+        stdout = io.TextIOWrapper(io.BytesIO())
+        stderr = io.TextIOWrapper(io.BytesIO())
+        with client_socket, server_socket:
+            with server_socket.makefile("wb") as wfile:
+                serving.write_frame(
+                    stream=wfile,
+                    kind=serving.STDOUT_FRAME,
+                    data=b"test output\n",
+                )
+                serving.write_frame(
+                    stream=wfile, kind=serving.STDERR_FRAME, data=b"test error"
+                )
+                serving.write_exit_frame(stream=wfile, status=3)
+
+            with (
+                patch.object(sys, "stdout", stdout),
+                patch.object(sys, "stderr", stderr),
+            ):
+                assert tst_obj.forward(connection=client_socket) == 3
+
+            line = server_socket.makefile("rb").readline()
+        assert serving.load_request(line) == (["list"], os.getcwd())
+        assert stdout.buffer.getvalue() == b"test output\n"
+        assert stderr.buffer.getvalue() == b"test error"
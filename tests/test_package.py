@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import typing as t
 from unittest import TestCase
 
@@ -14,3 +16,28 @@ class PackageTestCase(TestCase):
         assert package.PY_VERSION
         assert package.AUTHOR
         assert package.AUTHOR_EMAIL
+
+    def test_lazy_subpackages(self):
+        # a fresh interpreter, modules of the current one are imported by
+        # other tests
+        script = (
+            "import sys\n"
+            "import py_bootstrap.files_processors as files_processors\n"
+            "import py_bootstrap.operations as operations\n"
+            "assert 'py_bootstrap.files_processors.base' not in sys.modules\n"
+            "assert 'py_bootstrap.operations.dispatcher' not in sys.modules\n"
+            "assert 'BootstrapArchive' in dir(files_processors)\n"
+            "assert 'BootstrapsDispatcher' in dir(operations)\n"
+            "assert files_processors.BootstrapArchive.suffix\n"
+            "assert 'py_bootstrap.files_processors.archive' in sys.modules\n"
+            "assert 'py_bootstrap.files_processors.asynchronous'"
+            " not in sys.modules\n"
+            "assert operations.BootstrapsDispatcher.cli_description\n"
+            "try:\n"
+            "    files_processors.Missed\n"
+            "except AttributeError:\n"
+            "    pass\n"
+            "else:\n"
+            "    raise AssertionError\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)